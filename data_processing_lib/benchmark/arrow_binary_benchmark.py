@@ -0,0 +1,107 @@
+"""
+Benchmark of the Arrow table to file path, comparing conversion of the encoded parquet to bytes
+(used originally) with passing the Arrow buffer to save_file directly. Every mode is executed in
+a separate process, so that its peak RSS is not affected by the other one.
+Usage:
+    python arrow_binary_benchmark.py --rows 2000000 --files 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_processing.data_access import DataAccessLocal
+from data_processing.utils import MB, TransformUtils
+
+
+def _create_table(rows: int) -> pa.Table:
+    rng = np.random.default_rng(seed=42)
+    # random content does not compress, keeping the encoded file large
+    contents = pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(64), rows, [None, pa.py_buffer(rng.bytes(64 * rows))]
+    )
+    return pa.table(
+        {"id": np.arange(rows), "score": rng.random(rows), "contents": contents}
+    )
+
+
+def _reset_peak_rss() -> None:
+    # Linux allows to reset the peak RSS, so that table creation is not included
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss() -> float:
+    # VmHWM is reset by _reset_peak_rss, ru_maxrss (KB on Linux) is a fallback
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _current_rss() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return _peak_rss()
+
+
+def _to_bytes(table: pa.Table) -> bytes:
+    writer = pa.BufferOutputStream()
+    pq.write_table(table=table, where=writer, compression="ZSTD")
+    return bytes(writer.getvalue())
+
+
+def _run(mode: str, rows: int, files: int, result: multiprocessing.Queue) -> None:
+    table = _create_table(rows)
+    _reset_peak_rss()
+    base_rss = _current_rss()
+    convert = _to_bytes if mode == "bytes" else TransformUtils.convert_arrow_to_binary
+    with tempfile.TemporaryDirectory() as folder:
+        data_access = DataAccessLocal()
+        size = 0
+        start = time.time()
+        for i in range(files):
+            data = convert(table)
+            size = len(data)
+            data_access.save_file(
+                path=os.path.join(folder, f"file_{i}.parquet"), data=data
+            )
+            del data
+        elapsed = time.time() - start
+    result.put((size, elapsed / files, _peak_rss() - base_rss))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="arrow to binary conversion benchmark")
+    parser.add_argument("--rows", type=int, default=1000000, help="rows per table")
+    parser.add_argument("--files", type=int, default=10, help="number of files to save")
+    args = parser.parse_args()
+    ctx = multiprocessing.get_context("spawn")
+    for mode in ["bytes", "buffer"]:
+        queue = ctx.Queue()
+        process = ctx.Process(target=_run, args=(mode, args.rows, args.files, queue))
+        process.start()
+        size, per_file, peak = queue.get()
+        process.join()
+        print(
+            f"{mode:8} file size {size / MB:8.2f} MB time per file {per_file:8.3f} sec "
+            f"peak RSS increase {peak:9.2f} MB"
+        )
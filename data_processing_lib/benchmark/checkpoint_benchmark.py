@@ -0,0 +1,105 @@
+"""
+Benchmark of the checkpoint reconciliation, comparing time and peak memory of the
+list based lookup (used originally), set based lookup and CheckpointReconciler.
+Usage:
+    python checkpoint_benchmark.py --n_files 10000000 --processed 0.5
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from data_processing.data_access.checkpoint_reconciler import CheckpointReconciler
+from data_processing.utils import TransformUtils
+
+
+INPUT = "bucket/data/input"
+OUTPUT = "bucket/data/output"
+BATCH = 1000
+
+
+def _batches(folder: str, n: int, ext: str) -> Any:
+    for start in range(0, n, BATCH):
+        yield [
+            {"name": f"{folder}/dir_{i % 100}/file_{i:09d}{ext}", "size": 1024}
+            for i in range(start, min(start + BATCH, n))
+        ]
+
+
+def _list_lookup(n_input: int, n_output: int) -> int:
+    processed = []
+    for batch in _batches(OUTPUT, n_output, ".parquet"):
+        processed.extend(
+            TransformUtils.get_file_extension(f["name"].replace(OUTPUT, INPUT))[0]
+            for f in batch
+        )
+    count = 0
+    for batch in _batches(INPUT, n_input, ".parquet"):
+        for f in batch:
+            if TransformUtils.get_file_extension(f["name"])[0] not in processed:
+                count += 1
+    return count
+
+
+def _set_lookup(n_input: int, n_output: int) -> int:
+    processed = set()
+    for batch in _batches(OUTPUT, n_output, ".parquet"):
+        processed.update(
+            TransformUtils.get_file_extension(f["name"].replace(OUTPUT, INPUT))[0]
+            for f in batch
+        )
+    count = 0
+    for batch in _batches(INPUT, n_input, ".parquet"):
+        for f in batch:
+            if TransformUtils.get_file_extension(f["name"])[0] not in processed:
+                count += 1
+    return count
+
+
+def _reconciler(n_input: int, n_output: int) -> int:
+    reconciler = CheckpointReconciler(input_folder=INPUT, output_folder=OUTPUT)
+    for batch in _batches(OUTPUT, n_output, ".parquet"):
+        reconciler.add_processed_files(batch)
+    reconciler.build()
+    count = 0
+    for batch in _batches(INPUT, n_input, ".parquet"):
+        count += len(reconciler.filter_files(batch))
+    return count
+
+
+def _measure(
+    name: str, func: Callable[[int, int], int], n_input: int, n_output: int
+) -> None:
+    tracemalloc.start()
+    start = time.time()
+    remaining = func(n_input, n_output)
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:12} input {n_input:>10} output {n_output:>10} remaining {remaining:>10} "
+        f"time {elapsed:8.3f} sec peak memory {peak / 1024 / 1024:9.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="checkpoint reconciliation benchmark")
+    parser.add_argument(
+        "--n_files", type=int, default=1000000, help="number of input files"
+    )
+    parser.add_argument(
+        "--processed", type=float, default=0.5, help="fraction of processed files"
+    )
+    parser.add_argument(
+        "--n_list",
+        type=int,
+        default=20000,
+        help="number of input files for the list based lookup",
+    )
+    args = parser.parse_args()
+    _measure("list", _list_lookup, args.n_list, int(args.n_list * args.processed))
+    _measure("set", _set_lookup, args.n_files, int(args.n_files * args.processed))
+    _measure(
+        "reconciler", _reconciler, args.n_files, int(args.n_files * args.processed)
+    )
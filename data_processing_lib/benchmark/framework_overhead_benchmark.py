@@ -0,0 +1,69 @@
+"""
+Benchmark of the framework overhead per file of the Python runtime. The NOOP transform (without sleep)
+is executed on generated files kept in memory (DataAccessMemory), so that the measured time excludes
+storage access and consists of the orchestration, parquet decoding/encoding and statistics costs.
+Usage:
+    python framework_overhead_benchmark.py --n_files 1000 --rows 100 --processors 1 4
+"""
+
+import argparse
+import sys
+import time
+
+from data_processing.examples.noop.python import NOOPPythonTransformConfiguration
+from data_processing.runtime.python import PythonTransformLauncher
+from data_processing.utils import ParamsUtils
+
+
+def _run(n_files: int, rows: int, doc_size: int, processors: int) -> float:
+    memory_conf = {
+        "input_folder": "input",
+        "output_folder": "output",
+        "n_files": n_files,
+        "rows": rows,
+        "doc_size": doc_size,
+        # outputs are not used, only their sizes are kept
+        "discard_output": True,
+    }
+    params = {
+        "data_memory_config": ParamsUtils.convert_to_ast(memory_conf),
+        "runtime_num_processors": processors,
+        "noop_sleep_sec": 0,
+    }
+    sys.argv = ParamsUtils.dict_to_req(d=params)
+    launcher = PythonTransformLauncher(
+        runtime_config=NOOPPythonTransformConfiguration()
+    )
+    start = time.time()
+    if launcher.launch() != 0:
+        raise RuntimeError("transform execution failed")
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="framework overhead benchmark")
+    parser.add_argument("--n_files", type=int, default=500, help="number of files")
+    parser.add_argument("--rows", type=int, default=100, help="rows per file")
+    parser.add_argument("--doc_size", type=int, default=1024, help="document size")
+    parser.add_argument(
+        "--processors",
+        type=int,
+        nargs="+",
+        default=[0, 2],
+        help="numbers of processors to use, 0 for processing in the orchestrator process",
+    )
+    args = parser.parse_args()
+    results = []
+    for processors in args.processors:
+        elapsed = _run(
+            n_files=args.n_files,
+            rows=args.rows,
+            doc_size=args.doc_size,
+            processors=processors,
+        )
+        results.append((processors, elapsed))
+    for processors, elapsed in results:
+        print(
+            f"processors {processors:3}: {args.n_files} files in {elapsed:7.2f} sec, "
+            f"{elapsed / args.n_files * 1000:7.3f} ms/file"
+        )
@@ -0,0 +1,93 @@
+"""
+Benchmark of the local files listing, comparing the rglob based listing (used originally), a serial
+scandir walk and the parallel walker of DataAccessLocal on a generated tree of empty files. On local
+disks folders are read from the page cache, so the benefit of parallel scanning shows on network file
+systems - use --folder pointing to the mounted volume there.
+Usage:
+    python local_listing_benchmark.py --n_files 1000000 --files_per_folder 1000 --folder /mnt/nfs/tmp
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from data_processing.data_access import DataAccessLocal
+
+
+def _create_tree(root: str, n_files: int, files_per_folder: int) -> None:
+    # two levels of folders, similar to partitioned data sets
+    for i in range(n_files):
+        folder = os.path.join(
+            root,
+            f"part_{i // (files_per_folder * 100):04d}",
+            f"dir_{i // files_per_folder:06d}",
+        )
+        if i % files_per_folder == 0:
+            os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"file_{i:09d}.parquet"), "wb"):
+            pass
+
+
+def _rglob(root: str) -> list[dict[str, Any]]:
+    files = []
+    for path in sorted(Path(root).rglob("*")):
+        if not path.is_dir():
+            files.append({"name": str(path), "size": path.stat().st_size})
+    return files
+
+
+def _scandir(root: str) -> list[dict[str, Any]]:
+    files = []
+
+    def _walk(folder: str) -> None:
+        with os.scandir(folder) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.is_dir():
+                _walk(entry.path)
+            else:
+                files.append({"name": entry.path, "size": entry.stat().st_size})
+
+    _walk(root)
+    return files
+
+
+def _walker(root: str) -> list[dict[str, Any]]:
+    files, _ = DataAccessLocal()._list_files_folder(path=root)
+    return files
+
+
+def _measure(name: str, root: str, func: Callable[[str], list], expected: int) -> None:
+    start = time.time()
+    files = func(root)
+    elapsed = time.time() - start
+    assert len(files) == expected
+    print(f"{name:16} {len(files)} files in {elapsed:8.2f} sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="local listing benchmark")
+    parser.add_argument("--n_files", type=int, default=1000000, help="number of files")
+    parser.add_argument(
+        "--files_per_folder", type=int, default=1000, help="number of files per folder"
+    )
+    parser.add_argument(
+        "--folder", type=str, default=None, help="folder to create the tree in"
+    )
+    args = parser.parse_args()
+    root = tempfile.mkdtemp(dir=args.folder)
+    try:
+        start = time.time()
+        _create_tree(
+            root=root, n_files=args.n_files, files_per_folder=args.files_per_folder
+        )
+        print(f"created {args.n_files} files in {time.time() - start:.2f} sec")
+        _measure("rglob", root, _rglob, args.n_files)
+        _measure("serial scandir", root, _scandir, args.n_files)
+        _measure("parallel walker", root, _walker, args.n_files)
+    finally:
+        shutil.rmtree(root)
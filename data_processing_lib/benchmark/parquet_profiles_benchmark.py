@@ -0,0 +1,93 @@
+"""
+Benchmark of the parquet writer profiles, comparing write and read throughput against the output size.
+By default a generated table of text documents is used, use --input to measure on a real parquet file.
+Usage:
+    python parquet_profiles_benchmark.py --rows 1000000 --input data.parquet
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_processing.utils import MB, TransformUtils
+
+
+def _create_table(rows: int) -> pa.Table:
+    # words with Zipf distribution of frequencies compress similarly to natural text
+    random.seed(42)
+    vocabulary = [
+        "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=random.randint(2, 10)))
+        for _ in range(20000)
+    ]
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    return pa.table(
+        {
+            "id": list(range(rows)),
+            "lang": random.choices(["en", "de", "fr", "ja"], k=rows),
+            "score": [random.random() for _ in range(rows)],
+            "contents": [
+                " ".join(
+                    random.choices(
+                        vocabulary, weights=weights, k=random.randint(50, 300)
+                    )
+                )
+                for _ in range(rows)
+            ],
+        }
+    )
+
+
+def _measure(name: str, table: pa.Table, options: dict[str, Any], repeat: int) -> None:
+    start = time.time()
+    for _ in range(repeat):
+        data = TransformUtils.convert_arrow_to_binary(
+            table=table, write_options=options
+        )
+    write = (time.time() - start) / repeat
+    start = time.time()
+    for _ in range(repeat):
+        TransformUtils.convert_binary_to_arrow(data=data)
+    read = (time.time() - start) / repeat
+    size = table.nbytes / MB
+    print(
+        f"{name:12} size {len(data) / MB:8.2f} MB ({table.nbytes / len(data):5.2f}x), "
+        f"write {size / write:8.1f} MB/sec, read {size / read:8.1f} MB/sec"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="parquet writer profiles benchmark")
+    parser.add_argument(
+        "--rows", type=int, default=200000, help="number of rows of the generated table"
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=None,
+        help="parquet file to use instead of the generated table",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+    if args.input is not None:
+        table = pq.read_table(args.input)
+    else:
+        table = _create_table(rows=args.rows)
+    print(f"table of {table.num_rows} rows, {table.nbytes / MB:.2f} MB in memory")
+    for profile in TransformUtils.PARQUET_PROFILES:
+        _measure(
+            name=profile,
+            table=table,
+            options=TransformUtils.get_parquet_write_options(profile=profile),
+            repeat=args.repeat,
+        )
+    # other codecs, that can be configured by parquet options
+    for name, options in [
+        ("gzip", {"compression": "gzip"}),
+        ("zstd 64K rg", {"compression": "zstd", "row_group_size": 65536}),
+        ("zstd 3", {"compression": "zstd", "compression_level": 3}),
+        ("none", {"compression": "none"}),
+    ]:
+        _measure(name=name, table=table, options=options, repeat=args.repeat)
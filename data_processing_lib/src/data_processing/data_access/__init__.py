@@ -1,13 +1,28 @@
 from data_processing.data_access.compute_test_data_location import (
     compute_data_location as compute_data_location,
 )
+from data_processing.data_access.s3_client_pool import S3ClientPool as S3ClientPool
 from data_processing.data_access.arrow_s3 import ArrowS3 as ArrowS3
+from data_processing.data_access.checkpoint_reconciler import (
+    CheckpointReconciler as CheckpointReconciler,
+)
+from data_processing.data_access.content_cache import ContentCache as ContentCache
+from data_processing.data_access.file_prefetcher import FilePrefetcher as FilePrefetcher
 from data_processing.data_access.data_access import DataAccess as DataAccess
 from data_processing.data_access.data_access_local import (
     DataAccessLocal as DataAccessLocal,
 )
 from data_processing.data_access.data_access_s3 import DataAccessS3 as DataAccessS3
 from data_processing.data_access.data_access_hf import DataAccessHF as DataAccessHF
+from data_processing.data_access.data_access_arrow_fs import (
+    DataAccessArrowFS as DataAccessArrowFS,
+)
+from data_processing.data_access.data_access_memory import (
+    DataAccessMemory as DataAccessMemory,
+)
+from data_processing.data_access.parquet_profiler import (
+    ParquetProfiler as ParquetProfiler,
+)
 from data_processing.data_access.data_access_factory import (
     DataAccessFactory as DataAccessFactory,
 )
@@ -1,8 +1,13 @@
-from typing import Any
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generator
 
-import boto3
-from botocore.config import Config
-from data_processing.utils import get_logger
+import pyarrow as pa
+from botocore.exceptions import ClientError
+from data_processing.data_access.output_stream import OutputStream
+from data_processing.data_access.s3_client_pool import S3ClientPool
+from data_processing.utils import MB, get_logger
 
 
 logger = get_logger(__name__)
@@ -15,6 +20,19 @@ class ArrowS3:
     proves to be significantly more reliable
     """
 
+    # names of the tuning options, that can be passed to the constructor through s3_options
+    OPTIONS = (
+        "list_workers",
+        "list_fan_out",
+        "read_part_size",
+        "read_concurrency",
+        "read_threshold",
+        "max_pool_connections",
+        "tcp_keepalive",
+        "connect_timeout",
+        "read_timeout",
+    )
+
     def __init__(
         self,
         access_key: str,
@@ -23,6 +41,15 @@ class ArrowS3:
         region: str = None,
         s3_retries: int = 10,
         s3_max_attempts=10,
+        list_workers: int = 1,
+        list_fan_out: int = 1,
+        read_part_size: int = 8 * MB,
+        read_concurrency: int = 1,
+        read_threshold: int = 64 * MB,
+        max_pool_connections: int = S3ClientPool.MAX_POOL_CONNECTIONS,
+        tcp_keepalive: bool = True,
+        connect_timeout: float = 60,
+        read_timeout: float = 60,
     ) -> None:
         """
         Initialization
@@ -32,20 +59,42 @@ class ArrowS3:
         :param region: s3 region
         :param s3_retries: number of S3 retries - default 10
         :param s3_max_attempts - boto s3 client internal retries - default 10
+        :param list_workers: number of threads used for files and folders listing. If greater than 1,
+               the prefix is sharded into sub-prefixes, which are listed in parallel - default 1
+        :param list_fan_out: number of prefix levels ("/" delimited) expanded to build the
+               sub-prefixes listed in parallel - default 1
+        :param read_part_size: size of the byte range fetched by a single request for ranged
+               reads - default 8MB
+        :param read_concurrency: number of byte ranges fetched concurrently. If greater than 1,
+               files are read using ranged requests - default 1
+        :param read_threshold: files larger than this size are read using concurrent ranged
+               requests, smaller ones using a single stream - default 64MB
+        :param max_pool_connections: maximum number of connections of the S3 client pool, it should
+               not be smaller than the number of concurrent requests (read_concurrency, list_workers
+               and async operations) - default 50
+        :param tcp_keepalive: flag to enable TCP keep-alive probes on pooled connections - default True
+        :param connect_timeout: timeout (in sec) of establishing a connection - default 60
+        :param read_timeout: timeout (in sec) of reading from a connection - default 60
         """
-        # Create boto S3 client
-        self.s3_client = boto3.client(
-            service_name="s3",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            endpoint_url=endpoint,
-            region_name=region,
-            config=Config(
-                retries={"max_attempts": s3_max_attempts, "mode": "standard"}
-            ),
+        # S3 client is shared by all instances of the process with the same configuration
+        self.s3_client = S3ClientPool.get_client(
+            access_key=access_key,
+            secret_key=secret_key,
+            endpoint=endpoint,
+            region=region,
+            max_attempts=s3_max_attempts,
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=tcp_keepalive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
         )
         self.retries = s3_retries
         self.s3_max_attempts = s3_max_attempts
+        self.list_workers = max(list_workers, 1)
+        self.list_fan_out = max(list_fan_out, 1)
+        self.read_part_size = read_part_size
+        self.read_concurrency = max(read_concurrency, 1)
+        self.read_threshold = read_threshold
 
     @staticmethod
     def _get_bucket_key(key: str) -> tuple[str, str]:
@@ -64,78 +113,446 @@ class ArrowS3:
         :param key: complete folder name
         :return: list of dictionaries, containing file names and length and number of retries
         """
+        files = []
+        retries = 0
+        for page, r in self.iterate_files(key=key):
+            files.extend(page)
+            retries += r
+        return files, retries
+
+    def iterate_files(
+        self, key: str
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Iterate over files in the folder (hierarchically going through all sub-folders) page by page.
+        Pages are only requested when the previous one is consumed, so stopping iteration stops the listing
+        :param key: complete folder name
+        :return: generator of pages, containing lists of dictionaries with file names and length
+                 and number of retries for every page
+        """
         bucket, prefix = self._get_bucket_key(key)
+        if self.list_workers > 1:
+            yield from self._iterate_files_parallel(bucket=bucket, prefix=prefix)
+            return
         # Use paginator here to get all the files rather than 1 page
         paginator = self.s3_client.get_paginator("list_objects_v2")
         pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for page in pages:
+            # For every page, get both file name and size
+            yield (
+                self._get_page_files(bucket=bucket, page=page),
+                page.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+            )
+
+    @staticmethod
+    def _get_page_files(bucket: str, page: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Get files (names and sizes) from the list_objects_v2 page
+        :param bucket: bucket name
+        :param page: page
+        :return: list of dictionaries, containing file names and length
+        """
+        return [
+            {"name": f"{bucket}/{obj['Key']}", "size": obj["Size"]}
+            for obj in page.get("Contents", [])
+        ]
+
+    def _list_prefix(
+        self, bucket: str, prefix: str
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        List all files for a given prefix
+        :param bucket: bucket name
+        :param prefix: prefix
+        :return: list of dictionaries, containing file names and length and number of retries
+        """
         files = []
         retries = 0
-        for page in pages:
-            # For every page
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            files.extend(self._get_page_files(bucket=bucket, page=page))
             retries += page.get("ResponseMetadata", {}).get("RetryAttempts", 0)
-            for obj in page.get("Contents", []):
-                # Get both file name and size
-                files.append({"name": f"{bucket}/{obj['Key']}", "size": obj["Size"]})
         return files, retries
 
-    def list_folders(self, key: str) -> tuple[list[str], int]:
+    def _list_prefix_level(
+        self, bucket: str, prefix: str
+    ) -> tuple[list[dict[str, Any]], list[str], int]:
         """
-        Get list of folders for folder
-        :param key: complete folder
-        :return: list of folders within a given folder and number of retries
-        """
-
-        def _get_sub_folders(bck: str, p: str) -> tuple[list[str], int]:
-            sub_folders = []
-            # use paginator
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            # use Delimiter to get folders just folders
-            page_iterator = paginator.paginate(Bucket=bck, Prefix=p, Delimiter="/")
-            internal_retries = 0
-            for page in page_iterator:
-                # for every page
-                internal_retries += page.get("ResponseMetadata", {}).get(
-                    "RetryAttempts", 0
-                )
-                for p in page.get("CommonPrefixes", []):
-                    sf = p["Prefix"]
-                    sub_folders.append(sf)
-                    # apply recursively
-                    sf, r = _get_sub_folders(bck=bck, p=sf)
-                    internal_retries += r
-                    sub_folders.extend(sf)
-            return sub_folders, internal_retries
+        List a single level of the prefix, using "/" delimiter
+        :param bucket: bucket name
+        :param prefix: prefix
+        :return: files at this level, sub-prefixes and number of retries
+        """
+        files = []
+        sub_prefixes = []
+        retries = 0
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/"):
+            files.extend(self._get_page_files(bucket=bucket, page=page))
+            sub_prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+            retries += page.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+        return files, sub_prefixes, retries
 
+    def _iterate_files_parallel(
+        self, bucket: str, prefix: str
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Iterate over files in the folder, listing its sub-prefixes in parallel. Sub-prefixes are
+        discovered by expanding list_fan_out levels of the prefix with "/" delimiter. Files located
+        above these levels are returned in the first batch, followed by a batch for every sub-prefix.
+        The amount of sub-prefixes listed ahead of the consumer is bounded by 2 * list_workers
+        :param bucket: bucket name
+        :param prefix: prefix
+        :return: generator of batches, containing lists of dictionaries with file names and length
+                 and number of retries for every batch
+        """
+        executor = ThreadPoolExecutor(max_workers=self.list_workers)
+        try:
+            # discover sub-prefixes
+            files = []
+            retries = 0
+            level = [prefix]
+            for _ in range(self.list_fan_out):
+                next_level = []
+                for f, subs, r in executor.map(
+                    lambda p: self._list_prefix_level(bucket=bucket, prefix=p), level
+                ):
+                    files.extend(f)
+                    next_level.extend(subs)
+                    retries += r
+                level = next_level
+                if len(level) == 0:
+                    break
+            logger.debug(
+                f"Listing {bucket}/{prefix} using {len(level)} sub-prefixes "
+                f"and {self.list_workers} threads"
+            )
+            yield files, retries
+            # list sub-prefixes in parallel, preserving their order
+            shards = iter(level)
+            pending = deque()
+            for shard in shards:
+                pending.append(executor.submit(self._list_prefix, bucket, shard))
+                if len(pending) >= 2 * self.list_workers:
+                    break
+            while len(pending) > 0:
+                result = pending.popleft().result()
+                shard = next(shards, None)
+                if shard is not None:
+                    pending.append(executor.submit(self._list_prefix, bucket, shard))
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def list_folders(self, key: str, max_depth: int = -1) -> tuple[list[str], int]:
+        """
+        Get list of folders for folder. The folder tree is crawled breadth first, listing all
+        folders of the same level in parallel using list_workers threads
+        :param key: complete folder
+        :param max_depth: maximum depth of the returned folders, 1 for direct sub folders only,
+               non positive value for no limit
+        :return: sorted list of folders within a given folder and number of retries. If a folder can not
+                 be listed in s3_retries attempts, IOError is raised, so that its sub folders are not
+                 silently missing in the result
+        """
         bucket, prefix = self._get_bucket_key(key)
-        subs, retries = _get_sub_folders(bck=bucket, p=prefix)
-        return [f"{bucket}/{f}" for f in subs], retries
+        folders = []
+        failed = []
+        retries = 0
+        with ThreadPoolExecutor(max_workers=self.list_workers) as executor:
+            level = [prefix]
+            depth = 0
+            while len(level) > 0 and (max_depth <= 0 or depth < max_depth):
+                next_level = []
+                for p, (sub_folders, r) in zip(
+                    level,
+                    executor.map(
+                        lambda p: self._get_sub_folders(bucket=bucket, prefix=p), level
+                    ),
+                ):
+                    retries += r
+                    if sub_folders is None:
+                        failed.append(f"{bucket}/{p}")
+                        continue
+                    next_level.extend(sub_folders)
+                folders.extend(next_level)
+                level = next_level
+                depth += 1
+        if len(failed) > 0:
+            raise IOError(
+                f"failed to list folders {failed} in {self.retries} attempts, {retries} retries"
+            )
+        return sorted(f"{bucket}/{f}" for f in folders), retries
+
+    def _get_sub_folders(self, bucket: str, prefix: str) -> tuple[list[str], int]:
+        """
+        Get direct sub folders of the folder
+        :param bucket: bucket name
+        :param prefix: folder prefix
+        :return: list of sub folder prefixes (None if the folder can't be listed) and number of retries
+        """
+        retries = 0
+        for n in range(self.retries):
+            try:
+                _, sub_folders, r = self._list_prefix_level(
+                    bucket=bucket, prefix=prefix
+                )
+                return sub_folders, retries + r
+            except Exception as e:
+                logger.error(
+                    f"failed to list folder {bucket}/{prefix}, exception {e}, attempt {n}"
+                )
+                retries += self.s3_max_attempts
+        logger.error(
+            f"failed to list folder {bucket}/{prefix} in {self.retries} attempts"
+        )
+        return None, retries
 
     def read_file(self, key: str) -> tuple[bytes, int]:
         """
-        Read s3 file by name
+        Read s3 file by name. If read_concurrency is greater than 1, large files are read
+        using concurrent ranged requests (see _read_file_ranges)
         :param key: complete path
         :return: byte array of file content or None if the file does not exist and a number of retries
         """
+        data, _, retries = self.read_file_versioned(key=key)
+        return data, retries
+
+    def read_file_versioned(self, key: str) -> tuple[bytes, str, int]:
+        """
+        Read s3 file by name together with the version (ETag) of the content, returned by the
+        read requests themselves, so that the version always matches the content
+        :param key: complete path
+        :return: byte array of file content or None if the file does not exist, ETag of the content
+                 and a number of retries
+        """
         bucket, prefix = self._get_bucket_key(key)
+        if self.read_concurrency > 1:
+            return self._read_file_ranges(key=key, bucket=bucket, prefix=prefix)
         retries = 0
         for n in range(self.retries):
             try:
                 obj = self.s3_client.get_object(Bucket=bucket, Key=prefix)
                 retries += obj.get("ResponseMetadata", {}).get("RetryAttempts", 0)
-                return obj["Body"].read(), retries
+                return obj["Body"].read(), obj.get("ETag", None), retries
             except Exception as e:
                 logger.error(f"failed to read file {key}, exception {e}, attempt {n}")
                 retries += self.s3_max_attempts
         logger.error(
             f"failed to read file {key} in {self.retries} attempts. Skipping it"
         )
+        return None, None, retries
+
+    def get_file_version(self, key: str) -> tuple[str, int]:
+        """
+        Get version of s3 file, without reading it
+        :param key: complete path
+        :return: ETag of the file or None if the file does not exist and a number of retries
+        """
+        obj, retries = self._head_object(key=key)
+        if obj is None:
+            return None, retries
+        return obj["ETag"], retries
+
+    def get_file_size(self, key: str) -> tuple[int, int]:
+        """
+        Get size of s3 file, without reading it
+        :param key: complete path
+        :return: size of the file or None if the file does not exist and a number of retries
+        """
+        obj, retries = self._head_object(key=key)
+        if obj is None:
+            return None, retries
+        return obj["ContentLength"], retries
+
+    def _head_object(self, key: str) -> tuple[dict[str, Any], int]:
+        """
+        Get metadata of s3 file
+        :param key: complete path
+        :return: HEAD response or None if the file does not exist and a number of retries
+        """
+        bucket, prefix = self._get_bucket_key(key)
+        retries = 0
+        for n in range(self.retries):
+            try:
+                obj = self.s3_client.head_object(Bucket=bucket, Key=prefix)
+                retries += obj.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                return obj, retries
+            except Exception as e:
+                logger.error(
+                    f"failed to get metadata of file {key}, exception {e}, attempt {n}"
+                )
+                retries += self.s3_max_attempts
+        logger.error(f"failed to get metadata of file {key} in {self.retries} attempts")
+        return None, retries
+
+    def open_file(self, key: str) -> tuple[Any, int]:
+        """
+        Open s3 file for random access reading. Only the byte ranges requested by the reader are fetched
+        :param key: complete path
+        :return: seekable binary file object or None if the file does not exist and a number of retries
+        """
+        bucket, prefix = self._get_bucket_key(key)
+        retries = 0
+        for n in range(self.retries):
+            try:
+                obj = self.s3_client.head_object(Bucket=bucket, Key=prefix)
+                retries += obj.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                return (
+                    S3RangeFile(s3=self, key=key, size=obj["ContentLength"]),
+                    retries,
+                )
+            except Exception as e:
+                logger.error(f"failed to open file {key}, exception {e}, attempt {n}")
+                retries += self.s3_max_attempts
+        logger.error(f"failed to open file {key} in {self.retries} attempts")
+        return None, retries
+
+    def open_stream(self, key: str) -> tuple[Any, int]:
+        """
+        Open s3 file for sequential reading. The whole object is fetched by a single GET request,
+        which body is read incrementally. Failures while reading the body are not retried
+        :param key: complete path
+        :return: binary stream or None if the file does not exist and a number of retries
+        """
+        bucket, prefix = self._get_bucket_key(key)
+        retries = 0
+        for n in range(self.retries):
+            try:
+                obj = self.s3_client.get_object(Bucket=bucket, Key=prefix)
+                retries += obj.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                return obj["Body"], retries
+            except Exception as e:
+                logger.error(f"failed to open file {key}, exception {e}, attempt {n}")
+                retries += self.s3_max_attempts
+        logger.error(f"failed to open file {key} in {self.retries} attempts")
         return None, retries
 
+    def open_output_stream(self, key: str) -> tuple[Any, int]:
+        """
+        Open s3 file for sequential writing by a multipart upload (see S3OutputStream)
+        :param key: complete path
+        :return: output stream and number of retries (always 0, requests are sent by writes)
+        """
+        return S3OutputStream(s3=self, key=key), 0
+
+    def _read_range(
+        self,
+        key: str,
+        bucket: str,
+        prefix: str,
+        start: int,
+        end: int,
+        version: str = None,
+    ) -> tuple[bytes, int, str, int]:
+        """
+        Read a byte range of s3 file, retrying the same way as read_file
+        :param key: complete path
+        :param bucket: bucket name
+        :param prefix: file prefix
+        :param start: first byte of the range
+        :param end: last byte of the range (inclusive)
+        :param version: ETag the file has to match, so that ranges of different versions are never mixed.
+                        None for any version
+        :return: content of the range or None in the case of failure, total size of the file,
+                 ETag of the file and a number of retries
+        """
+        retries = 0
+        condition = {} if version is None else {"IfMatch": version}
+        for n in range(self.retries):
+            try:
+                obj = self.s3_client.get_object(
+                    Bucket=bucket, Key=prefix, Range=f"bytes={start}-{end}", **condition
+                )
+                retries += obj.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                # content range has a form bytes start-end/size
+                size = int(obj["ContentRange"].split("/")[-1])
+                return obj["Body"].read(), size, obj.get("ETag", None), retries
+            except ClientError as e:
+                code = e.response["Error"]["Code"]
+                if start == 0 and code == "InvalidRange":
+                    # empty file
+                    return b"", 0, None, retries
+                if code == "PreconditionFailed":
+                    # file was modified, retries would fail the same way
+                    logger.error(f"file {key} was modified while reading it")
+                    return None, 0, None, retries
+                logger.error(
+                    f"failed to read range {start}-{end} of file {key}, exception {e}, attempt {n}"
+                )
+                retries += self.s3_max_attempts
+            except Exception as e:
+                logger.error(
+                    f"failed to read range {start}-{end} of file {key}, exception {e}, attempt {n}"
+                )
+                retries += self.s3_max_attempts
+        logger.error(
+            f"failed to read range {start}-{end} of file {key} in {self.retries} attempts"
+        )
+        return None, 0, None, retries
+
+    def _read_file_ranges(
+        self, key: str, bucket: str, prefix: str
+    ) -> tuple[bytes, str, int]:
+        """
+        Read s3 file using ranged requests. The first request fetches read_threshold bytes and
+        the file size, so files up to read_threshold are read by this single request. The rest of
+        larger files is split into read_part_size ranges fetched concurrently by read_concurrency
+        threads into one preallocated buffer. In this case the content is returned as a bytearray,
+        to avoid copying the buffer. The following requests have to match the ETag returned by the
+        first one, so the content is never assembled from different versions of the file
+        :param key: complete path
+        :param bucket: bucket name
+        :param prefix: file prefix
+        :return: byte array of file content or None if the file can't be read, ETag of the content
+                 and a number of retries
+        """
+        first, size, version, retries = self._read_range(
+            key=key,
+            bucket=bucket,
+            prefix=prefix,
+            start=0,
+            end=max(self.read_threshold, self.read_part_size) - 1,
+        )
+        if first is None or len(first) >= size:
+            # failure or the whole file is read
+            return first, version, retries
+        buffer = bytearray(size)
+        buffer[: len(first)] = first
+
+        def _read_part(start: int) -> tuple[bool, int]:
+            end = min(start + self.read_part_size, size) - 1
+            data, _, _, part_retries = self._read_range(
+                key=key,
+                bucket=bucket,
+                prefix=prefix,
+                start=start,
+                end=end,
+                version=version,
+            )
+            if data is None:
+                return False, part_retries
+            buffer[start : start + len(data)] = data
+            return True, part_retries
+
+        success = True
+        with ThreadPoolExecutor(max_workers=self.read_concurrency) as executor:
+            for ok, r in executor.map(
+                _read_part, range(len(first), size, self.read_part_size)
+            ):
+                success = success and ok
+                retries += r
+        if not success:
+            logger.error(f"failed to read file {key}. Skipping it")
+            return None, None, retries
+        return buffer, version, retries
+
     def save_file(self, key: str, data: bytes) -> tuple[dict[str, Any], int]:
         """
         Save file to S3
         :param key: complete path
-        :param data: byte array of the file content
+        :param data: byte array of the file content. Other bytes-like objects (pa.Buffer, memoryview)
+                     are uploaded through a zero-copy reader, without converting them to bytes
         :return: dictionary as
         defined https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/put_object.html
         in the case of failure dict is None and the number of retries
@@ -144,7 +561,13 @@ class ArrowS3:
         retries = 0
         for n in range(self.retries):
             try:
-                res = self.s3_client.put_object(Bucket=bucket, Key=prefix, Body=data)
+                if isinstance(data, (bytes, bytearray)):
+                    body = data
+                else:
+                    # boto3 only accepts bytes or file objects. Reader is created per attempt,
+                    # as the upload moves its position
+                    body = pa.BufferReader(data)
+                res = self.s3_client.put_object(Bucket=bucket, Key=prefix, Body=body)
                 retries += res.get("ResponseMetadata", {}).get("RetryAttempts", 0)
                 return res, retries
             except Exception as e:
@@ -195,3 +618,179 @@ class ArrowS3:
                 logger.error(f"failed to copy file {source} to {dest}, exception {e}")
                 retries += self.s3_max_attempts
         return retries
+
+
+class S3RangeFile(io.RawIOBase):
+    """
+    Read only, seekable file object over an S3 object. Every read fetches just the requested byte
+    range, so that readers like pq.ParquetFile can read the footer and the required column chunks
+    without downloading the whole object. Retries of the range requests are accumulated in retries
+    """
+
+    def __init__(self, s3: ArrowS3, key: str, size: int):
+        """
+        Initialization
+        :param s3: ArrowS3 used for range requests
+        :param key: complete path
+        :param size: object size
+        """
+        super().__init__()
+        self.s3 = s3
+        self.key = key
+        self.bucket, self.prefix = s3._get_bucket_key(key)
+        self.size = size
+        self.position = 0
+        self.retries = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence {whence}")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self.position = position
+        return self.position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self.position
+        return self._read(length=size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._read(length=len(buffer))
+        memoryview(buffer).cast("B")[: len(data)] = data
+        return len(data)
+
+    def _read(self, length: int) -> bytes:
+        """
+        Read up to length bytes from the current position with a single range request
+        :param length: number of bytes
+        :return: data
+        """
+        length = min(length, self.size - self.position)
+        if length <= 0:
+            return b""
+        data, _, _, retries = self.s3._read_range(
+            key=self.key,
+            bucket=self.bucket,
+            prefix=self.prefix,
+            start=self.position,
+            end=self.position + length - 1,
+        )
+        self.retries += retries
+        if data is None:
+            raise IOError(
+                f"failed to read range {self.position}-{self.position + length - 1} of file {self.key}"
+            )
+        self.position += len(data)
+        return data
+
+
+class S3OutputStream(OutputStream):
+    """
+    Output stream of an S3 object. Content is uploaded as parts of a multipart upload, as soon as a part
+    is filled, so only a single part is kept in memory. Objects smaller than a part are uploaded by a
+    single request. The object is created only when the upload is completed by close
+    """
+
+    # size of the uploaded parts (S3 requires at least 5MB for all parts but the last one)
+    PART_SIZE = 8 * MB
+
+    def __init__(self, s3: ArrowS3, key: str, part_size: int = PART_SIZE):
+        """
+        Initialization
+        :param s3: ArrowS3 used for uploads
+        :param key: complete path
+        :param part_size: size of the uploaded parts
+        """
+        super().__init__(path=key)
+        self.s3 = s3
+        self.bucket, self.prefix = s3._get_bucket_key(key)
+        self.part_size = max(part_size, 5 * MB)
+        self.buffer = bytearray()
+        self.upload_id = None
+        self.parts = []
+
+    def _write(self, data: memoryview) -> None:
+        self.buffer += data
+        while len(self.buffer) >= self.part_size:
+            part = bytes(self.buffer[: self.part_size])
+            del self.buffer[: self.part_size]
+            self._upload_part(part=part)
+
+    def _complete(self) -> dict[str, Any]:
+        if self.upload_id is None:
+            # small object
+            res, retries = self.s3.save_file(key=self.path, data=bytes(self.buffer))
+            self.retries += retries
+            self.buffer = bytearray()
+            if res is None:
+                return None
+            return {"name": self.path, "size": self.size}
+        if len(self.buffer) > 0:
+            self._upload_part(part=bytes(self.buffer))
+            self.buffer = bytearray()
+        self._request(
+            operation="complete_multipart_upload",
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
+        return {"name": self.path, "size": self.size}
+
+    def _abort(self) -> None:
+        self.buffer = bytearray()
+        if self.upload_id is not None:
+            self._request(operation="abort_multipart_upload", UploadId=self.upload_id)
+
+    def _upload_part(self, part: bytes) -> None:
+        """
+        Upload a part, starting the multipart upload with the first one
+        :param part: part content
+        :return: None
+        """
+        if self.upload_id is None:
+            res = self._request(operation="create_multipart_upload")
+            self.upload_id = res["UploadId"]
+        number = len(self.parts) + 1
+        res = self._request(
+            operation="upload_part",
+            UploadId=self.upload_id,
+            PartNumber=number,
+            Body=part,
+        )
+        self.parts.append({"ETag": res["ETag"], "PartNumber": number})
+
+    def _request(self, operation: str, **kwargs) -> dict[str, Any]:
+        """
+        Send a request of the upload, retrying it on failures
+        :param operation: name of the S3 client method
+        :param kwargs: request parameters, besides bucket and key
+        :return: response
+        """
+        for n in range(self.s3.retries):
+            try:
+                res = getattr(self.s3.s3_client, operation)(
+                    Bucket=self.bucket, Key=self.prefix, **kwargs
+                )
+                self.retries += res.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                return res
+            except Exception as e:
+                logger.error(
+                    f"failed {operation} of file {self.path}, exception {e}, attempt {n}"
+                )
+                self.retries += self.s3.s3_max_attempts
+        raise IOError(f"failed {operation} of file {self.path}")
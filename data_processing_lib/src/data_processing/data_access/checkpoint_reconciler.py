@@ -0,0 +1,121 @@
+from array import array
+from typing import Any
+
+import mmh3
+import numpy as np
+from data_processing.utils import RANDOM_SEED, TransformUtils, get_logger
+
+
+logger = get_logger(__name__)
+
+# hash of the base name - two independent 64-bit halves of 128-bit murmur hash
+_HASH_TYPE = np.dtype([("primary", np.uint64), ("check", np.uint64)])
+
+
+class CheckpointReconciler:
+    """
+    Class reconciling input files with the already processed (output) ones for checkpointing.
+    Instead of keeping the names of processed files, it keeps a sorted array of 128-bit hashes of
+    their base names (16 bytes per file) and matches input files against it in vectorized batches.
+    This allows to reconcile tens of millions of files with bounded memory, while both listings
+    are streamed. Files are matched by the primary 64-bit half of the hash and every match is checked
+    by the second, independent half. Files matching only the primary half are hash collisions - they
+    are processed and counted in collisions. A false match (both halves colliding) for 10M input and
+    10M output files has the probability of about 3e-25.
+    """
+
+    def __init__(self, input_folder: str, output_folder: str):
+        """
+        Initialization
+        :param input_folder: input folder, removed from input file names before matching
+        :param output_folder: output folder, removed from output file names before matching
+        """
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        # primary and check hashes, interleaved
+        self.processed_hashes = array("Q")
+        self.processed = None
+        self.skipped = 0
+        self.collisions = 0
+
+    @staticmethod
+    def _base_name(name: str, folder: str) -> str:
+        """
+        Get file name relative to the folder and without extension. In the case of binary transforms,
+        an extension can be different, so just use the file names
+        :param name: file name
+        :param folder: folder
+        :return: base name
+        """
+        if folder is not None and name.startswith(folder):
+            name = name[len(folder) :]
+        return TransformUtils.get_file_extension(name.lstrip("/"))[0]
+
+    @staticmethod
+    def _hash(name: str) -> tuple[int, int]:
+        """
+        Compute 128-bit hash of the name
+        :param name: name
+        :return: primary and check 64-bit halves of the hash
+        """
+        return mmh3.hash64(name, seed=RANDOM_SEED, signed=False)
+
+    def add_processed_files(self, files: list[dict[str, Any]]) -> None:
+        """
+        Add a batch of output files
+        :param files: list of dictionaries, containing file names and sizes
+        :return: None
+        """
+        for file in files:
+            self.processed_hashes.extend(
+                self._hash(self._base_name(file["name"], self.output_folder))
+            )
+
+    def build(self) -> None:
+        """
+        Build sorted array of processed files hashes. Has to be invoked after all output files
+        are added and before input files filtering
+        :return: None
+        """
+        # unique both sorts (by the primary hash) and removes duplicates (multiple outputs for
+        # the same input)
+        self.processed = np.unique(
+            np.frombuffer(self.processed_hashes, dtype=_HASH_TYPE)
+        )
+        self.processed_hashes = array("Q")
+
+    def filter_files(self, files: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Filter a batch of input files, removing the ones that were already processed
+        :param files: list of dictionaries, containing file names and sizes
+        :return: list of files that were not processed yet
+        """
+        if self.processed is None:
+            self.build()
+        if len(files) == 0 or len(self.processed) == 0:
+            return files
+        hashes = np.fromiter(
+            (
+                self._hash(self._base_name(file["name"], self.input_folder))
+                for file in files
+            ),
+            dtype=_HASH_TYPE,
+            count=len(files),
+        )
+        index = np.searchsorted(self.processed, hashes)
+        index[index == len(self.processed)] = 0
+        found = self.processed[index] == hashes
+        # matches of the primary hash only
+        primary = self.processed["primary"]
+        index = np.searchsorted(primary, hashes["primary"])
+        index[index == len(primary)] = 0
+        collisions = int(
+            np.count_nonzero((primary[index] == hashes["primary"]) & ~found)
+        )
+        if collisions > 0:
+            logger.warning(
+                f"Checkpointing found {collisions} hash collisions, processing the files"
+            )
+            self.collisions += collisions
+        self.skipped += int(np.count_nonzero(found))
+        return [file for file, f in zip(files, found) if not f]
@@ -0,0 +1,186 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+
+from data_processing.utils import GB, get_logger
+
+
+logger = get_logger(__name__)
+
+# extension of the files being written, that are not part of the cache yet
+TEMP_EXTENSION = ".tmp"
+# age (sec) of temporary files, after which they are considered abandoned by a failed writer
+TEMP_MAX_AGE = 3600
+
+
+class ContentCache:
+    """
+    Local disk cache of remote files content, that can be shared by all processes of a node.
+    Entries are keyed by the file path and its version (ETag, blob id or size), so a changed
+    remote file is never served from the cache. Every entry is a separate file in the cache folder.
+    Entries are written to a temporary file, that is atomically renamed, so concurrent writers
+    and readers never see partial content. Modification time of an entry is updated on every hit,
+    and the least recently used entries are evicted once the cache size exceeds its limit.
+    To avoid scanning the cache folder on every write, every instance keeps a running total of the
+    cache size (the size found by its last scan plus the size of its own writes) and scans the folder
+    only when the total exceeds the limit. Writes of other processes are accounted by their own scans,
+    so a cache shared by several processes can temporarily exceed the limit by the content written since
+    their last scans. Concurrent evictions can remove a bit more than required, but never a file being
+    read, as it stays accessible to the readers, which opened it.
+    """
+
+    def __init__(self, folder: str, max_bytes: int = 10 * GB):
+        """
+        Initialization
+        :param folder: cache folder, created if it does not exist
+        :param max_bytes: maximum size of the cached content
+        """
+        self.folder = folder
+        self.max_bytes = max_bytes
+        os.makedirs(folder, exist_ok=True)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        # cache size, as seen by the last scan of the folder and writes of this instance since then
+        self.size = self._scan()[1]
+
+    def _entry_path(self, path: str, version: str) -> str:
+        """
+        Get cache entry file for a file version
+        :param path: file path
+        :param version: file version
+        :return: cache entry file path
+        """
+        key = hashlib.sha256(f"{path}\n{version}".encode()).hexdigest()
+        return os.path.join(self.folder, key)
+
+    def get(self, path: str, version: str) -> bytes:
+        """
+        Get cached file content
+        :param path: file path
+        :param version: file version
+        :return: file content or None if it is not cached
+        """
+        entry = self._entry_path(path=path, version=version)
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+            # mark entry as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            # not cached or evicted meanwhile
+            data = None
+        except Exception as e:
+            logger.warning(f"Failed to read cached content of {path}: {e}")
+            data = None
+        with self.lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def put(self, path: str, version: str, data: bytes) -> None:
+        """
+        Add file content to the cache, evicting the least recently used entries if required.
+        Failures are logged, but do not affect the caller
+        :param path: file path
+        :param version: file version
+        :param data: file content (bytes-like object)
+        :return: None
+        """
+        if len(data) > self.max_bytes:
+            return
+        entry = self._entry_path(path=path, version=version)
+        temp = f"{entry}.{uuid.uuid4().hex}{TEMP_EXTENSION}"
+        try:
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, entry)
+        except Exception as e:
+            logger.warning(f"Failed to cache content of {path}: {e}")
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+        with self.lock:
+            self.size += len(data)
+            if self.size <= self.max_bytes:
+                return
+        self._evict()
+
+    def _scan(self) -> tuple[list[tuple[float, int, str]], int]:
+        """
+        Scan the cache folder, removing abandoned temporary files
+        :return: list of entries (modification time, size and path) and their total size
+        """
+        entries = []
+        size = 0
+        now = time.time()
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith(TEMP_EXTENSION):
+                    if now - stat.st_mtime > TEMP_MAX_AGE:
+                        self._remove(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                size += stat.st_size
+        return entries, size
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries, until the cache size is within the limit.
+        Removes abandoned temporary files as well
+        :return: None
+        """
+        entries, size = self._scan()
+        evicted = 0
+        if size > self.max_bytes:
+            for _, entry_size, entry_path in sorted(entries):
+                if self._remove(entry_path):
+                    evicted += 1
+                size -= entry_size
+                if size <= self.max_bytes:
+                    break
+        with self.lock:
+            self.size = size
+            self.evicted += evicted
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """
+        Remove cache file, that can be already removed by another process
+        :param path: file path
+        :return: True if the file was removed by this invocation
+        """
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache statistics accumulated since the previous invocation
+        :return: statistics dictionary
+        """
+        stats = {}
+        with self.lock:
+            if self.hits > 0:
+                stats["cache hits"] = self.hits
+            if self.misses > 0:
+                stats["cache misses"] = self.misses
+            if self.evicted > 0:
+                stats["cache evictions"] = self.evicted
+            self.hits = 0
+            self.misses = 0
+            self.evicted = 0
+        return stats
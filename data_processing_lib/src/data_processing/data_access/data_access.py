@@ -1,11 +1,30 @@
+import asyncio
 import random
-from typing import Any
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Generator
 
 
-from data_processing.utils import GB, KB, MB, TransformUtils, get_logger
+from data_processing.data_access.checkpoint_reconciler import CheckpointReconciler
+from data_processing.data_access.content_cache import ContentCache
+from data_processing.data_access.file_prefetcher import FilePrefetcher
+from data_processing.data_access.output_stream import BufferedOutputStream
+from data_processing.utils import (
+    GB,
+    KB,
+    MB,
+    CompressionUtils,
+    TransformUtils,
+    get_logger,
+)
 from typing_extensions import Self
 
 
+# maximum number of blocking data access operations in flight for the async API
+ASYNC_WORKERS = 32
+
+
 class DataAccess:
     """
     Base class for data access (interface), defining all the methods
@@ -18,6 +37,8 @@ class DataAccess:
         n_samples: int,
         files_to_use: list[str],
         files_to_checkpoint: list[str],
+        streaming_listing: bool = False,
+        content_cache: ContentCache = None,
     ):
         """
         Create data access class for folder based configuration
@@ -26,12 +47,24 @@ class DataAccess:
         :param n_samples: amount of files to randomly sample
         :param files_to_use: files extensions of files to include
         :param files_to_checkpoint: files extensions of checkpointed files
+        :param streaming_listing: flag to return files to process as they are listed
+        :param content_cache: local cache of the files content, used by remote data accesses
         """
         self.checkpoint = checkpoint
         self.m_files = m_files
         self.n_samples = n_samples
         self.files_to_use = files_to_use
         self.files_to_checkpoint = files_to_checkpoint
+        self.streaming_listing = streaming_listing
+        self.content_cache = content_cache
+        # number of input files skipped by the last checkpointing reconciliation
+        self.checkpoint_skipped = 0
+        # number of hash collisions (processed files) found by the last checkpointing reconciliation
+        self.checkpoint_collisions = 0
+        # number of retries accumulated by folders listing
+        self.folders_retries = 0
+        # executor running blocking operations for the async API, created on the first use
+        self.async_executor = None
         self.logger = get_logger(__name__)
         self.output_data_access = None
 
@@ -73,8 +106,8 @@ class DataAccess:
         """
         # Pick files to include
         if len(files) > n_samples:
-            # Pick files at random
-            files_set = [int(random.random() * len(files)) for _ in range(n_samples)]
+            # Pick distinct files at random
+            files_set = random.sample(range(len(files)), n_samples)
         else:
             # use all existing files
             files_set = range(len(files))
@@ -110,6 +143,47 @@ class DataAccess:
             return files, profile, retries
         return path_list, profile, retries
 
+    def iterate_files_to_process(self) -> Generator[tuple[list[str], int], None, None]:
+        """
+        Iterate over files to process. Unlike get_files_to_process, that builds the complete list of files
+        before returning it, this method returns files in batches as they are listed, so that processing
+        can start before the listing completes. Random sampling requires the complete list of files, so if
+        it is defined, all the files are returned as a single batch
+        :return: generator of batches of file names and the number of operation retries for every batch
+        """
+        if self.get_input_folder() is None:
+            self.logger.warning("Input folder is not defined, returning empty list")
+            return
+        if self.n_samples > 0:
+            files, _, retries = self.get_files_to_process()
+            yield files, retries
+            return
+        reconciler = None
+        retries = 0
+        if self._use_checkpoint():
+            reconciler, retries = self._get_checkpoint_reconciler(
+                output_path=self.get_output_folder()
+            )
+        self.checkpoint_skipped = 0
+        self.checkpoint_collisions = 0
+        i = 0
+        for files, r in self.iterate_files_folder(
+            path=self.get_input_folder(), files_to_use=self.files_to_use, cm_files=-1
+        ):
+            retries += r
+            if reconciler is not None:
+                files = reconciler.filter_files(files)
+                self.checkpoint_skipped = reconciler.skipped
+                self.checkpoint_collisions = reconciler.collisions
+            if self.m_files > 0:
+                files = files[: self.m_files - i]
+            i += len(files)
+            yield [file["name"] for file in files], retries
+            retries = 0
+            if i >= self.m_files > 0:
+                # stop listing as soon as we have enough files
+                return
+
     def get_files_folder(
         self,
         path: str,
@@ -126,27 +200,21 @@ class DataAccess:
         # Get files list.
         p_list = []
         total_input_file_size = 0
-        i = 0
-        files, retries = self._list_files_folder(path=path)
+        retries = 0
         max_file_size = 0
         min_file_size = MB * GB
-        for file in files:
-            if i >= cm_files > 0:
-                break
-            # Only use specified files
-            f_name = str(file["name"])
-            if files_to_use is not None:
-                name_extension = TransformUtils.get_file_extension(f_name)
-                if name_extension[1] not in files_to_use:
-                    continue
-            p_list.append(file)
-            size = file["size"]
-            total_input_file_size += size
-            if min_file_size > size:
-                min_file_size = size
-            if max_file_size < size:
-                max_file_size = size
-            i += 1
+        for files, r in self.iterate_files_folder(
+            path=path, files_to_use=files_to_use, cm_files=cm_files
+        ):
+            retries += r
+            for file in files:
+                p_list.append(file)
+                size = file["size"]
+                total_input_file_size += size
+                if min_file_size > size:
+                    min_file_size = size
+                if max_file_size < size:
+                    max_file_size = size
         return (
             p_list,
             {
@@ -157,6 +225,71 @@ class DataAccess:
             retries,
         )
 
+    def iterate_files_folder(
+        self,
+        path: str,
+        files_to_use: list[str],
+        cm_files: int,
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Support method to iterate over input files in batches, as they are listed
+        :param path: input path
+        :param files_to_use: file extensions to use
+        :param cm_files: overwrite for the m_files in the class
+        :return: generator of batches of files (names and sizes) and the number of retries for every batch
+        """
+        i = 0
+        for files, retries in self._iterate_files_folder(path=path):
+            batch = []
+            for file in files:
+                if i >= cm_files > 0:
+                    break
+                # Only use specified files
+                if files_to_use is not None:
+                    name_extension = TransformUtils.get_file_extension(
+                        str(file["name"])
+                    )
+                    if name_extension[1] not in files_to_use:
+                        continue
+                batch.append(file)
+                i += 1
+            yield batch, retries
+            if i >= cm_files > 0:
+                # stop listing as soon as we have enough files
+                return
+
+    def _use_checkpoint(self) -> bool:
+        """
+        Check whether checkpointing can be used
+        :return: True if checkpointing is requested and output folder is defined
+        """
+        if self.checkpoint and self.output_data_access.get_output_folder() is None:
+            self.logger.warning(
+                "Output folder is not defined, checkpoint will not be used"
+            )
+            return False
+        return self.checkpoint
+
+    def _get_checkpoint_reconciler(
+        self, output_path: str
+    ) -> tuple[CheckpointReconciler, int]:
+        """
+        Create checkpoint reconciler, populated with the files that already exist in the output path
+        :param output_path: output path
+        :return: reconciler and number of retries
+        """
+        reconciler = CheckpointReconciler(
+            input_folder=self.get_input_folder(), output_folder=self.get_output_folder()
+        )
+        retries = 0
+        for files, r in self.output_data_access.iterate_files_folder(
+            path=output_path, files_to_use=self.files_to_checkpoint, cm_files=-1
+        ):
+            retries += r
+            reconciler.add_processed_files(files)
+        reconciler.build()
+        return reconciler, retries
+
     def _get_input_files(
         self,
         input_path: str,
@@ -172,13 +305,7 @@ class DataAccess:
         :param cm_files: max files to get
         :return: tuple of file list, profile and number of retries
         """
-        checkpoint = self.checkpoint
-        if checkpoint and self.output_data_access.get_output_folder() is None:
-            self.logger.warning(
-                "Output folder is not defined, checkpoint will not be used"
-            )
-            checkpoint = False
-        if not checkpoint:
+        if not self._use_checkpoint():
             file_sizes, profile, retries = self.get_files_folder(
                 path=input_path,
                 files_to_use=self.files_to_use,
@@ -187,47 +314,30 @@ class DataAccess:
             files = [fs["name"] for fs in file_sizes]
             return files, profile, retries
 
-        pout_list, _, retries1 = self.output_data_access.get_files_folder(
-            path=output_path, files_to_use=self.files_to_checkpoint, cm_files=-1
-        )
-        output_base_names_ext = [
-            file["name"].replace(self.get_output_folder(), self.get_input_folder())
-            for file in pout_list
-        ]
-        # In the case of binary transforms, an extension can be different, so just use the file names.
-        # Also remove duplicates
-        output_base_names = list(
-            set(
-                [
-                    TransformUtils.get_file_extension(file)[0]
-                    for file in output_base_names_ext
-                ]
-            )
-        )
+        reconciler, retries = self._get_checkpoint_reconciler(output_path=output_path)
         p_list = []
         total_input_file_size = 0
-        i = 0
-        files, _, retries = self.get_files_folder(
+        for files, r in self.iterate_files_folder(
             path=input_path, files_to_use=self.files_to_use, cm_files=-1
-        )
-        retries += retries1
-        for file in files:
-            if i >= cm_files > 0:
-                break
-            f_name = file["name"]
-            name_extension = TransformUtils.get_file_extension(f_name)
-            if self.files_to_use is not None:
-                if name_extension[1] not in self.files_to_use:
-                    continue
-            if name_extension[0] not in output_base_names:
-                p_list.append(f_name)
+        ):
+            retries += r
+            for file in reconciler.filter_files(files):
+                if len(p_list) >= cm_files > 0:
+                    break
+                p_list.append(file["name"])
                 size = file["size"]
                 total_input_file_size += size
                 if min_file_size > size:
                     min_file_size = size
                 if max_file_size < size:
                     max_file_size = size
-                i += 1
+            if len(p_list) >= cm_files > 0:
+                break
+        self.checkpoint_skipped = reconciler.skipped
+        self.checkpoint_collisions = reconciler.collisions
+        self.logger.info(
+            f"Checkpointing skipped {reconciler.skipped} already processed files"
+        )
         return (
             p_list,
             {
@@ -246,6 +356,41 @@ class DataAccess:
         """
         raise NotImplementedError("Subclasses should implement this!")
 
+    def _iterate_files_folder(
+        self, path: str
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Iterate over files for a given folder and all sub folders. This default implementation returns
+        the complete listing as a single batch. Subclasses can overwrite it to return files in batches
+        as they are listed
+        :param path: path
+        :return: generator of batches of files (names and sizes) and the number of retries for every batch
+        """
+        yield self._list_files_folder(path=path)
+
+    def get_folders(self, path: str, max_depth: int = -1) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder. The retries are also accumulated in folders_retries,
+        so that they can be reported, when the folders are listed by the transform runtime
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, 1 for direct sub folders only,
+               non positive value for no limit
+        :return: list of folders and number of retries. Exception is raised if the folders can not
+                 be listed completely
+        """
+        folders, retries = self._list_folders(path=path, max_depth=max_depth)
+        self.folders_retries += retries
+        return folders, retries
+
+    def _list_folders(self, path: str, max_depth: int) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, non positive value for no limit
+        :return: list of folders and number of retries
+        """
+        raise NotImplementedError("Subclasses should implement this!")
+
     def get_file(self, path: str) -> tuple[bytes, int]:
         """
         Get file as a byte array
@@ -256,6 +401,163 @@ class DataAccess:
         """
         raise NotImplementedError("Subclasses should implement this!")
 
+    def get_file_size(self, path: str) -> tuple[int, int]:
+        """
+        Get size of the file, without reading it
+        :param path: file path
+        :return: size of the (compressed) file (None if it is not available) and number of operation retries
+        """
+        return None, 0
+
+    def _get_file_version(self, path: str) -> tuple[str, int]:
+        """
+        Get version of the file, identifying its content for the content cache
+        :param path: file path
+        :return: file version (None if it is not available) and number of operation retries
+        """
+        raise NotImplementedError(
+            "Subclasses using content cache should implement this!"
+        )
+
+    def _read_cached(
+        self,
+        path: str,
+        read: Callable[[str], tuple[bytes, int]],
+        read_versioned: Callable[[str], tuple[bytes, str, int]] = None,
+    ) -> tuple[bytes, int]:
+        """
+        Read file through the content cache, if it is configured. Content is cached together with
+        the file version, so that modified files are read again
+        :param path: file path
+        :param read: function reading the file content, returning it and the number of retries
+        :param read_versioned: optional function reading the file content together with its version,
+               returning the content, version and number of retries. If provided, the content read
+               on a cache miss is cached under the version returned by the read itself, so that a file
+               modified between the version check and the read is never cached under the old version
+        :return: bytes array of file content (None in the case of failure) and number of operation retries
+        """
+        if self.content_cache is None:
+            return read(path)
+        version, retries = self._get_file_version(path=path)
+        if version is None:
+            # content can not be validated, do not use cache
+            data, r = read(path)
+            return data, retries + r
+        data = self.content_cache.get(path=path, version=version)
+        if data is not None:
+            return data, retries
+        if read_versioned is not None:
+            data, version, r = read_versioned(path)
+        else:
+            data, r = read(path)
+        if data is not None and version is not None:
+            self.content_cache.put(path=path, version=version, data=data)
+        return data, retries + r
+
+    def _read_decompressed(
+        self,
+        path: str,
+        read: Callable[[str], tuple[bytes, int]],
+        stream: bool = False,
+        read_versioned: Callable[[str], tuple[bytes, str, int]] = None,
+    ) -> tuple[bytes, int]:
+        """
+        Read file through the content cache (see _read_cached), decompressing compressed
+        (gz, zst, lz4, bz2) files
+        :param path: file path
+        :param read: function reading the file content, returning it and the number of retries
+        :param stream: decompress compressed files while reading them (see _open_sequential), so that
+                       the compressed content is never fully in memory. Ignored, if the content
+                       cache is configured, as the cache stores compressed content
+        :param read_versioned: optional function reading the file content together with its version
+                       (see _read_cached)
+        :return: bytes array of file content (None in the case of failure) and number of operation retries
+        """
+        codec = CompressionUtils.get_codec(path)
+        if codec is None:
+            return self._read_cached(
+                path=path, read=read, read_versioned=read_versioned
+            )
+        if stream and self.content_cache is None:
+            source, retries = self._open_sequential(path=path)
+            if source is None:
+                return None, retries
+            with CompressionUtils.open_stream(source=source, codec=codec) as f:
+                data = f.read()
+            return data, retries + getattr(source, "retries", 0)
+        data, retries = self._read_cached(
+            path=path, read=read, read_versioned=read_versioned
+        )
+        if data is None:
+            return None, retries
+        return CompressionUtils.decompress(data=data, codec=codec), retries
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Get content cache statistics (hits, misses and evictions) since the previous invocation
+        :return: statistics dictionary, empty if the cache is not used
+        """
+        if self.content_cache is None:
+            return {}
+        return self.content_cache.get_stats()
+
+    def get_pool_stats(self) -> dict[str, int]:
+        """
+        Get statistics of the clients and connection pools shared by the data accesses of the process
+        since the previous invocation
+        :return: statistics dictionary, empty if the data access does not use shared clients
+        """
+        return {}
+
+    def open_file(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for random access reading, without reading its content. This allows readers (for
+        example pq.ParquetFile) to fetch only the parts of the file they need. Compressed files
+        are not decompressed (see open_stream). The caller is responsible for closing the file
+        :param path: file path
+        :return: seekable binary file object (None in the case of failure) and number of operation retries
+        """
+        raise NotImplementedError("Subclasses should implement this!")
+
+    def _open_sequential(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for sequential reading of its whole content, used by open_stream and streaming
+        decompression. By default, this is open_file. Remote data accesses can override it to fetch
+        the file by a single streaming request instead of a sequence of range requests
+        :param path: file path
+        :return: binary file object (None in the case of failure) and number of operation retries
+        """
+        return self.open_file(path=path)
+
+    def open_stream(self, path: str, buffer_size: int = 8 * MB) -> tuple[Any, int]:
+        """
+        Open file for sequential reading. Compressed (gz, zst, lz4, bz2) files are decompressed
+        incrementally while they are read, so neither the compressed nor the decompressed content
+        has to be fully in memory. The caller is responsible for closing the stream
+        :param path: file path
+        :param buffer_size: size of reads from the underlying file (see CompressionUtils.open_stream)
+        :return: binary stream (None in the case of failure) and number of operation retries
+        """
+        source, retries = self._open_sequential(path=path)
+        codec = CompressionUtils.get_codec(path)
+        if source is None or codec is None:
+            return source, retries
+        return (
+            CompressionUtils.open_stream(
+                source=source, codec=codec, buffer_size=buffer_size
+            ),
+            retries,
+        )
+
+    def flush_files(self) -> tuple[int, int]:
+        """
+        Complete writes buffered by save_file. Data accesses batching their writes (see DataAccessHF)
+        write all the files saved so far
+        :return: number of files, which failed to be written since the previous invocation and
+                 number of operation retries
+        """
+        return 0, 0
+
     def get_folder_files(
         self, path: str, extensions: list[str] = None, return_data: bool = True
     ) -> tuple[dict[str, bytes], int]:
@@ -291,6 +593,173 @@ class DataAccess:
             result[f_name] = b
         return result, retries
 
+    def iterate_folder_files(
+        self,
+        path: str,
+        extensions: list[str] = None,
+        depth: int = 4,
+        max_bytes: int = 256 * MB,
+    ) -> Generator[tuple[str, bytes, int], None, None]:
+        """
+        Iterate over content of the folder files. Unlike get_folder_files, the folder content is not
+        held in memory. Files are listed incrementally and up to depth following files are read
+        concurrently in the background, while the current one is processed. No new reads are started
+        while the size of the files read ahead exceeds max_bytes
+        :param path: folder path
+        :param extensions: a list of file extensions to include. If None, then all files from this and
+                           child ones will be returned
+        :param depth: maximum number of files read ahead
+        :param max_bytes: maximum size of the files read ahead, that were not consumed yet
+        :return: generator of file names, their content (None if the file can't be read) and number of retries
+        """
+        listing_retries = 0
+
+        def _files() -> Generator[dict[str, Any], None, None]:
+            nonlocal listing_retries
+            for files, r in self.iterate_files_folder(
+                path=path, files_to_use=extensions, cm_files=-1
+            ):
+                listing_retries += r
+                yield from files
+
+        # listing entries provide the sizes of files reserved by the prefetcher
+        prefetcher = FilePrefetcher(
+            data_access=self, files=_files(), depth=depth, max_bytes=max_bytes
+        )
+        try:
+            name = prefetcher.next_file()
+            while name is not None:
+                data, retries = prefetcher.get_file(path=name)
+                yield name, data, retries + listing_retries
+                listing_retries = 0
+                name = prefetcher.next_file()
+        finally:
+            prefetcher.close()
+
+    async def _run_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking data access operation without blocking the event loop. The operations are
+        executed by a thread pool, shared by all async methods of this data access, so up to
+        ASYNC_WORKERS requests can be in flight at the same time
+        :param func: blocking function
+        :param args: function positional parameters
+        :param kwargs: function keyword parameters
+        :return: function result
+        """
+        if self.async_executor is None:
+            self.async_executor = ThreadPoolExecutor(
+                max_workers=ASYNC_WORKERS, thread_name_prefix="data_access"
+            )
+            # threads are released, if the data access is not closed explicitly
+            weakref.finalize(self, self.async_executor.shutdown, wait=False)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.async_executor, partial(func, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """
+        Release threads of the async API. The data access can still be used after that, the threads
+        are created again on demand
+        :return: None
+        """
+        executor, self.async_executor = self.async_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # threads of the async API can not be pickled, they are created again on demand
+        state = self.__dict__.copy()
+        state["async_executor"] = None
+        return state
+
+    async def aget_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Async version of get_file
+        :param path: file path
+        :return: bytes array of file content and number of operation retries
+        """
+        return await self._run_async(self.get_file, path=path)
+
+    async def asave_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
+        """
+        Async version of save_file
+        :param path: file path
+        :param data: byte array. Implementations also accept other bytes-like objects (pa.Buffer,
+                     memoryview), returned by TransformUtils.convert_arrow_to_binary, without copying them
+        :return: a dictionary as returned by save_file or None in the case of failure and
+                 number of operation retries
+        """
+        return await self._run_async(self.save_file, path=path, data=data)
+
+    async def aget_files_folder(
+        self,
+        path: str,
+        files_to_use: list[str],
+        cm_files: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, float], int]:
+        """
+        Async version of get_files_folder
+        :param path: input path
+        :param files_to_use: file extensions to use
+        :param cm_files: overwrite for the m_files in the class
+        :return: tuple of file list, profile and number of retries
+        """
+        return await self._run_async(
+            self.get_files_folder,
+            path=path,
+            files_to_use=files_to_use,
+            cm_files=cm_files,
+        )
+
+    async def aiterate_files_folder(
+        self,
+        path: str,
+        files_to_use: list[str],
+        cm_files: int,
+    ) -> AsyncGenerator[tuple[list[dict[str, Any]], int], None]:
+        """
+        Async version of iterate_files_folder. Every batch is listed without blocking the event loop
+        :param path: input path
+        :param files_to_use: file extensions to use
+        :param cm_files: overwrite for the m_files in the class
+        :return: async generator of batches of files (names and sizes) and the number of retries
+                 for every batch
+        """
+        batches = self.iterate_files_folder(
+            path=path, files_to_use=files_to_use, cm_files=cm_files
+        )
+        while True:
+            batch = await self._run_async(next, batches, None)
+            if batch is None:
+                return
+            yield batch
+
+    async def aget_folder_files(
+        self, path: str, extensions: list[str] = None, return_data: bool = True
+    ) -> tuple[dict[str, bytes], int]:
+        """
+        Async version of get_folder_files. Files content is read concurrently
+        :param path: file path
+        :param extensions: a list of file extensions to include. If None, then all files from this and
+                           child ones will be returned
+        :param return_data: flag specifying whether the actual content of files is returned (True), or just
+                            directory is returned (False)
+        :return: A dictionary of file names/binary content will be returned
+        """
+        files, _, retries = await self.aget_files_folder(
+            path=path, files_to_use=extensions, cm_files=-1
+        )
+        names = [str(file["name"]) for file in files]
+        if not return_data:
+            return {name: None for name in names}, retries
+        result = {}
+        for name, (b, r) in zip(
+            names, await asyncio.gather(*[self.aget_file(path=name) for name in names])
+        ):
+            retries += r
+            result[name] = b
+        return result, retries
+
     def save_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
         """
         Save byte array
@@ -303,6 +772,17 @@ class DataAccess:
         """
         raise NotImplementedError("Subclasses should implement this!")
 
+    def open_output_stream(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for sequential writing (see OutputStream), so that large files can be written without
+        keeping their content in memory. The file is created by close of the stream (which sets its result)
+        and discarded by its abort. By default, the content is kept in memory and saved by save_file on close,
+        data accesses supporting incremental writes override it
+        :param path: file path
+        :return: output stream (None in the case of failure) and number of operation retries
+        """
+        return BufferedOutputStream(data_access=self, path=path), 0
+
     def get_output_location(self, path: str) -> str:
         """
         Get output location
@@ -350,7 +830,8 @@ class DataAccess:
         """
         Sample input data set to get average table size, average doc size, number of docs, etc.
         Note that here we are not reading all the input documents, but rather randomly pick
-        their subset. It gives more precise answer as subset grows, but it takes longer
+        their subset. It gives more precise answer as subset grows, but it takes longer.
+        For parquet data sets, ParquetProfiler gives exact numbers reading only the file footers
         :param n_samples: number of samples to use - default 10
         :return: a dictionary of the files profile:
             "max_file_size_MB",
@@ -0,0 +1,359 @@
+import json
+import os
+from typing import Any
+
+import pyarrow.fs as pafs
+from data_processing.data_access import DataAccess
+from data_processing.data_access.content_cache import ContentCache
+from data_processing.data_access.output_stream import OutputStream
+from data_processing.utils import CompressionUtils, MB, get_logger
+
+
+logger = get_logger(__name__)
+
+
+class DataAccessArrowFS(DataAccess):
+    """
+    Implementation of the Base Data access class based on pyarrow file systems (pyarrow.fs). Files are
+    read and written by native Arrow streams: open_file returns native
+    random access files, so that parquet readers prebuffer and coalesce the ranges they need using Arrow
+    IO threads, and S3 writes are multipart uploads performed in the background. The file system is
+    either given explicitly (any pyarrow.fs.FileSystem, for example SubTreeFileSystem) or created from
+    the input/output folders - S3FileSystem for s3:// folders and LocalFileSystem for local paths
+    """
+
+    def __init__(
+        self,
+        fs_config: dict[str, str] = None,
+        filesystem: pafs.FileSystem = None,
+        s3_credentials: dict[str, str] = None,
+        checkpoint: bool = False,
+        m_files: int = -1,
+        n_samples: int = -1,
+        files_to_use: list[str] = [".parquet"],
+        files_to_checkpoint: list[str] = [".parquet"],
+        streaming_listing: bool = False,
+        memory_map: bool = False,
+        content_cache: ContentCache = None,
+    ):
+        """
+        Create data access class for folder based configuration
+        :param fs_config: dictionary of path info - input and output folders. Folders are either s3://
+                          URIs or local paths (both folders have to use the same file system). If filesystem
+                          is given, they are paths of this file system
+        :param filesystem: file system to use, created from the folders if not given
+        :param s3_credentials: dictionary of S3 credentials, used for s3:// folders
+        :param checkpoint: flag to return only files that do not exist in the output directory
+        :param m_files: max amount of files to return
+        :param n_samples: amount of files to randomly sample
+        :param files_to_use: files extensions of files to include
+        :param files_to_checkpoint: files extensions of files to use for checkpointing
+        :param streaming_listing: flag to return files to process as they are listed
+        :param memory_map: flag to memory map files of the created local file system
+        :param content_cache: local cache of the files content, validated by their modification time and size
+        """
+        super().__init__(
+            checkpoint=checkpoint,
+            m_files=m_files,
+            n_samples=n_samples,
+            files_to_use=files_to_use,
+            files_to_checkpoint=files_to_checkpoint,
+            streaming_listing=streaming_listing,
+            content_cache=content_cache,
+        )
+        if fs_config is None:
+            fs_config = {"input_folder": None, "output_folder": None}
+        folders = [fs_config.get("input_folder"), fs_config.get("output_folder")]
+        if filesystem is None:
+            filesystem, folders = self._create_filesystem(
+                folders=folders, s3_credentials=s3_credentials, memory_map=memory_map
+            )
+        self.fs = filesystem
+        self.input_folder, self.output_folder = [
+            None if folder is None else folder.rstrip("/") for folder in folders
+        ]
+        logger.debug(f"Arrow fs {self.fs.type_name} input folder: {self.input_folder}")
+        logger.debug(
+            f"Arrow fs {self.fs.type_name} output folder: {self.output_folder}"
+        )
+
+    @staticmethod
+    def _create_filesystem(
+        folders: list[str], s3_credentials: dict[str, str], memory_map: bool
+    ) -> tuple[pafs.FileSystem, list[str]]:
+        """
+        Create file system for the folders
+        :param folders: folders (s3:// URIs or local paths), None for undefined ones
+        :param s3_credentials: dictionary of S3 credentials
+        :param memory_map: flag to memory map local files
+        :return: file system and folder paths within it
+        """
+        defined = [folder for folder in folders if folder is not None]
+        s3 = [folder.startswith("s3://") for folder in defined]
+        if not any(s3):
+            return pafs.LocalFileSystem(use_mmap=memory_map), [
+                None if folder is None else os.path.abspath(folder)
+                for folder in folders
+            ]
+        if not all(s3):
+            raise ValueError(
+                "input and output folders of Arrow fs data access have to use the same file system"
+            )
+        if (
+            s3_credentials is None
+            or s3_credentials.get("access_key", None) is None
+            or s3_credentials.get("secret_key", None) is None
+        ):
+            raise ValueError("S3 credentials are not defined")
+        filesystem = pafs.S3FileSystem(
+            access_key=s3_credentials.get("access_key"),
+            secret_key=s3_credentials.get("secret_key"),
+            endpoint_override=s3_credentials.get("url", None),
+            region=s3_credentials.get("region", None) or "us-east-1",
+        )
+        return filesystem, [
+            None if folder is None else folder[len("s3://") :] for folder in folders
+        ]
+
+    def get_output_folder(self) -> str:
+        """
+        Get output folder as a string
+        :return: output_folder
+        """
+        return self.output_folder
+
+    def get_input_folder(self) -> str:
+        """
+        Get input folder as a string
+        :return: input_folder
+        """
+        return self.input_folder
+
+    def _list_files_folder(self, path: str) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get files for a given folder and all sub folders
+        :param path: path
+        :return: List of files sorted by name and number of retries (always 0)
+        """
+        try:
+            infos = self.fs.get_file_info(
+                pafs.FileSelector(
+                    path.rstrip("/"), recursive=True, allow_not_found=True
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error listing files for path {path} - {e}")
+            return [], 0
+        files = [
+            {"name": info.path, "size": info.size}
+            for info in infos
+            if info.type == pafs.FileType.File
+        ]
+        return sorted(files, key=lambda f: f["name"]), 0
+
+    def _list_folders(self, path: str, max_depth: int) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, non positive value for no limit
+        :return: sorted list of folders and number of retries (always 0)
+        """
+        root = path.rstrip("/")
+        try:
+            infos = self.fs.get_file_info(
+                pafs.FileSelector(root, recursive=True, allow_not_found=True)
+            )
+        except Exception as e:
+            logger.error(f"Error listing folders for path {path} - {e}")
+            return [], 0
+        folders = [
+            info.path
+            for info in infos
+            if info.type == pafs.FileType.Directory
+            and (max_depth <= 0 or info.path[len(root) :].count("/") <= max_depth)
+        ]
+        return sorted(folders), 0
+
+    def get_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Get file as a byte array, decompressing compressed (gz, zst, lz4, bz2) files while they are
+        read by the native file system stream
+        :param path: file path
+        :return: file content (None in the case of failure) and number of retries (always 0)
+        """
+        try:
+            return self._read_decompressed(path=path, read=self._read_file, stream=True)
+        except Exception as e:
+            logger.error(f"Error reading file {path}: {e}")
+            return None, 0
+
+    def _read_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Read file content
+        :param path: file path
+        :return: file content and number of retries (always 0)
+        """
+        with self.fs.open_input_file(path) as f:
+            return f.read(), 0
+
+    def get_file_size(self, path: str) -> tuple[int, int]:
+        """
+        Get size of the file, without reading it
+        :param path: file path
+        :return: size of the file (None if it does not exist) and number of retries (always 0)
+        """
+        try:
+            info = self.fs.get_file_info(path)
+        except Exception as e:
+            logger.error(f"Error getting size of file {path}: {e}")
+            return None, 0
+        if info.type != pafs.FileType.File:
+            return None, 0
+        return info.size, 0
+
+    def _get_file_version(self, path: str) -> tuple[str, int]:
+        """
+        Get version of the file, identifying its content for the content cache
+        :param path: file path
+        :return: modification time and size of the file and number of retries (always 0)
+        """
+        info = self.fs.get_file_info(path)
+        if info.type != pafs.FileType.File:
+            return None, 0
+        return f"{info.mtime_ns} {info.size}", 0
+
+    def open_file(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for random access reading. The returned native Arrow file allows parquet readers
+        to prebuffer and coalesce reads of the required column chunks
+        :param path: file path
+        :return: seekable binary file object (None in the case of failure) and number of retries (always 0)
+        """
+        try:
+            return self.fs.open_input_file(path), 0
+        except Exception as e:
+            logger.error(f"Error opening file {path}: {e}")
+            return None, 0
+
+    def open_stream(self, path: str, buffer_size: int = 8 * MB) -> tuple[Any, int]:
+        """
+        Open file for sequential reading. Compressed (gz, zst, lz4, bz2) files are decompressed
+        incrementally by the native file system stream
+        :param path: file path
+        :param buffer_size: size of reads from the file
+        :return: binary stream (None in the case of failure) and number of retries (always 0)
+        """
+        try:
+            return self.fs.open_input_stream(
+                path,
+                compression=CompressionUtils.get_codec(path),
+                buffer_size=buffer_size if buffer_size > 0 else None,
+            ), 0
+        except Exception as e:
+            logger.error(f"Error opening file {path}: {e}")
+            return None, 0
+
+    def save_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
+        """
+        Save byte array to the file. Files with compressed extensions (gz, zst, lz4, bz2) are compressed
+        while they are written, so that get_file returns the saved data
+        :param path: file path
+        :param data: byte array or other bytes-like object (pa.Buffer, memoryview)
+        :return: a dictionary with "name" and "size" (of the not compressed data) keys (None in the case
+                 of failure) and number of retries (always 0)
+        """
+        try:
+            try:
+                self._write_file(path=path, data=data)
+            except FileNotFoundError:
+                # local file systems require the parent folder
+                self.fs.create_dir(path.rsplit("/", 1)[0], recursive=True)
+                self._write_file(path=path, data=data)
+            return {"name": path, "size": memoryview(data).nbytes}, 0
+        except Exception as e:
+            logger.error(f"Error saving bytes to file {path}: {e}")
+            return None, 0
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        """
+        Write file content
+        :param path: file path
+        :param data: file content
+        :return: None
+        """
+        with self.fs.open_output_stream(
+            path, compression=CompressionUtils.get_codec(path)
+        ) as f:
+            f.write(data)
+
+    def open_output_stream(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for sequential writing by a native output stream (see ArrowFSOutputStream)
+        :param path: file path
+        :return: output stream (None in the case of failure) and number of retries (always 0)
+        """
+        try:
+            try:
+                return ArrowFSOutputStream(fs=self.fs, path=path), 0
+            except FileNotFoundError:
+                # local file systems require the parent folder
+                self.fs.create_dir(path.rsplit("/", 1)[0], recursive=True)
+                return ArrowFSOutputStream(fs=self.fs, path=path), 0
+        except Exception as e:
+            logger.error(f"Error opening file {path} for writing: {e}")
+            return None, 0
+
+    def save_job_metadata(self, metadata: dict[str, Any]) -> tuple[dict[str, Any], int]:
+        """
+        Save metadata
+        :param metadata: a dictionary, containing the following keys:
+            "job details",
+            "job_input_params",
+            "execution_stats",
+            "job_output_stats"
+        two additional elements:
+            "source"
+            "target"
+        are filled by implementation
+        :return: a dictionary with "name" and "size" keys (None in the case of failure) and number of retries
+        """
+        if self.output_folder is None:
+            logger.error("Arrow fs output folder is not defined, can't save metadata")
+            return None, 0
+        metadata["source"] = {"name": self.input_folder, "type": "path"}
+        metadata["target"] = {"name": self.output_folder, "type": "path"}
+        return self.save_file(
+            path=f"{self.output_folder}/metadata.json",
+            data=json.dumps(metadata, indent=2).encode(),
+        )
+
+
+class ArrowFSOutputStream(OutputStream):
+    """
+    Output stream of a file, writing to a native file system stream (S3 multipart upload performed in
+    the background, compressed for compressed extensions). Native streams can not be aborted, so an
+    aborted file is completed and deleted
+    """
+
+    def __init__(self, fs: pafs.FileSystem, path: str):
+        """
+        Initialization
+        :param fs: file system
+        :param path: file path
+        """
+        super().__init__(path=path)
+        self.fs = fs
+        self.stream = fs.open_output_stream(
+            path, compression=CompressionUtils.get_codec(path)
+        )
+
+    def _write(self, data: memoryview) -> None:
+        self.stream.write(data)
+
+    def _complete(self) -> dict[str, Any]:
+        self.stream.close()
+        return {"name": self.path, "size": self.size}
+
+    def _abort(self) -> None:
+        self.stream.close()
+        self.fs.delete_file(self.path)
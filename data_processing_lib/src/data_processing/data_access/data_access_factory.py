@@ -1,15 +1,30 @@
 import argparse
+import os
 import uuid
 import ast
 from typing import Any, Union
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+
 from data_processing.data_access import (
+    ArrowS3,
+    ContentCache,
     DataAccess,
+    DataAccessArrowFS,
     DataAccessHF,
     DataAccessLocal,
+    DataAccessMemory,
     DataAccessS3,
 )
-from data_processing.utils import CLIArgumentProvider, ParamsUtils, str2bool, get_logger
+from data_processing.utils import (
+    GB,
+    CLIArgumentProvider,
+    ParamsUtils,
+    TransformUtils,
+    str2bool,
+    get_logger,
+)
 
 
 class DataAccessFactory(CLIArgumentProvider):
@@ -32,17 +47,27 @@ class DataAccessFactory(CLIArgumentProvider):
         """
         super().__init__()
         self.s3_cred = None
+        self.s3_options = {}
+        self.hf_options = {}
         self.checkpointing = False
         self.max_files = -1
         self.n_samples = -1
         self.files_to_use = []
         self.files_to_checkpoint = []
+        self.streaming_listing = False
+        self.memory_map = False
+        self.cache_folder = None
+        self.cache_max_bytes = 10 * GB
+        self.parquet_profile = "default"
+        self.parquet_options = {}
         self.cli_arg_prefix = cli_arg_prefix
         self.logger = get_logger(__name__ + str(uuid.uuid4()))
 
         self.s3_config = None
         self.local_config = None
         self.hf_config = None
+        self.arrow_fs_config = None
+        self.memory_config = None
 
     def add_input_params(self, parser: argparse.ArgumentParser) -> None:
         """
@@ -89,6 +114,46 @@ class DataAccessFactory(CLIArgumentProvider):
             help="AST string containing input/output paths.\n"
             + ParamsUtils.get_ast_help_text(help_example_dict),
         )
+        # s3 tuning options
+        help_example_dict = {
+            "list_workers": [
+                8,
+                "number of threads listing sub-prefixes and folders in parallel, 1 for serial listing",
+            ],
+            "list_fan_out": [
+                1,
+                "number of prefix levels expanded to build the sub-prefixes listed in parallel",
+            ],
+            "read_part_size": [
+                8388608,
+                "size of the byte range fetched by a single request",
+            ],
+            "read_concurrency": [
+                8,
+                "number of byte ranges fetched concurrently, 1 to read files as a single stream",
+            ],
+            "read_threshold": [
+                67108864,
+                "files larger than this size are read using concurrent ranged requests",
+            ],
+            "max_pool_connections": [
+                50,
+                "maximum number of connections of the S3 client pool, shared by the data accesses of the process",
+            ],
+            "tcp_keepalive": [
+                True,
+                "enable TCP keep-alive probes on pooled connections",
+            ],
+            "connect_timeout": [60, "timeout (in sec) of establishing a connection"],
+            "read_timeout": [60, "timeout (in sec) of reading from a connection"],
+        }
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}s3_options",
+            type=ast.literal_eval,
+            default=None,
+            help="AST string of optional S3 access tuning options.\n"
+            + ParamsUtils.get_ast_help_text(help_example_dict),
+        )
         # local config
         help_example_dict = {
             "input_folder": [
@@ -126,6 +191,86 @@ class DataAccessFactory(CLIArgumentProvider):
             help="ast string containing hf_token/input/output folders using hf fs.\n"
             + ParamsUtils.get_ast_help_text(help_example_dict),
         )
+        # arrow fs config
+        help_example_dict = {
+            "input_folder": [
+                "s3://your-input-bucket/path",
+                "Path to input folder of files to be processed, s3:// URI or local path",
+            ],
+            "output_folder": [
+                "s3://your-output-bucket/path",
+                "Path to output folder of processed files, s3:// URI or local path",
+            ],
+        }
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}arrow_fs_config",
+            type=ast.literal_eval,
+            default=None,
+            help="ast string containing input/output folders accessed by pyarrow file systems. "
+            "S3 folders use s3_cred credentials.\n"
+            + ParamsUtils.get_ast_help_text(help_example_dict),
+        )
+        # memory config
+        help_example_dict = {
+            "input_folder": ["input", "Name of the input folder in the memory store"],
+            "output_folder": [
+                "output",
+                "Name of the output folder in the memory store",
+            ],
+            "source_folder": [
+                "./test-data/input",
+                "Local folder, which files are loaded to the input folder",
+            ],
+            "n_files": [100, "Number of parquet files generated in the input folder"],
+            "rows": [1000, "Number of rows of the generated files"],
+            "doc_size": [1024, "Size of the documents of the generated files"],
+            "discard_output": [
+                False,
+                "Keep only names and sizes of saved files, discarding their content",
+            ],
+        }
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}memory_config",
+            type=ast.literal_eval,
+            default=None,
+            help="ast string containing input/output folders of the in memory store, shared by "
+            "the processes of the node, and its content. Used to benchmark transforms without storage.\n"
+            + ParamsUtils.get_ast_help_text(help_example_dict),
+        )
+        # hf tuning options
+        help_example_dict = {
+            "read_concurrency": [
+                8,
+                "number of files or byte ranges read concurrently, 1 to read files sequentially",
+            ],
+            "read_part_size": [
+                16777216,
+                "size of the byte range fetched by a single request",
+            ],
+            "read_threshold": [
+                67108864,
+                "files larger than this size are read using concurrent range requests",
+            ],
+            "commit_files": [
+                100,
+                "number of output files pushed by a single commit, 0 to commit every file separately",
+            ],
+            "commit_bytes": [
+                1073741824,
+                "size of the staged output files, above which they are committed",
+            ],
+            "commit_retries": [
+                3,
+                "number of attempts to push a commit of the staged files",
+            ],
+        }
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}hf_options",
+            type=ast.literal_eval,
+            default=None,
+            help="AST string of optional Hugging Face access tuning options.\n"
+            + ParamsUtils.get_ast_help_text(help_example_dict),
+        )
         parser.add_argument(
             f"--{self.cli_arg_prefix}max_files",
             type=int,
@@ -159,6 +304,55 @@ class DataAccessFactory(CLIArgumentProvider):
             default=-1,
             help="number of random input files to process",
         )
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}streaming_listing",
+            type=lambda x: bool(str2bool(x)),
+            default=False,
+            help="flag to start processing input files as they are listed, instead of waiting for the listing completion",
+        )
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}memory_map",
+            type=lambda x: bool(str2bool(x)),
+            default=False,
+            help="flag to read local (not compressed) files as zero-copy memory mapped buffers",
+        )
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}cache_folder",
+            type=str,
+            default=None,
+            help="local folder caching the content of S3 and Hugging Face files, can be shared by all "
+            "processes of a node. Not set (default) disables caching",
+        )
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}cache_max_bytes",
+            type=int,
+            default=10 * GB,
+            help="maximum size of the content cache, the least recently used files are evicted above it",
+        )
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}parquet_profile",
+            type=str,
+            default="default",
+            choices=list(TransformUtils.PARQUET_PROFILES),
+            help="profile of the parquet writer used for output tables: default (zstd), fast (snappy, CPU lean, "
+            "for intermediate data) or compact (smallest output with page index, for published data)",
+        )
+        help_example_dict = {
+            "compression": ["zstd", "compression codec"],
+            "compression_level": [3, "compression level"],
+            "write_page_index": [
+                True,
+                "write page index, allowing readers to skip pages",
+            ],
+            "row_group_size": [100000, "maximum number of rows of a row group"],
+        }
+        parser.add_argument(
+            f"--{self.cli_arg_prefix}parquet_options",
+            type=ast.literal_eval,
+            default=None,
+            help="AST string of pyarrow.parquet.ParquetWriter options, overriding the ones of the profile.\n"
+            + ParamsUtils.get_ast_help_text(help_example_dict),
+        )
 
     def apply_input_params(self, args: Union[dict, argparse.Namespace]) -> bool:
         """
@@ -175,8 +369,12 @@ class DataAccessFactory(CLIArgumentProvider):
             raise ValueError("args must be Namespace or dictionary")
         s3_cred = arg_dict.get(f"{self.cli_arg_prefix}s3_cred", None)
         s3_config = arg_dict.get(f"{self.cli_arg_prefix}s3_config", None)
+        s3_options = arg_dict.get(f"{self.cli_arg_prefix}s3_options", None)
         local_config = arg_dict.get(f"{self.cli_arg_prefix}local_config", None)
         hf_config = arg_dict.get(f"{self.cli_arg_prefix}hf_config", None)
+        hf_options = arg_dict.get(f"{self.cli_arg_prefix}hf_options", None)
+        arrow_fs_config = arg_dict.get(f"{self.cli_arg_prefix}arrow_fs_config", None)
+        memory_config = arg_dict.get(f"{self.cli_arg_prefix}memory_config", None)
         checkpointing = arg_dict.get(f"{self.cli_arg_prefix}checkpointing", False)
         max_files = arg_dict.get(f"{self.cli_arg_prefix}max_files", -1)
         n_samples = arg_dict.get(f"{self.cli_arg_prefix}num_samples", -1)
@@ -184,18 +382,64 @@ class DataAccessFactory(CLIArgumentProvider):
         files_to_checkpoint = arg_dict.get(
             f"{self.cli_arg_prefix}files_to_checkpoint", [".parquet"]
         )
+        streaming_listing = arg_dict.get(
+            f"{self.cli_arg_prefix}streaming_listing", False
+        )
+        memory_map = arg_dict.get(f"{self.cli_arg_prefix}memory_map", False)
+        cache_folder = arg_dict.get(f"{self.cli_arg_prefix}cache_folder", None)
+        cache_max_bytes = arg_dict.get(f"{self.cli_arg_prefix}cache_max_bytes", 10 * GB)
+        parquet_profile = arg_dict.get(
+            f"{self.cli_arg_prefix}parquet_profile", "default"
+        )
+        parquet_options = arg_dict.get(f"{self.cli_arg_prefix}parquet_options", None)
+        if cache_folder == "":
+            cache_folder = None
+        if cache_folder is not None and cache_max_bytes <= 0:
+            self.logger.error(
+                f"data factory {self.cli_arg_prefix} cache max bytes {cache_max_bytes} has to be positive"
+            )
+            return False
+        if s3_options is None:
+            s3_options = {}
+        if not self._validate_s3_options(s3_options=s3_options):
+            return False
+        self.s3_options = s3_options
+        if hf_options is None:
+            hf_options = {}
+        if not self._validate_hf_options(hf_options=hf_options):
+            return False
+        self.hf_options = hf_options
+        if parquet_options is None:
+            parquet_options = {}
+        if not self._validate_parquet_options(
+            parquet_profile=parquet_profile, parquet_options=parquet_options
+        ):
+            return False
+        self.parquet_profile = parquet_profile
+        self.parquet_options = parquet_options
         # check which configuration (S3 or Local) is specified
         s3_config_specified = 1 if s3_config is not None else 0
         local_config_specified = 1 if local_config is not None else 0
         hf_config_specified = 1 if hf_config is not None else 0
+        arrow_fs_config_specified = 1 if arrow_fs_config is not None else 0
+        memory_config_specified = 1 if memory_config is not None else 0
 
         # check that only one (S3 or Local) configuration is specified
-        if s3_config_specified + local_config_specified + hf_config_specified > 1:
+        if (
+            s3_config_specified
+            + local_config_specified
+            + hf_config_specified
+            + arrow_fs_config_specified
+            + memory_config_specified
+            > 1
+        ):
             self.logger.error(
                 f"data factory {self.cli_arg_prefix} "
                 f"{'S3, ' if s3_config_specified == 1 else ''}"
                 f"{'Local ' if local_config_specified == 1 else ''}"
                 f"{'hf ' if hf_config_specified == 1 else ''}"
+                f"{'arrow fs ' if arrow_fs_config_specified == 1 else ''}"
+                f"{'memory ' if memory_config_specified == 1 else ''}"
                 "configurations specified, but only one configuration expected"
             )
             return False
@@ -223,7 +467,8 @@ class DataAccessFactory(CLIArgumentProvider):
             self.logger.info(
                 f"data factory {self.cli_arg_prefix} is using S3 data access: "
                 f"input path - {self.s3_config['input_folder']}, "
-                f"output path - {self.s3_config['output_folder']}"
+                f"output path - {self.s3_config['output_folder']}, "
+                f"options - {self.s3_options}"
             )
         elif hf_config_specified == 1:
             config = {
@@ -247,7 +492,46 @@ class DataAccessFactory(CLIArgumentProvider):
             self.logger.info(
                 f"data factory {self.cli_arg_prefix} is using HF data access: "
                 f"input_folder - {self.hf_config['input_folder']} "
-                f"output_folder - {self.hf_config['output_folder']}"
+                f"output_folder - {self.hf_config['output_folder']}, "
+                f"options - {self.hf_options}"
+            )
+        elif arrow_fs_config_specified == 1:
+            config = {"input_folder": None, "output_folder": None}
+            input_folder = arrow_fs_config.get("input_folder", None)
+            if input_folder == "":
+                input_folder = None
+            if input_folder is not None:
+                config["input_folder"] = input_folder
+            output_folder = arrow_fs_config.get("output_folder", None)
+            if output_folder == "":
+                output_folder = None
+            if output_folder is not None:
+                config["output_folder"] = output_folder
+            if not self._validate_arrow_fs_config(
+                arrow_fs_config=config, s3_cred=s3_cred
+            ):
+                return False
+            self.arrow_fs_config = config
+            self.s3_cred = s3_cred
+            self.logger.info(
+                f"data factory {self.cli_arg_prefix} is using arrow fs data access: "
+                f"input_folder - {self.arrow_fs_config['input_folder']} "
+                f"output_folder - {self.arrow_fs_config['output_folder']}"
+            )
+        elif memory_config_specified == 1:
+            if not self._validate_memory_config(memory_config=memory_config):
+                return False
+            if checkpointing:
+                self.logger.error(
+                    f"data access factory {self.cli_arg_prefix}: checkpointing is not supported by memory "
+                    f"data access, outputs saved by other processes are not visible"
+                )
+                return False
+            self.memory_config = memory_config
+            self.logger.info(
+                f"data factory {self.cli_arg_prefix} is using memory data access: "
+                f"input_folder - {self.memory_config.get('input_folder', None)} "
+                f"output_folder - {self.memory_config.get('output_folder', None)}"
             )
         elif s3_cred is not None:
             if not self._validate_s3_cred(s3_credentials=s3_cred):
@@ -297,10 +581,17 @@ class DataAccessFactory(CLIArgumentProvider):
         self.n_samples = n_samples
         self.files_to_use = files_to_use
         self.files_to_checkpoint = files_to_checkpoint
+        self.streaming_listing = streaming_listing
+        self.memory_map = memory_map
+        self.cache_folder = cache_folder
+        self.cache_max_bytes = cache_max_bytes
         self.logger.info(
             f"data factory {self.cli_arg_prefix} "
             f"Checkpointing {checkpointing}, max files {max_files}, "
-            f"random samples {n_samples}, files to use {files_to_use}, files to checkpoint {files_to_checkpoint}"
+            f"random samples {n_samples}, files to use {files_to_use}, files to checkpoint {files_to_checkpoint}, "
+            f"streaming listing {streaming_listing}, memory map {memory_map}, "
+            f"cache folder {cache_folder}, cache max bytes {cache_max_bytes}, "
+            f"parquet profile {parquet_profile}, parquet options {parquet_options}"
         )
         return True
 
@@ -318,6 +609,34 @@ class DataAccessFactory(CLIArgumentProvider):
                 n_samples=self.n_samples,
                 files_to_use=self.files_to_use,
                 files_to_checkpoint=self.files_to_checkpoint,
+                streaming_listing=self.streaming_listing,
+                content_cache=self._create_content_cache(),
+                hf_options=self.hf_options,
+            )
+        if self.arrow_fs_config is not None:
+            # arrow fs config is specified, local or S3 file systems are accessed through pyarrow
+            return DataAccessArrowFS(
+                fs_config=self.arrow_fs_config,
+                s3_credentials=self.s3_cred,
+                checkpoint=self.checkpointing,
+                m_files=self.max_files,
+                n_samples=self.n_samples,
+                files_to_use=self.files_to_use,
+                files_to_checkpoint=self.files_to_checkpoint,
+                streaming_listing=self.streaming_listing,
+                memory_map=self.memory_map,
+                content_cache=self._create_content_cache(),
+            )
+        if self.memory_config is not None:
+            # memory config is specified, files are kept in memory
+            return DataAccessMemory(
+                memory_config=self.memory_config,
+                checkpoint=self.checkpointing,
+                m_files=self.max_files,
+                n_samples=self.n_samples,
+                files_to_use=self.files_to_use,
+                files_to_checkpoint=self.files_to_checkpoint,
+                streaming_listing=self.streaming_listing,
             )
         if self.s3_config is not None or self.s3_cred is not None:
             # If S3 config or S3 credential are specified, its S3
@@ -329,6 +648,9 @@ class DataAccessFactory(CLIArgumentProvider):
                 n_samples=self.n_samples,
                 files_to_use=self.files_to_use,
                 files_to_checkpoint=self.files_to_checkpoint,
+                streaming_listing=self.streaming_listing,
+                s3_options=self.s3_options,
+                content_cache=self._create_content_cache(),
             )
         # anything else is local data
         return DataAccessLocal(
@@ -338,6 +660,26 @@ class DataAccessFactory(CLIArgumentProvider):
             n_samples=self.n_samples,
             files_to_use=self.files_to_use,
             files_to_checkpoint=self.files_to_checkpoint,
+            streaming_listing=self.streaming_listing,
+            memory_map=self.memory_map,
+        )
+
+    def _create_content_cache(self) -> ContentCache:
+        """
+        Create content cache for remote data access
+        :return: content cache or None if caching is not configured
+        """
+        if self.cache_folder is None:
+            return None
+        return ContentCache(folder=self.cache_folder, max_bytes=self.cache_max_bytes)
+
+    def get_parquet_write_options(self) -> dict[str, Any]:
+        """
+        Get options of the parquet writer used for output tables
+        :return: pq.ParquetWriter keyword arguments
+        """
+        return TransformUtils.get_parquet_write_options(
+            profile=self.parquet_profile, options=self.parquet_options
         )
 
     def get_input_params(self) -> dict[str, Any]:
@@ -351,6 +693,14 @@ class DataAccessFactory(CLIArgumentProvider):
             "random_samples": self.n_samples,
             "files_to_use": self.files_to_use,
             "files_to_checkpoint": self.files_to_checkpoint,
+            "streaming_listing": self.streaming_listing,
+            "memory_map": self.memory_map,
+            "cache_folder": self.cache_folder,
+            "cache_max_bytes": self.cache_max_bytes,
+            "s3_options": self.s3_options,
+            "hf_options": self.hf_options,
+            "parquet_profile": self.parquet_profile,
+            "parquet_options": self.parquet_options,
         }
 
     def _validate_s3_cred(self, s3_credentials: dict[str, str]) -> bool:
@@ -377,6 +727,93 @@ class DataAccessFactory(CLIArgumentProvider):
             valid_config = False
         return valid_config
 
+    def _validate_s3_options(self, s3_options: dict[str, Any]) -> bool:
+        """
+        Validate that
+        :param s3_options: dictionary of S3 tuning options
+        :return: True if s3 options are valid, False otherwise
+        """
+        if not isinstance(s3_options, dict):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: s3_options has to be a dictionary"
+            )
+            return False
+        valid_config = True
+        for key in s3_options:
+            if key not in ArrowS3.OPTIONS:
+                self.logger.error(
+                    f"data access factory {self.cli_arg_prefix}: unknown S3 option {key}, "
+                    f"supported options are {ArrowS3.OPTIONS}"
+                )
+                valid_config = False
+        return valid_config
+
+    def _validate_hf_options(self, hf_options: dict[str, Any]) -> bool:
+        """
+        Validate that
+        :param hf_options: dictionary of Hugging Face tuning options
+        :return: True if hf options are valid, False otherwise
+        """
+        if not isinstance(hf_options, dict):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: hf_options has to be a dictionary"
+            )
+            return False
+        valid_config = True
+        for key in hf_options:
+            if key not in DataAccessHF.OPTIONS:
+                self.logger.error(
+                    f"data access factory {self.cli_arg_prefix}: unknown HF option {key}, "
+                    f"supported options are {DataAccessHF.OPTIONS}"
+                )
+                valid_config = False
+        return valid_config
+
+    def _validate_parquet_options(
+        self, parquet_profile: str, parquet_options: dict[str, Any]
+    ) -> bool:
+        """
+        Validate that
+        :param parquet_profile: parquet writer profile name
+        :param parquet_options: dictionary of parquet writer options
+        :return: True if profile and options are valid, False otherwise
+        """
+        if parquet_profile not in TransformUtils.PARQUET_PROFILES:
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: unknown parquet profile {parquet_profile}, "
+                f"supported profiles are {list(TransformUtils.PARQUET_PROFILES)}"
+            )
+            return False
+        if not isinstance(parquet_options, dict):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: parquet_options has to be a dictionary"
+            )
+            return False
+        options = TransformUtils.get_parquet_write_options(
+            profile=parquet_profile, options=parquet_options
+        )
+        # row group size is an argument of write_table, not of the writer
+        row_group_size = options.pop("row_group_size", None)
+        if row_group_size is not None and (
+            not isinstance(row_group_size, int) or row_group_size <= 0
+        ):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: row_group_size has to be a positive integer, "
+                f"got {row_group_size}"
+            )
+            return False
+        try:
+            # writer validates both option names and values
+            pq.ParquetWriter(
+                where=pa.BufferOutputStream(), schema=pa.schema([]), **options
+            ).close()
+        except Exception as e:
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: invalid parquet options {parquet_options} - {e}"
+            )
+            return False
+        return True
+
     def _validate_local_config(self, local_config: dict[str, str]) -> bool:
         """
         Validate that
@@ -410,6 +847,73 @@ class DataAccessFactory(CLIArgumentProvider):
             return False
         return True
 
+    def _validate_arrow_fs_config(
+        self, arrow_fs_config: dict[str, str], s3_cred: dict[str, str]
+    ) -> bool:
+        """
+        Validate that
+        :param arrow_fs_config: dictionary of arrow fs config
+        :param s3_cred: dictionary of S3 credentials, required for s3:// folders
+        :return: True if arrow fs config is valid, False otherwise
+        """
+        folders = [
+            folder
+            for folder in (
+                arrow_fs_config.get("input_folder"),
+                arrow_fs_config.get("output_folder"),
+            )
+            if folder is not None
+        ]
+        if len(folders) == 0:
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: Could not find input and output folder in arrow fs config"
+            )
+            return False
+        s3 = [folder.startswith("s3://") for folder in folders]
+        if any(s3) and not all(s3):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: "
+                f"input and output folders in arrow fs config have to use the same file system"
+            )
+            return False
+        if any(s3):
+            return self._validate_s3_cred(s3_credentials=s3_cred)
+        return True
+
+    def _validate_memory_config(self, memory_config: dict[str, Any]) -> bool:
+        """
+        Validate that
+        :param memory_config: dictionary of memory config
+        :return: True if memory config is valid, False otherwise
+        """
+        if (
+            memory_config.get("input_folder") is None
+            and memory_config.get("output_folder") is None
+        ):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: Could not find input and output folder in memory config"
+            )
+            return False
+        source_folder = memory_config.get("source_folder", None)
+        if source_folder is not None and not os.path.isdir(source_folder):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: source folder {source_folder} of memory config does not exist"
+            )
+            return False
+        for key in ["n_files", "rows", "doc_size"]:
+            value = memory_config.get(key, 0)
+            if not isinstance(value, int) or value < 0:
+                self.logger.error(
+                    f"data access factory {self.cli_arg_prefix}: {key} of memory config has to be a non negative integer"
+                )
+                return False
+        if not isinstance(memory_config.get("discard_output", False), bool):
+            self.logger.error(
+                f"data access factory {self.cli_arg_prefix}: discard_output of memory config has to be a boolean"
+            )
+            return False
+        return True
+
     def _validate_hf_config(self, hf_config: dict[str, str]) -> bool:
         """
         Validate that
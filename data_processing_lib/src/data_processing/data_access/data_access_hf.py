@@ -1,20 +1,46 @@
 import json
-from typing import Any, Union, Iterable
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generator, Union, Iterable
 
 from data_processing.data_access import DataAccess
-from data_processing.utils import get_logger
-from huggingface_hub import HfApi, HfFileSystem, RepoCard, DatasetInfo
+from data_processing.data_access.content_cache import ContentCache
+from data_processing.utils import MB, get_logger
+from huggingface_hub import (
+    CommitOperationAdd,
+    HfApi,
+    HfFileSystem,
+    RepoCard,
+    DatasetInfo,
+)
 from huggingface_hub.errors import EntryNotFoundError
 
 
 logger = get_logger(__name__)
 
+# number of files returned in a single batch during streaming listing
+LISTING_BATCH_SIZE = 1000
+
 
 class DataAccessHF(DataAccess):
     """
     Implementation of the Base Data access class for local folder data access.
     """
 
+    # names of the tuning options, that can be passed to the constructor through hf_options
+    OPTIONS = (
+        "read_concurrency",
+        "read_part_size",
+        "read_threshold",
+        "commit_files",
+        "commit_bytes",
+        "commit_retries",
+    )
+
     def __init__(
         self,
         hf_config: dict[str, str] = None,
@@ -23,6 +49,9 @@ class DataAccessHF(DataAccess):
         n_samples: int = -1,
         files_to_use: list[str] = [".parquet"],
         files_to_checkpoint: list[str] = [".parquet"],
+        streaming_listing: bool = False,
+        content_cache: ContentCache = None,
+        hf_options: dict[str, Any] = None,
     ):
         """
         Create data access class for folder based configuration
@@ -32,6 +61,18 @@ class DataAccessHF(DataAccess):
         :param n_samples: amount of files to randomly sample
         :param files_to_use: files extensions of files to include
         :param files_to_checkpoint: files extensions of files to use for checkpointing
+        :param streaming_listing: flag to return files to process as they are listed
+        :param content_cache: local cache of the files content, validated by their blob ids
+        :param hf_options: dictionary of tuning options (see OPTIONS):
+            read_concurrency - number of concurrent reads. If greater than 1, get_folder_files reads
+                files concurrently and large files are read using concurrent range requests - default 1
+            read_part_size - size of a range request for large files - default 16MB
+            read_threshold - files larger than this size are read using concurrent range
+                requests - default 64MB
+            commit_files - number of output files staged locally and pushed by a single commit.
+                0 commits every file separately - default 0
+            commit_bytes - size of the staged output files, above which they are committed - default 1GB
+            commit_retries - number of attempts to push a commit of the staged files - default 3
         """
         super().__init__(
             checkpoint=checkpoint,
@@ -39,6 +80,8 @@ class DataAccessHF(DataAccess):
             n_samples=n_samples,
             files_to_use=files_to_use,
             files_to_checkpoint=files_to_checkpoint,
+            streaming_listing=streaming_listing,
+            content_cache=content_cache,
         )
         if hf_config is None:
             self.input_folder = None
@@ -56,7 +99,20 @@ class DataAccessHF(DataAccess):
                 hf_token = None
         self.hf_config = hf_config
         self.fs = HfFileSystem(token=hf_token)
-        self.apis = HfApi()
+        self.apis = HfApi(token=hf_token)
+        hf_options = hf_options or {}
+        self.read_concurrency = max(hf_options.get("read_concurrency", 1), 1)
+        self.read_part_size = hf_options.get("read_part_size", 16 * MB)
+        self.read_threshold = hf_options.get("read_threshold", 64 * MB)
+        self.commit_files = hf_options.get("commit_files", 0)
+        self.commit_bytes = hf_options.get("commit_bytes", 1024 * MB)
+        self.commit_retries = max(hf_options.get("commit_retries", 3), 1)
+        # output files staged for the next commit, created on the first write
+        self.staging_folder = None
+        self.staged = []
+        self.staged_bytes = 0
+        self.failed_commits = 0
+        self.staging_lock = threading.Lock()
 
         logger.debug(f"hf input folder: {self.input_folder}")
         logger.debug(f"hf output folder: {self.output_folder}")
@@ -80,28 +136,98 @@ class DataAccessHF(DataAccess):
         """
         return self.input_folder
 
-    def _get_file_size(self, path: str) -> int:
-        """
-        Get file size in bytes
-        :param path: file path
-        :return: file size in bytes
-        """
-        return self.fs.info(path=path)["size"]
-
     def _list_files_folder(self, path: str) -> tuple[list[dict[str, Any]], int]:
         """
         Get files for a given folder and all sub folders
         :param path: path
         :return: List of files
         """
+        res = []
+        for files, _ in self._iterate_files_folder(path=path):
+            res.extend(files)
+        return res, 0
+
+    def _iterate_files_folder(
+        self, path: str
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Iterate over files for a given folder and all sub folders. Files and their sizes are
+        retrieved by a single recursive listing (see _get_listing) and returned in batches
+        :param path: path
+        :return: generator of batches of files (names and sizes) and the number of retries (always 0)
+        """
         try:
-            s_path = f"{path}/**/*.*"
-            files = sorted(self.fs.glob(path=s_path))
+            files = self._get_listing(path=path)
         except Exception as e:
             logger.error(f"Error reading HF files {e}")
-            return [], 0
-        res = [{"name": file, "size": self._get_file_size(file)} for file in files]
-        return res, 0
+            return
+        for i in range(0, len(files), LISTING_BATCH_SIZE):
+            yield files[i : i + LISTING_BATCH_SIZE], 0
+
+    def _get_listing(self, path: str) -> list[dict[str, Any]]:
+        """
+        List files of the folder and all sub folders with their sizes. The repository tree is
+        listed recursively, so sizes are returned in bulk instead of a request per file. If content
+        cache is configured, the listing is also kept there as a snapshot of the repository commit,
+        so that listing of the same revision is not repeated
+        :param path: folder path
+        :return: sorted list of files (names and sizes)
+        """
+        commit = None
+        if self.content_cache is not None:
+            commit = self._get_commit(path=path)
+        if commit is not None:
+            snapshot = self.content_cache.get(path=f"listing {path}", version=commit)
+            if snapshot is not None:
+                return json.loads(snapshot)
+        files = [
+            {"name": name, "size": info["size"]}
+            for name, info in self.fs.find(path=path, detail=True).items()
+            # the same files as matched by the "**/*.*" glob
+            if "." in name.rsplit("/", 1)[-1]
+        ]
+        if commit is not None:
+            self.content_cache.put(
+                path=f"listing {path}", version=commit, data=json.dumps(files).encode()
+            )
+        return files
+
+    def _list_folders(self, path: str, max_depth: int) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder, listed by a single recursive listing of the repository tree
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, non positive value for no limit
+        :return: sorted list of folders and number of retries (always 0)
+        """
+        root = path.rstrip("/")
+        entries = self.fs.find(
+            path=root,
+            maxdepth=max_depth if max_depth > 0 else None,
+            withdirs=True,
+            detail=True,
+        )
+        return sorted(
+            name
+            for name, info in entries.items()
+            if info["type"] == "directory" and name.rstrip("/") != root
+        ), 0
+
+    def _get_commit(self, path: str) -> str:
+        """
+        Get commit of the repository revision containing the path
+        :param path: path
+        :return: commit sha or None if it can not be resolved
+        """
+        try:
+            resolved = self.fs.resolve_path(path)
+            return self.apis.repo_info(
+                repo_id=resolved.repo_id,
+                repo_type=resolved.repo_type,
+                revision=resolved.revision,
+            ).sha
+        except Exception as e:
+            logger.warning(f"Failed to resolve commit of {path}: {e}")
+            return None
 
     def save_job_metadata(self, metadata: dict[str, Any]) -> tuple[dict[str, Any], int]:
         """
@@ -124,14 +250,21 @@ class DataAccessHF(DataAccess):
             return None, 0
         metadata["source"] = {"name": self.input_folder, "type": "path"}
         metadata["target"] = {"name": self.output_folder, "type": "path"}
-        return self.save_file(
+        res, retries = self.save_file(
             path=f"{self.output_folder}/metadata.json",
             data=json.dumps(metadata, indent=2).encode(),
         )
+        # metadata is written at the end of the job, so commit it (with any staged files) immediately
+        failed, r = self.flush_files()
+        if failed > 0:
+            return None, retries + r
+        return res, retries + r
 
     def get_file(self, path: str) -> tuple[bytes, int]:
         """
-        Gets the contents of a file as a byte array, decompressing gz files if needed.
+        Gets the contents of a file as a byte array, decompressing compressed (gz, zst, lz4, bz2)
+        files if needed. Unless concurrent reads or content cache are used, compressed files are
+        decompressed while they are downloaded.
 
         Args:
             path (str): The path to the file.
@@ -141,18 +274,109 @@ class DataAccessHF(DataAccess):
         """
 
         try:
-            with self.fs.open(path=path, mode="rb") as f:
-                return f.read(), 0
+            return self._read_decompressed(
+                path=path, read=self._read_file, stream=self.read_concurrency <= 1
+            )
         except Exception as e:
             logger.error(f"Error reading file {path}: {e}")
             return None, 0
 
+    def _read_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Read file content. If read_concurrency is greater than 1, files larger than read_threshold
+        are read using concurrent range requests into a single preallocated buffer
+        :param path: file path
+        :return: file content and number of operation retries
+        """
+        if self.read_concurrency > 1:
+            size = self.fs.info(path=path)["size"]
+            if size > self.read_threshold:
+                buffer = bytearray(size)
+
+                def _read_part(start: int) -> None:
+                    end = min(start + self.read_part_size, size)
+                    buffer[start:end] = self.fs.cat_file(
+                        path=path, start=start, end=end
+                    )
+
+                with ThreadPoolExecutor(max_workers=self.read_concurrency) as executor:
+                    list(executor.map(_read_part, range(0, size, self.read_part_size)))
+                return buffer, 0
+        with self.fs.open(path=path, mode="rb") as f:
+            return f.read(), 0
+
+    def get_folder_files(
+        self, path: str, extensions: list[str] = None, return_data: bool = True
+    ) -> tuple[dict[str, bytes], int]:
+        """
+        Get a list of byte content of files. If read_concurrency is greater than 1, files are read
+        concurrently
+        :param path: file path
+        :param extensions: a list of file extensions to include. If None, then all files from this and
+                           child ones will be returned
+        :param return_data: flag specifying whether the actual content of files is returned (True), or just
+                            directory is returned (False)
+        :return: A dictionary of file names/binary content will be returned
+        """
+        if not return_data or self.read_concurrency <= 1:
+            return super().get_folder_files(
+                path=path, extensions=extensions, return_data=return_data
+            )
+        files, _, retries = self.get_files_folder(
+            path=path, files_to_use=extensions, cm_files=-1
+        )
+        names = [str(file["name"]) for file in files]
+        result = {}
+        with ThreadPoolExecutor(max_workers=self.read_concurrency) as executor:
+            for name, (data, r) in zip(names, executor.map(self.get_file, names)):
+                result[name] = data
+                retries += r
+        return result, retries
+
+    def get_file_size(self, path: str) -> tuple[int, int]:
+        """
+        Get size of the file, without reading it
+        :param path: file path
+        :return: size of the file (None if it is not available) and number of retries (always 0)
+        """
+        try:
+            return self.fs.info(path=path)["size"], 0
+        except Exception as e:
+            logger.error(f"Error getting size of file {path}: {e}")
+            return None, 0
+
+    def _get_file_version(self, path: str) -> tuple[str, int]:
+        """
+        Get version of the file, identifying its content for the content cache
+        :param path: file path
+        :return: git blob id of the file (or its size, if not available) and number of retries
+        """
+        info = self.fs.info(path=path)
+        version = info.get("blob_id", None)
+        if version is None:
+            version = f"size {info['size']}"
+        return version, 0
+
+    def open_file(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for random access reading. Reads of the returned file are served by
+        HTTP range requests
+        :param path: file path
+        :return: seekable binary file object or None if an error occurs and number of operation retries
+        """
+        try:
+            return self.fs.open(path=path, mode="rb"), 0
+        except Exception as e:
+            logger.error(f"Error opening file {path}: {e}")
+            return None, 0
+
     def save_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
         """
         Saves bytes to a file and returns a dictionary with file information.
 
         Args:
-            data (bytes): The bytes data to save.
+            data (bytes): The bytes data to save. Any bytes-like object (pa.Buffer, memoryview)
+                is written directly, without converting it to bytes.
             path (str): The full name of the file to save.
 
         Returns:
@@ -163,15 +387,133 @@ class DataAccessHF(DataAccess):
         if self.hf_config["hf_token"] is None:
             logger.warning("Writing file is only supported when HF_TOKEN is defined")
             return None, 0
+        size = memoryview(data).nbytes
+        if self.commit_files > 0:
+            return self._stage_file(path=path, data=data, size=size)
         try:
             with self.fs.open(path=path, mode="wb") as f:
                 f.write(data)
-            file_info = {"name": path, "size": self.fs.info(path=path)["size"]}
-            return file_info, 0
+            return {"name": path, "size": size}, 0
         except Exception as e:
             logger.error(f"Error saving bytes to file {path}: {e}")
             return None, 0
 
+    def _stage_file(
+        self, path: str, data: bytes, size: int
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Stage file in a local folder. Staged files are committed, once their number reaches
+        commit_files or their size commit_bytes
+        :param path: file path
+        :param data: file content
+        :param size: file size
+        :return: a dictionary with "name" and "size" keys or None if staging fails and number of retries
+        """
+        try:
+            with self.staging_lock:
+                if self.staging_folder is None:
+                    self.staging_folder = tempfile.mkdtemp(prefix="hf_staging_")
+                staged_file = os.path.join(self.staging_folder, f"{len(self.staged)}")
+                with open(staged_file, "wb") as f:
+                    f.write(data)
+                self.staged.append((path, staged_file))
+                self.staged_bytes += size
+                commit = (
+                    len(self.staged) >= self.commit_files
+                    or self.staged_bytes >= self.commit_bytes
+                )
+                if commit:
+                    staged = self.staged
+                    self.staged = []
+                    self.staged_bytes = 0
+                    self.staging_folder = None
+        except Exception as e:
+            logger.error(f"Error staging file {path}: {e}")
+            return None, 0
+        retries = 0
+        if commit:
+            retries = self._commit_files(staged=staged)
+        return {"name": path, "size": size}, retries
+
+    def _commit_files(self, staged: list[tuple[str, str]]) -> int:
+        """
+        Commit staged files. Files are committed by a single commit per repository. Failed commits
+        are retried up to commit_retries attempts (with exponential backoff), before the staged
+        files are dropped and counted as failed
+        :param staged: list of file paths and their staged copies
+        :return: number of retries
+        """
+        repos = {}
+        for path, staged_file in staged:
+            resolved = self.fs.resolve_path(path)
+            repo = (resolved.repo_id, resolved.repo_type, resolved.revision)
+            repos.setdefault(repo, []).append(
+                CommitOperationAdd(
+                    path_in_repo=resolved.path_in_repo, path_or_fileobj=staged_file
+                )
+            )
+        retries = 0
+        for (repo_id, repo_type, revision), operations in repos.items():
+            for n in range(self.commit_retries):
+                if n > 0:
+                    retries += 1
+                    time.sleep(min(2**n, 60))
+                try:
+                    self.apis.create_commit(
+                        repo_id=repo_id,
+                        repo_type=repo_type,
+                        revision=revision,
+                        operations=operations,
+                        commit_message=f"Add {len(operations)} files",
+                    )
+                    break
+                except Exception as e:
+                    logger.error(
+                        f"Error committing {len(operations)} files to {repo_id}: {e}, attempt {n}"
+                    )
+            else:
+                logger.error(
+                    f"Failed to commit {len(operations)} files to {repo_id} in {self.commit_retries} attempts"
+                )
+                with self.staging_lock:
+                    self.failed_commits += len(operations)
+        self.fs.invalidate_cache()
+        shutil.rmtree(os.path.dirname(staged[0][1]), ignore_errors=True)
+        return retries
+
+    def flush_files(self) -> tuple[int, int]:
+        """
+        Commit all staged files
+        :return: number of files, which failed to be committed since the previous invocation
+                 and number of operation retries
+        """
+        with self.staging_lock:
+            staged = self.staged
+            self.staged = []
+            self.staged_bytes = 0
+            self.staging_folder = None
+        retries = 0
+        if len(staged) > 0:
+            retries = self._commit_files(staged=staged)
+        with self.staging_lock:
+            failed = self.failed_commits
+            self.failed_commits = 0
+        return failed, retries
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the lock can not be pickled and the staged files belong to this instance, which commits them
+        state = super().__getstate__()
+        state["staging_lock"] = None
+        state["staging_folder"] = None
+        state["staged"] = []
+        state["staged_bytes"] = 0
+        state["failed_commits"] = 0
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.staging_lock = threading.Lock()
+
     def get_dataset_card(self, ds_name: str) -> RepoCard:
         """
         Get the data set Repo card
@@ -233,4 +575,4 @@ class DataAccessHF(DataAccess):
         :param content: readme content
         :return: data card
         """
-        return RepoCard(content=content)
\ No newline at end of file
+        return RepoCard(content=content)
@@ -1,15 +1,24 @@
 import gzip
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Generator
+
+import pyarrow as pa
 
 from data_processing.data_access import DataAccess
-from data_processing.utils import get_logger
+from data_processing.data_access.output_stream import LocalOutputStream
+from data_processing.utils import CompressionUtils, get_logger
 
 
 logger = get_logger(__name__)
 
+# number of threads scanning folders during listing
+LISTING_WORKERS = 8
+# maximum number of folders scanned ahead of the listing
+LISTING_MAX_PENDING = 16 * LISTING_WORKERS
+
 
 class DataAccessLocal(DataAccess):
     """
@@ -24,6 +33,8 @@ class DataAccessLocal(DataAccess):
         n_samples: int = -1,
         files_to_use: list[str] = [".parquet"],
         files_to_checkpoint: list[str] = [".parquet"],
+        streaming_listing: bool = False,
+        memory_map: bool = False,
     ):
         """
         Create data access class for folder based configuration
@@ -33,6 +44,9 @@ class DataAccessLocal(DataAccess):
         :param n_samples: amount of files to randomly sample
         :param files_to_use: files extensions of files to include
         :param files_to_checkpoint: files extensions of files to use for checkpointing
+        :param streaming_listing: flag to return files to process as they are listed
+        :param memory_map: flag to return content of (not compressed) files as zero-copy memory mapped
+                           buffers instead of bytes
         """
         super().__init__(
             checkpoint=checkpoint,
@@ -40,7 +54,9 @@ class DataAccessLocal(DataAccess):
             n_samples=n_samples,
             files_to_use=files_to_use,
             files_to_checkpoint=files_to_checkpoint,
+            streaming_listing=streaming_listing,
         )
+        self.memory_map = memory_map
         if local_config is None:
             self.input_folder = None
             self.output_folder = None
@@ -60,6 +76,7 @@ class DataAccessLocal(DataAccess):
         logger.debug(f"Local n_samples: {self.n_samples}")
         logger.debug(f"Local files_to_use: {self.files_to_use}")
         logger.debug(f"Local files_to_checkpoint: {self.files_to_checkpoint}")
+        logger.debug(f"Local memory_map: {self.memory_map}")
 
     def get_output_folder(self) -> str:
         """
@@ -81,14 +98,98 @@ class DataAccessLocal(DataAccess):
         :param path: path
         :return: List of files
         """
-        files = sorted(Path(path).rglob("*"))
         res = []
-        for file in files:
-            if file.is_dir():
-                continue
-            res.append({"name": str(file), "size": file.stat().st_size})
+        for files, _ in self._iterate_files_folder(path=path):
+            res.extend(files)
         return res, 0
 
+    def _iterate_files_folder(
+        self, path: str
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Iterate over files for a given folder and all sub folders. Folders are walked depth first
+        with the entries sorted by name, so files are returned in the same order as sorting the
+        complete list of paths. Sub folders are scanned ahead of the walk by LISTING_WORKERS threads,
+        overlapping the latency of reading folders and file sizes, which is significant for network
+        file systems. Up to LISTING_MAX_PENDING folders are scanned ahead, bounding the memory.
+        :param path: path
+        :return: generator of batches of files (names and sizes) and the number of retries (always 0)
+        """
+        root = str(Path(path))
+        if not os.path.isdir(root):
+            return
+        executor = ThreadPoolExecutor(max_workers=LISTING_WORKERS)
+        scans: dict[str, Future] = {}
+
+        def _walk(
+            folder: str,
+        ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+            scan = scans.pop(folder, None)
+            entries = self._scan_folder(folder) if scan is None else scan.result()
+            # start scanning sub folders, they are walked in this order
+            for name, size in entries:
+                if size is None and len(scans) < LISTING_MAX_PENDING:
+                    scans[name] = executor.submit(self._scan_folder, name)
+            files = []
+            for name, size in entries:
+                if size is None:
+                    # return files collected so far before going into the sub folder
+                    if len(files) > 0:
+                        yield files, 0
+                        files = []
+                    yield from _walk(name)
+                else:
+                    files.append({"name": name, "size": size})
+            if len(files) > 0:
+                yield files, 0
+
+        try:
+            yield from _walk(root)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _scan_folder(folder: str) -> list[tuple[str, int]]:
+        """
+        Get folder entries. File sizes are taken from the scandir entries, avoiding separate lookups
+        of file paths. Symbolic links to folders are not followed, as in os.walk
+        :param folder: folder path
+        :return: list of entry paths and file sizes (None for sub folders) sorted by name
+        """
+        entries = []
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.path, None))
+                    elif entry.is_dir():
+                        # symbolic link to a folder
+                        continue
+                    else:
+                        entries.append((entry.path, entry.stat().st_size))
+                except FileNotFoundError:
+                    # removed during listing
+                    continue
+        return sorted(entries, key=lambda e: e[0])
+
+    def _list_folders(self, path: str, max_depth: int) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, non positive value for no limit
+        :return: sorted list of folders and number of retries (always 0)
+        """
+        root = str(Path(path))
+        root_depth = root.rstrip(os.sep).count(os.sep)
+        folders = []
+        for folder, dirs, _ in os.walk(root):
+            if 0 < max_depth <= folder.count(os.sep) - root_depth:
+                # do not go deeper
+                dirs.clear()
+                continue
+            folders.extend(os.path.join(folder, d) for d in dirs)
+        return sorted(folders), 0
+
     def save_job_metadata(self, metadata: dict[str, Any]) -> tuple[dict[str, Any], int]:
         """
         Save metadata
@@ -117,7 +218,12 @@ class DataAccessLocal(DataAccess):
 
     def get_file(self, path: str) -> tuple[bytes, int]:
         """
-        Gets the contents of a file as a byte array, decompressing gz files if needed.
+        Gets the contents of a file as a byte array, decompressing compressed (gz, zst, lz4, bz2) files
+        if needed. Compressed files are memory mapped and decompressed from the mapping, so the compressed
+        content is not copied into memory.
+        If memory_map is set, the content of not compressed files is returned as a memory mapped
+        pa.Buffer, that supports the buffer protocol and len(), without copying the file into memory.
+        The mapping is released, once the buffer (and all objects created from it) are released.
 
         Args:
             path (str): The path to the file.
@@ -127,24 +233,75 @@ class DataAccessLocal(DataAccess):
         """
 
         try:
-            if path.endswith(".gz"):
-                with gzip.open(path, "rb") as f:
-                    data = f.read()
+            codec = CompressionUtils.get_codec(path)
+            if codec is not None:
+                with pa.memory_map(path, "r") as f:
+                    compressed = f.read_buffer()
+                try:
+                    data = CompressionUtils.decompress(data=compressed, codec=codec)
+                except OSError as e:
+                    if codec == "gzip":
+                        raise gzip.BadGzipFile(f"{e}") from e
+                    raise e
+            elif self.memory_map:
+                # buffer keeps the mapping alive after the file is closed
+                with pa.memory_map(path, "r") as f:
+                    data = f.read_buffer()
             else:
                 with open(path, "rb") as f:
                     data = f.read()
             return data, 0
 
-        except (FileNotFoundError, gzip.BadGzipFile) as e:
+        except OSError as e:
             logger.error(f"Error reading file {path}: {e}")
             raise e
 
+    def get_file_size(self, path: str) -> tuple[int, int]:
+        """
+        Get size of the file, without reading it
+        :param path: file path
+        :return: size of the file (None if it does not exist) and number of retries (always 0)
+        """
+        try:
+            return os.path.getsize(path), 0
+        except OSError as e:
+            logger.error(f"Error getting size of file {path}: {e}")
+            return None, 0
+
+    def open_file(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for random access reading (memory mapped, if memory_map is set)
+        :param path: file path
+        :return: seekable binary file object and number of operation retries
+        """
+        try:
+            if self.memory_map:
+                return pa.memory_map(path, "r"), 0
+            return pa.OSFile(path, "r"), 0
+        except FileNotFoundError as e:
+            logger.error(f"Error opening file {path}: {e}")
+            raise e
+
+    def open_output_stream(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for sequential writing. Content is written to a temporary file, renamed to the file
+        on close (see LocalOutputStream)
+        :param path: file path
+        :return: output stream (None in the case of failure) and number of retries (always 0)
+        """
+        try:
+            return LocalOutputStream(path=path), 0
+        except Exception as e:
+            logger.error(f"Error opening file {path} for writing: {e}")
+            return None, 0
+
     def save_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
         """
         Saves bytes to a file and returns a dictionary with file information.
 
         Args:
-            data (bytes): The bytes data to save.
+            data (bytes): The bytes data to save. Any bytes-like object (pa.Buffer, memoryview)
+                is written directly, without converting it to bytes.
             path (str): The full name of the file to save.
 
         Returns:
@@ -0,0 +1,287 @@
+import hashlib
+import json
+import os
+import random
+from typing import Any
+
+import pyarrow as pa
+from data_processing.data_access import DataAccess
+from data_processing.data_access.memory_store import get_store
+from data_processing.utils import TransformUtils, get_logger
+
+
+logger = get_logger(__name__)
+
+
+class DataAccessMemory(DataAccess):
+    """
+    Implementation of the Base Data access class keeping files in memory, used to measure transforms
+    and runtimes throughput without storage costs. Input files are loaded from a local folder (for
+    example test-data) and/or generated, and published once per node as a shared memory segment (see
+    MemoryStore), from which all processes of the Python and Ray runtimes read them without copying.
+    Saved files are kept in the memory of the process saving them, so they are not visible to other
+    processes (pool workers and actors save their outputs privately), and checkpointing is not supported.
+    For long benchmarks, content of saved files can be discarded, keeping only their names and sizes
+    """
+
+    def __init__(
+        self,
+        memory_config: dict[str, Any] = None,
+        checkpoint: bool = False,
+        m_files: int = -1,
+        n_samples: int = -1,
+        files_to_use: list[str] = [".parquet"],
+        files_to_checkpoint: list[str] = [".parquet"],
+        streaming_listing: bool = False,
+    ):
+        """
+        Create data access class for memory based configuration
+        :param memory_config: dictionary of memory store info:
+            input_folder - name of the input folder in the store
+            output_folder - name of the output folder in the store
+            source_folder - local folder, which files are loaded to the input folder
+            n_files - number of parquet files generated in the input folder
+            rows - number of rows of the generated files
+            doc_size - size of the documents of the generated files
+            discard_output - flag to keep only names and sizes of saved files, discarding their content
+        :param checkpoint: not supported, outputs saved by other processes are not visible
+        :param m_files: max amount of files to return
+        :param n_samples: amount of files to randomly sample
+        :param files_to_use: files extensions of files to include
+        :param files_to_checkpoint: files extensions of files to use for checkpointing
+        :param streaming_listing: flag to return files to process as they are listed
+        """
+        if checkpoint:
+            logger.warning(
+                "Checkpointing is not supported by memory data access, all files are processed"
+            )
+        super().__init__(
+            checkpoint=False,
+            m_files=m_files,
+            n_samples=n_samples,
+            files_to_use=files_to_use,
+            files_to_checkpoint=files_to_checkpoint,
+            streaming_listing=streaming_listing,
+        )
+        if memory_config is None:
+            memory_config = {}
+        self.input_folder = self._get_folder(memory_config.get("input_folder", None))
+        self.output_folder = self._get_folder(memory_config.get("output_folder", None))
+        self.discard_output = memory_config.get("discard_output", False)
+        source = {
+            key: memory_config.get(key, default)
+            for key, default in [
+                ("source_folder", None),
+                ("n_files", 0),
+                ("rows", 1000),
+                ("doc_size", 1024),
+            ]
+        }
+        version = None
+        if source["source_folder"] is not None:
+            source["source_folder"] = os.path.abspath(source["source_folder"])
+            version = self._get_source_version(source_folder=source["source_folder"])
+        # stores with the same content are shared, a modified source folder is published as a new store
+        digest = hashlib.sha1(
+            json.dumps([self.input_folder, source, version], sort_keys=True).encode()
+        ).hexdigest()
+        self.store = get_store(name=f"dpk_{digest[:16]}")
+        if not self.store.is_published():
+            self.store.publish(files=self._create_files(**source))
+        logger.debug(f"Memory input folder: {self.input_folder}")
+        logger.debug(f"Memory output folder: {self.output_folder}")
+
+    @staticmethod
+    def _get_folder(folder: str) -> str:
+        """
+        Normalize folder name
+        :param folder: folder name
+        :return: folder name without leading and trailing /, None if the folder is not defined
+        """
+        if folder is None:
+            return None
+        return folder.strip("/")
+
+    @staticmethod
+    def _get_source_version(source_folder: str) -> list[tuple[str, int, int]]:
+        """
+        Get version of the source folder content
+        :param source_folder: local folder
+        :return: sorted list of relative file names, sizes and modification times
+        """
+        version = []
+        for root, _, names in os.walk(source_folder):
+            for name in names:
+                stat = os.stat(os.path.join(root, name))
+                relative = os.path.relpath(os.path.join(root, name), source_folder)
+                version.append((relative, stat.st_size, stat.st_mtime_ns))
+        return sorted(version)
+
+    def _create_files(
+        self, source_folder: str, n_files: int, rows: int, doc_size: int
+    ) -> dict[str, bytes]:
+        """
+        Create content of the input folder
+        :param source_folder: local folder to load, None if not used
+        :param n_files: number of generated parquet files
+        :param rows: number of rows of the generated files
+        :param doc_size: size of the documents of the generated files
+        :return: dictionary of file names and content
+        """
+        files = {}
+        if self.input_folder is None:
+            return files
+        if source_folder is not None:
+            for root, _, names in os.walk(source_folder):
+                for name in names:
+                    path = os.path.join(root, name)
+                    relative = os.path.relpath(path, source_folder).replace(os.sep, "/")
+                    with open(path, "rb") as f:
+                        files[f"{self.input_folder}/{relative}"] = f.read()
+        if n_files > 0:
+            table = self._generate_table(rows=rows, doc_size=doc_size)
+            data = TransformUtils.convert_arrow_to_binary(table=table)
+            for i in range(n_files):
+                files[f"{self.input_folder}/generated_{i:06d}.parquet"] = data
+        return files
+
+    @staticmethod
+    def _generate_table(rows: int, doc_size: int) -> pa.Table:
+        """
+        Generate table of text documents
+        :param rows: number of rows
+        :param doc_size: size of the documents
+        :return: table with document_id and contents columns
+        """
+        rnd = random.Random(42)
+        vocabulary = [
+            "".join(rnd.choices("abcdefghijklmnopqrstuvwxyz", k=rnd.randint(2, 10)))
+            for _ in range(1000)
+        ]
+        contents = []
+        for _ in range(rows):
+            words = rnd.choices(vocabulary, k=doc_size // 5 + 1)
+            contents.append(" ".join(words)[:doc_size])
+        return pa.table(
+            {"document_id": [f"doc_{i}" for i in range(rows)], "contents": contents}
+        )
+
+    def get_output_folder(self) -> str:
+        """
+        Get output folder as a string
+        :return: output_folder
+        """
+        return self.output_folder
+
+    def get_input_folder(self) -> str:
+        """
+        Get input folder as a string
+        :return: input_folder
+        """
+        return self.input_folder
+
+    def _list_files_folder(self, path: str) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get files for a given folder and all sub folders
+        :param path: path
+        :return: List of files sorted by name and number of retries (always 0)
+        """
+        files = self.store.list(prefix=TransformUtils.ensure_slash(path.strip("/")))
+        return [{"name": name, "size": size} for name, size in files], 0
+
+    def _list_folders(self, path: str, max_depth: int) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, non positive value for no limit
+        :return: sorted list of folders and number of retries (always 0)
+        """
+        root = TransformUtils.ensure_slash(path.strip("/"))
+        folders = set()
+        for name, _ in self.store.list(prefix=root):
+            parts = name[len(root) :].split("/")[:-1]
+            if max_depth > 0:
+                parts = parts[:max_depth]
+            for i in range(len(parts)):
+                folders.add(root + "/".join(parts[: i + 1]))
+        return sorted(folders), 0
+
+    def get_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Get file as a byte array, decompressing compressed (gz, zst, lz4, bz2) files. Input files are
+        returned as pa.Buffer referencing the shared memory, without copying them
+        :param path: file path
+        :return: file content (None in the case of failure) and number of retries (always 0)
+        """
+        try:
+            return self._read_decompressed(path=path, read=self._read_file)
+        except Exception as e:
+            logger.error(f"Error reading file {path}: {e}")
+            return None, 0
+
+    def _read_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Read file content
+        :param path: file path
+        :return: file content and number of retries (always 0)
+        """
+        data = self.store.get(path=path)
+        if data is None:
+            raise FileNotFoundError(f"file {path} does not exist")
+        return pa.py_buffer(data), 0
+
+    def get_file_size(self, path: str) -> tuple[int, int]:
+        """
+        Get size of the file, without reading it
+        :param path: file path
+        :return: size of the file (None if it does not exist) and number of retries (always 0)
+        """
+        data = self.store.get(path=path)
+        return (len(data) if data is not None else None), 0
+
+    def open_file(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for random access reading
+        :param path: file path
+        :return: seekable binary file object (None in the case of failure) and number of retries (always 0)
+        """
+        data = self.store.get(path=path)
+        if data is None:
+            logger.error(f"Error opening file {path}: file does not exist")
+            return None, 0
+        return pa.BufferReader(pa.py_buffer(data)), 0
+
+    def save_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
+        """
+        Save byte array in the memory of this process. If discard_output is set, only the name and
+        size of the file are kept
+        :param path: file path
+        :param data: byte array or other bytes-like object (pa.Buffer, memoryview)
+        :return: a dictionary with "name" and "size" keys and number of retries (always 0)
+        """
+        self.store.put(path=path, data=data, discard=self.discard_output)
+        return {"name": path, "size": memoryview(data).nbytes}, 0
+
+    def save_job_metadata(self, metadata: dict[str, Any]) -> tuple[dict[str, Any], int]:
+        """
+        Save metadata
+        :param metadata: a dictionary, containing the following keys:
+            "job details",
+            "job_input_params",
+            "execution_stats",
+            "job_output_stats"
+        two additional elements:
+            "source"
+            "target"
+        are filled by implementation
+        :return: a dictionary with "name" and "size" keys (None in the case of failure) and number of retries
+        """
+        if self.output_folder is None:
+            logger.error("Memory output folder is not defined, can't save metadata")
+            return None, 0
+        metadata["source"] = {"name": self.input_folder, "type": "memory"}
+        metadata["target"] = {"name": self.output_folder, "type": "memory"}
+        return self.save_file(
+            path=f"{self.output_folder}/metadata.json",
+            data=json.dumps(metadata, indent=2).encode(),
+        )
@@ -1,8 +1,8 @@
-import gzip
 import json
-from typing import Any
+from typing import Any, Generator
 
-from data_processing.data_access import ArrowS3, DataAccess
+from data_processing.data_access import ArrowS3, DataAccess, S3ClientPool
+from data_processing.data_access.content_cache import ContentCache
 from data_processing.utils import TransformUtils
 
 
@@ -20,6 +20,9 @@ class DataAccessS3(DataAccess):
         n_samples: int = -1,
         files_to_use: list[str] = [".parquet"],
         files_to_checkpoint: list[str] = [".parquet"],
+        streaming_listing: bool = False,
+        s3_options: dict[str, Any] = None,
+        content_cache: ContentCache = None,
     ):
         """
         Create data access class for folder based configuration
@@ -30,6 +33,9 @@ class DataAccessS3(DataAccess):
         :param n_samples: amount of files to randomly sample
         :param files_to_use: files extensions of files to include
         :param files_to_checkpoint: files extensions of files to use for checkpointing
+        :param streaming_listing: flag to return files to process as they are listed
+        :param s3_options: dictionary of S3 access tuning options (see ArrowS3.OPTIONS)
+        :param content_cache: local cache of the files content, validated by their ETags
         """
         super().__init__(
             checkpoint=checkpoint,
@@ -37,6 +43,8 @@ class DataAccessS3(DataAccess):
             n_samples=n_samples,
             files_to_use=files_to_use,
             files_to_checkpoint=files_to_checkpoint,
+            streaming_listing=streaming_listing,
+            content_cache=content_cache,
         )
         if (
             s3_credentials is None
@@ -64,8 +72,17 @@ class DataAccessS3(DataAccess):
             secret_key=s3_credentials.get("secret_key"),
             endpoint=s3_credentials.get("url", None),
             region=s3_credentials.get("region", None),
+            **(s3_options or {}),
         )
 
+    def get_pool_stats(self) -> dict[str, int]:
+        """
+        Get statistics of the S3 clients shared by the process since the previous invocation
+        (see S3ClientPool.get_stats)
+        :return: statistics dictionary
+        """
+        return S3ClientPool.get_stats()
+
     def get_output_folder(self) -> str:
         """
         Get output folder as a string
@@ -92,6 +109,31 @@ class DataAccessS3(DataAccess):
             self.logger.error(f"Error listing S3 files for path {path} - {e}")
             return [], 0
 
+    def _iterate_files_folder(
+        self, path: str
+    ) -> Generator[tuple[list[dict[str, Any]], int], None, None]:
+        """
+        Iterate over files for a given folder and all sub folders page by page. A listing failure
+        is raised, so that the job fails instead of processing a part of the files
+        :param path: path
+        :return: generator of batches of files and the number of retries for every batch
+        """
+        try:
+            yield from self.arrS3.iterate_files(key=path)
+        except Exception as e:
+            self.logger.error(f"Error listing S3 files for path {path} - {e}")
+            raise
+
+    def _list_folders(self, path: str, max_depth: int) -> tuple[list[str], int]:
+        """
+        Get all sub folders of the folder
+        :param path: folder path
+        :param max_depth: maximum depth of the returned folders, non positive value for no limit
+        :return: list of folders and number of retries. IOError is raised if some folders can not be
+                 listed (see ArrowS3.list_folders)
+        """
+        return self.arrS3.list_folders(key=path, max_depth=max_depth)
+
     def save_job_metadata(self, metadata: dict[str, Any]) -> tuple[dict[str, Any], int]:
         """
         Save metadata
@@ -120,24 +162,77 @@ class DataAccessS3(DataAccess):
 
     def get_file(self, path: str) -> tuple[bytes, int]:
         """
-        Get file as a byte array
+        Get file as a byte array, decompressing compressed (gz, zst, lz4, bz2) files. Unless
+        concurrent reads or content cache are used, compressed files are decompressed while
+        they are downloaded by a single streaming request
         :param path: file path
         :return: bytes array of file content and amount of retries
         """
         try:
-            filedata, retries = self.arrS3.read_file(path)
+            return self._read_decompressed(
+                path=path,
+                read=self.arrS3.read_file,
+                stream=self.arrS3.read_concurrency <= 1,
+                # content is cached under the ETag returned by GET, not by the preceding HEAD
+                read_versioned=self.arrS3.read_file_versioned,
+            )
         except Exception as e:
             self.logger.error(f"Exception reading file {path} - {e}")
             return None, 0
-        if path.endswith("gz"):
-            filedata = gzip.decompress(filedata)
-        return filedata, retries
+
+    def get_file_size(self, path: str) -> tuple[int, int]:
+        """
+        Get size of the file, without reading it (HEAD request)
+        :param path: file path
+        :return: size of the file (None if it is not available) and number of retries
+        """
+        return self.arrS3.get_file_size(key=path)
+
+    def _get_file_version(self, path: str) -> tuple[str, int]:
+        """
+        Get version of the file, identifying its content for the content cache
+        :param path: file path
+        :return: ETag of the file (None if it is not available) and number of retries
+        """
+        return self.arrS3.get_file_version(key=path)
+
+    def open_file(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for random access reading. Reads of the returned file are served by S3 range requests
+        :param path: file path
+        :return: seekable binary file object (None in the case of failure) and number of retries
+        """
+        try:
+            return self.arrS3.open_file(key=path)
+        except Exception as e:
+            self.logger.error(f"Exception opening file {path} - {e}")
+            return None, 0
+
+    def _open_sequential(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for sequential reading by a single streaming GET request
+        :param path: file path
+        :return: binary stream (None in the case of failure) and number of retries
+        """
+        try:
+            return self.arrS3.open_stream(key=path)
+        except Exception as e:
+            self.logger.error(f"Exception opening file {path} - {e}")
+            return None, 0
+
+    def open_output_stream(self, path: str) -> tuple[Any, int]:
+        """
+        Open file for sequential writing by a multipart upload (see S3OutputStream)
+        :param path: file path
+        :return: output stream and number of retries
+        """
+        return self.arrS3.open_output_stream(key=path)
 
     def save_file(self, path: str, data: bytes) -> tuple[dict[str, Any], int]:
         """
         Save byte array
         :param path: file's path
-        :param data: byte array
+        :param data: byte array or other bytes-like object (pa.Buffer, memoryview)
         :return: a dictionary as
         defined https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/client/put_object.html
         in the case of failure dict is None and number of retries
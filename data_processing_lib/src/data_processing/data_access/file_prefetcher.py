@@ -0,0 +1,156 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Union
+
+from data_processing.utils import get_logger
+
+
+class FilePrefetcher:
+    """
+    Class reading input files ahead of their processing. While the current file is transformed,
+    up to depth following files are read in the background. The size of every file is reserved,
+    when its read is started, and released, when the file is consumed, so that the files read or being
+    read, that were not consumed yet, do not exceed max_bytes (a single file larger than max_bytes is
+    still read, when nothing else is prefetched). Sizes are taken from the listing, if the files are
+    passed as listing entries. Files passed by name (without additional requests for their sizes) reserve
+    the largest size read so far, or max_bytes before any file is read, and their reservation is corrected
+    to the actual size, once they are read
+    """
+
+    def __init__(
+        self,
+        data_access: Any,
+        files: Iterable[Union[str, dict[str, Any]]],
+        depth: int,
+        max_bytes: int,
+    ):
+        """
+        Initialization
+        :param data_access: data access (DataAccess) used for reading files
+        :param files: files to process (can be a lazy iterator) - file names or listing entries,
+                      dictionaries with "name" and "size" keys
+        :param depth: maximum number of files read in the background
+        :param max_bytes: maximum size of the prefetched files, that were not consumed yet
+        """
+        self.logger = get_logger(__name__)
+        self.data_access = data_access
+        self.files = iter(files)
+        self.depth = max(depth, 1)
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.depth, thread_name_prefix="prefetch"
+        )
+        # files, which reads are started, in the processing order
+        self.pending = deque()
+        self.reads = {}
+        # sizes reserved by the started reads
+        self.reserved = {}
+        # started reads, which reserved sizes are estimated
+        self.estimated = set()
+        # largest known file size
+        self.largest = 0
+        # next file (name and size), that did not fit into max_bytes yet
+        self.deferred = None
+
+    def next_file(self) -> str:
+        """
+        Get the next file to process, starting background reads of the following ones
+        :return: file name or None if there are no more files
+        """
+        self._fill()
+        if len(self.pending) == 0:
+            return None
+        return self.pending.popleft()
+
+    def get_file(self, path: str) -> tuple[bytes, int]:
+        """
+        Get content of the file, waiting for its read completion if necessary
+        :param path: file path
+        :return: bytes array of file content and number of operation retries
+        """
+        read = self.reads.pop(path, None)
+        self.reserved.pop(path, None)
+        self.estimated.discard(path)
+        if read is None:
+            # file was not prefetched
+            return self.data_access.get_file(path=path)
+        # start reading the following files before waiting for this one
+        self._fill()
+        try:
+            return read.result()
+        except Exception as e:
+            self.logger.error(f"Exception prefetching file {path} - {e}")
+            return None, 0
+
+    def close(self) -> None:
+        """
+        Cancel the remaining reads and release threads
+        :return: None
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.pending.clear()
+        self.reads.clear()
+        self.reserved.clear()
+        self.estimated.clear()
+        self.deferred = None
+
+    def _get_size(
+        self, file: Union[str, dict[str, Any]]
+    ) -> tuple[str, Union[int, None]]:
+        """
+        Get name and size of the file to prefetch
+        :param file: file name or listing entry
+        :return: file name and size, None for files passed by name
+        """
+        if isinstance(file, dict):
+            size = int(file["size"])
+            self.largest = max(self.largest, size)
+            return str(file["name"]), size
+        return file, None
+
+    def _update_estimated(self) -> None:
+        """
+        Replace estimated sizes of the completed reads with the actual ones
+        :return: None
+        """
+        for path in [path for path in self.estimated if self.reads[path].done()]:
+            self.estimated.discard(path)
+            try:
+                data, _ = self.reads[path].result()
+            except Exception:
+                data = None
+            size = len(data) if data is not None else 0
+            self.reserved[path] = size
+            self.largest = max(self.largest, size)
+
+    def _fill(self) -> None:
+        """
+        Start background reads up to the depth, unless the reserved size of the prefetched files
+        exceeds max_bytes
+        :return: None
+        """
+        self._update_estimated()
+        while len(self.reads) < self.depth:
+            if self.deferred is None:
+                file = next(self.files, None)
+                if file is None:
+                    return
+                self.deferred = self._get_size(file=file)
+            path, size = self.deferred
+            estimated = size is None
+            if estimated:
+                size = self.largest if self.largest > 0 else self.max_bytes
+            if (
+                len(self.reads) > 0
+                and sum(self.reserved.values()) + size > self.max_bytes
+            ):
+                # the file is read, once enough of the prefetched files are consumed
+                return
+            self.deferred = None
+            self.pending.append(path)
+            self.reserved[path] = size
+            if estimated:
+                self.estimated.add(path)
+            self.reads[path] = self.executor.submit(
+                self.data_access.get_file, path=path
+            )
@@ -0,0 +1,265 @@
+import atexit
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterator
+
+from data_processing.utils import get_logger
+
+
+logger = get_logger(__name__)
+
+# size of the segment header, holding the size of the index
+_HEADER = 8
+# stores of the current process by name
+_stores: dict[str, "MemoryStore"] = {}
+_stores_lock = threading.Lock()
+
+
+class MemoryStore:
+    """
+    In memory file store, used by DataAccessMemory. Input files are published once, as a single
+    read-only shared memory segment containing an index (file names, offsets and sizes) followed by
+    the files content. All processes of the node (Python pool workers, Ray actors) attach to the segment
+    by its name and read files from it without copying them. Files saved by a process are kept in the
+    memory of this process, or only their sizes are kept, if their content is discarded, so outputs are
+    not visible to other processes. Stores are shared within a process, see get_store
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialization
+        :param name: store name, also the name of the shared memory segment
+        """
+        self.name = name
+        self.segment = None
+        self.owner = False
+        # published files - offset and size in the segment
+        self.index = {}
+        # files saved by this process
+        self.files = {}
+        # sizes of files saved by this process with discarded content
+        self.sizes = {}
+        self.lock = threading.Lock()
+
+    def __reduce__(self):
+        # pickled stores (for example as part of file processors) resolve to the store of the process
+        return get_store, (self.name,)
+
+    def publish(self, files: dict[str, bytes]) -> None:
+        """
+        Publish input files as a shared memory segment. Segments are created and completed under the
+        creation lock of the store, so processes publishing the store concurrently (for example Ray
+        actors and the driver) wait for the first one. If the segment already exists (published by
+        another process), it is attached instead. An incomplete segment, left by a publishing process
+        killed before completing it (which releases the lock), is removed and published again
+        :param files: dictionary of file names and content
+        :return: None
+        """
+        index = {}
+        offset = 0
+        for path, data in files.items():
+            size = memoryview(data).nbytes
+            index[path] = (offset, size)
+            offset += size
+        header = json.dumps(index).encode()
+        segment_size = _HEADER + len(header) + max(offset, 1)
+        with _creation_lock(name=self.name):
+            if self.attach():
+                return
+            try:
+                segment = shared_memory.SharedMemory(
+                    name=self.name, create=True, size=segment_size
+                )
+            except FileExistsError:
+                logger.warning(f"Removing incomplete memory store {self.name}")
+                stale = shared_memory.SharedMemory(name=self.name, create=False)
+                stale.close()
+                # unlink unregisters the segment from the resource tracker
+                stale.unlink()
+                segment = shared_memory.SharedMemory(
+                    name=self.name, create=True, size=segment_size
+                )
+            start = _HEADER + len(header)
+            for path, data in files.items():
+                position, size = index[path]
+                segment.buf[start + position : start + position + size] = memoryview(
+                    data
+                ).cast("B")
+            segment.buf[_HEADER:start] = header
+            # the index size is written last, marking the segment as complete
+            segment.buf[:_HEADER] = len(header).to_bytes(_HEADER, "little")
+            # the segment is removed by close, not by the resource tracker when the process exits
+            resource_tracker.unregister(segment._name, "shared_memory")
+        self._set_segment(segment=segment, header_size=len(header), index=index)
+        self.owner = True
+        atexit.register(self.close)
+        logger.info(
+            f"Memory store {self.name} published {len(index)} files, {offset} bytes"
+        )
+
+    def attach(self) -> bool:
+        """
+        Attach to the segment published by another process. A segment without index is not waited
+        for here - it is either being published (publish waits for its completion) or left by a
+        publishing process killed before completing it (publish replaces it)
+        :return: True if attached, False if the segment does not exist or is incomplete
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=self.name, create=False)
+        except FileNotFoundError:
+            return False
+        # the segment is owned (and removed) by the publishing process
+        resource_tracker.unregister(segment._name, "shared_memory")
+        header_size = int.from_bytes(segment.buf[:_HEADER], "little")
+        if header_size == 0:
+            segment.close()
+            return False
+        index = json.loads(bytes(segment.buf[_HEADER : _HEADER + header_size]))
+        self._set_segment(segment=segment, header_size=header_size, index=index)
+        return True
+
+    def _set_segment(
+        self,
+        segment: shared_memory.SharedMemory,
+        header_size: int,
+        index: dict[str, Any],
+    ) -> None:
+        """
+        Set the segment of published files
+        :param segment: shared memory segment
+        :param header_size: size of the index
+        :param index: index of files
+        :return: None
+        """
+        start = _HEADER + header_size
+        self.index = {
+            path: (start + offset, size) for path, (offset, size) in index.items()
+        }
+        self.segment = segment
+
+    def is_published(self) -> bool:
+        """
+        Check whether input files are available
+        :return: True if the store is published or attached
+        """
+        return self.segment is not None
+
+    def get(self, path: str) -> Any:
+        """
+        Get file content
+        :param path: file name
+        :return: memoryview of the published file, content of the saved file or None if the file does not
+                 exist or its content was discarded
+        """
+        with self.lock:
+            if path in self.sizes:
+                return None
+            data = self.files.get(path, None)
+        if data is not None:
+            return data
+        location = self.index.get(path, None)
+        if location is None:
+            return None
+        offset, size = location
+        return self.segment.buf[offset : offset + size]
+
+    def put(self, path: str, data: bytes, discard: bool = False) -> None:
+        """
+        Save file in the memory of this process
+        :param path: file name
+        :param data: file content
+        :param discard: flag to keep only the file name and size, discarding the content
+        :return: None
+        """
+        with self.lock:
+            if discard:
+                self.files.pop(path, None)
+                self.sizes[path] = memoryview(data).nbytes
+            else:
+                self.sizes.pop(path, None)
+                self.files[path] = data
+
+    def list(self, prefix: str) -> list[tuple[str, int]]:
+        """
+        List files
+        :param prefix: prefix of the file names
+        :return: sorted list of file names and sizes
+        """
+        files = {
+            path: size
+            for path, (_, size) in self.index.items()
+            if path.startswith(prefix)
+        }
+        with self.lock:
+            files |= {
+                path: memoryview(data).nbytes
+                for path, data in self.files.items()
+                if path.startswith(prefix)
+            }
+            files |= {
+                path: size
+                for path, size in self.sizes.items()
+                if path.startswith(prefix)
+            }
+        return sorted(files.items())
+
+    def close(self) -> None:
+        """
+        Release the segment, removing it if this process published it. Published files can not
+        be read after that
+        :return: None
+        """
+        if self.segment is None:
+            return
+        self.index = {}
+        try:
+            self.segment.close()
+        except BufferError:
+            # content is still referenced, the mapping is released with the process
+            pass
+        if self.owner:
+            # unlink unregisters the segment from the resource tracker
+            resource_tracker.register(self.segment._name, "shared_memory")
+            self.segment.unlink()
+        self.segment = None
+
+
+@contextmanager
+def _creation_lock(name: str) -> Iterator[None]:
+    """
+    Lock creation of the store segment across the processes of the node. The lock is released when
+    the locking process exits, so a killed publisher does not block the others
+    :param name: store name
+    :return: context holding the lock
+    """
+    fd = os.open(
+        os.path.join(tempfile.gettempdir(), f"{name}.lock"), os.O_CREAT | os.O_RDWR
+    )
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # closing the file releases the lock
+        os.close(fd)
+
+
+def get_store(name: str) -> MemoryStore:
+    """
+    Get store of the current process, creating it if it does not exist. If the store was not
+    published by this process, it is attached to the segment published by another one, if it exists
+    :param name: store name
+    :return: memory store
+    """
+    with _stores_lock:
+        store = _stores.get(name, None)
+        if store is None:
+            store = MemoryStore(name=name)
+            # not published (or incomplete) stores are published by their first user
+            store.attach()
+            _stores[name] = store
+        return store
@@ -0,0 +1,173 @@
+import io
+import os
+import tempfile
+from typing import Any
+
+import pyarrow as pa
+from data_processing.utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class OutputStream(io.RawIOBase):
+    """
+    Write only stream of a file, returned by DataAccess.open_output_stream, so that large files can be
+    written incrementally, without keeping their content in memory. The file is created by close, which
+    sets result to a dictionary with the file name and size (None if the write failed), and discarded by
+    abort. Retries of the write requests are accumulated in retries
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialization
+        :param path: file path
+        """
+        super().__init__()
+        self.path = path
+        self.size = 0
+        self.result = None
+        self.retries = 0
+
+    def __del__(self):
+        # streams, which were neither closed nor aborted, are discarded, not completed
+        self.abort()
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.size
+
+    def write(self, data: Any) -> int:
+        if self.closed:
+            raise ValueError(f"write to closed output stream of file {self.path}")
+        view = memoryview(data).cast("B")
+        self._write(data=view)
+        self.size += view.nbytes
+        return view.nbytes
+
+    def close(self) -> None:
+        """
+        Complete the file
+        :return: None
+        """
+        if self.closed:
+            return
+        try:
+            self.result = self._complete()
+        except Exception as e:
+            logger.error(f"Failed to complete file {self.path}: {e}")
+            self.result = None
+            self._discard()
+        finally:
+            super().close()
+
+    def abort(self) -> None:
+        """
+        Discard the written content, without creating the file
+        :return: None
+        """
+        if self.closed:
+            return
+        try:
+            self._discard()
+        finally:
+            super().close()
+
+    def _discard(self) -> None:
+        """
+        Discard the written content, ignoring failures
+        :return: None
+        """
+        try:
+            self._abort()
+        except Exception as e:
+            logger.warning(f"Failed to discard partially written file {self.path}: {e}")
+
+    def _write(self, data: memoryview) -> None:
+        """
+        Write data. The data can be reused by the caller after the invocation
+        :param data: data
+        :return: None
+        """
+        raise NotImplementedError("Subclasses should implement this!")
+
+    def _complete(self) -> dict[str, Any]:
+        """
+        Complete the file
+        :return: dictionary with "name" and "size" keys, None in the case of failure
+        """
+        raise NotImplementedError("Subclasses should implement this!")
+
+    def _abort(self) -> None:
+        """
+        Discard the written content
+        :return: None
+        """
+        raise NotImplementedError("Subclasses should implement this!")
+
+
+class BufferedOutputStream(OutputStream):
+    """
+    Output stream keeping the content in memory and saving it by DataAccess.save_file on close. Used by
+    data accesses, which can not write files incrementally
+    """
+
+    def __init__(self, data_access: Any, path: str):
+        """
+        Initialization
+        :param data_access: data access (DataAccess) saving the file
+        :param path: file path
+        """
+        super().__init__(path=path)
+        self.data_access = data_access
+        self.sink = pa.BufferOutputStream()
+
+    def _write(self, data: memoryview) -> None:
+        self.sink.write(data)
+
+    def _complete(self) -> dict[str, Any]:
+        result, retries = self.data_access.save_file(
+            path=self.path, data=self.sink.getvalue()
+        )
+        self.retries += retries
+        self.sink = None
+        if result is None:
+            return None
+        return {"name": self.path, "size": self.size}
+
+    def _abort(self) -> None:
+        self.sink = None
+
+
+class LocalOutputStream(OutputStream):
+    """
+    Output stream of a local file. Content is written to a temporary file in the target folder, which
+    is renamed to the file on close, so that partially written files are never listed
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialization
+        :param path: file path
+        """
+        super().__init__(path=path)
+        folder, name = os.path.split(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        fd, self.temp_path = tempfile.mkstemp(
+            dir=folder, prefix=f".{name}.", suffix=".tmp"
+        )
+        self.file = os.fdopen(fd, "wb")
+
+    def _write(self, data: memoryview) -> None:
+        self.file.write(data)
+
+    def _complete(self) -> dict[str, Any]:
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+        return {"name": self.path, "size": self.size}
+
+    def _abort(self) -> None:
+        self.file.close()
+        os.remove(self.temp_path)
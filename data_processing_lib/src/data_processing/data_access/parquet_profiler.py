@@ -0,0 +1,200 @@
+import argparse
+import json
+import math
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pyarrow.parquet as pq
+from data_processing.data_access.data_access import DataAccess
+from data_processing.utils import KB, MB, get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ParquetProfiler:
+    """
+    Class profiling a parquet data set based on the file footers only. Footers are read through
+    DataAccess.open_file, so for S3 and Hugging Face only a tail range of every file is fetched.
+    Unlike DataAccess.sample_input_data, which reads and decodes a few random files, this gives exact
+    row counts and sizes for all files (or a random sample of them, chosen without replacement),
+    schema consistency of the data set and distributions of file sizes and row counts.
+    """
+
+    def __init__(self, data_access: DataAccess, workers: int = 16):
+        """
+        Initialization
+        :param data_access: data access used for listing and reading files
+        :param workers: number of footers read concurrently
+        """
+        self.data_access = data_access
+        self.workers = max(workers, 1)
+
+    def profile(
+        self, path: str = None, n_files: int = -1
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Profile parquet files of the folder
+        :param path: folder to profile, input folder of the data access by default
+        :param n_files: number of randomly chosen files to profile, non positive value for all files
+        :return: profile dictionary and number of operation retries
+        """
+        if path is None:
+            path = self.data_access.get_input_folder()
+        files, _, retries = self.data_access.get_files_folder(
+            path=path, files_to_use=[".parquet"], cm_files=-1
+        )
+        sizes = {file["name"]: file["size"] for file in files}
+        names = list(sizes)
+        if 0 < n_files < len(names):
+            names = random.sample(names, n_files)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            footers = list(executor.map(self._read_footer, names))
+        rows = []
+        compressed = []
+        uncompressed = []
+        schemas = {}
+        failed = 0
+        for name, (footer, r) in zip(names, footers):
+            retries += r
+            if footer is None:
+                failed += 1
+                continue
+            rows.append(footer["rows"])
+            compressed.append(footer["compressed"])
+            uncompressed.append(footer["uncompressed"])
+            schema = schemas.setdefault(footer["schema"], {"files": 0, "example": name})
+            schema["files"] += 1
+        profiled = len(rows)
+        total_rows = sum(rows)
+        profile = {
+            "files": len(sizes),
+            "profiled files": profiled,
+            "failed files": failed,
+            "total file size MB": sum(sizes.values()) / MB,
+            "rows": total_rows,
+            "compressed size MB": sum(compressed) / MB,
+            "uncompressed size MB": sum(uncompressed) / MB,
+            "average doc size KB": sum(uncompressed) / total_rows / KB
+            if total_rows > 0
+            else 0,
+            "schema consistent": len(schemas) <= 1,
+            "schemas": [
+                {"schema": json.loads(schema)} | info
+                for schema, info in sorted(
+                    schemas.items(), key=lambda s: s[1]["files"], reverse=True
+                )
+            ],
+            "file size histogram MB": self._histogram(
+                [sizes[name] / MB for name in names]
+            ),
+            "rows histogram": self._histogram(rows),
+        }
+        if len(names) < len(sizes) and profiled > 0:
+            # files are sampled, rows of the data set are estimated
+            profile["estimated rows"] = total_rows * len(sizes) / profiled
+        return profile, retries
+
+    def _read_footer(self, path: str) -> tuple[dict[str, Any], int]:
+        """
+        Read parquet footer of the file
+        :param path: file path
+        :return: footer summary (rows, sizes and schema) or None in the case of failure and number of retries
+        """
+        try:
+            source, retries = self.data_access.open_file(path=path)
+        except Exception as e:
+            # for example, the file was removed after listing
+            logger.warning(f"Failed to open {path}: {e}")
+            return None, 0
+        if source is None:
+            return None, retries
+        try:
+            metadata = pq.read_metadata(source)
+            compressed = 0
+            uncompressed = 0
+            for i in range(metadata.num_row_groups):
+                row_group = metadata.row_group(i)
+                uncompressed += row_group.total_byte_size
+                for column in range(row_group.num_columns):
+                    compressed += row_group.column(column).total_compressed_size
+            schema = metadata.schema.to_arrow_schema()
+            footer = {
+                "rows": metadata.num_rows,
+                "compressed": compressed,
+                "uncompressed": uncompressed,
+                "schema": json.dumps({f.name: str(f.type) for f in schema}),
+            }
+        except Exception as e:
+            logger.warning(f"Failed to read parquet footer of {path}: {e}")
+            footer = None
+        finally:
+            source.close()
+        return footer, retries + getattr(source, "retries", 0)
+
+    @staticmethod
+    def _histogram(values: list[float]) -> dict[str, int]:
+        """
+        Build histogram with power of 2 buckets
+        :param values: values
+        :return: dictionary of bucket upper bounds and number of values in the bucket
+        """
+        buckets = {}
+        for value in values:
+            bucket = 2 ** math.ceil(math.log2(value)) if value > 0 else 0
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+        return {f"<= {bucket:g}": buckets[bucket] for bucket in sorted(buckets)}
+
+
+def main(args: list[str] = None) -> dict[str, Any]:
+    """
+    Profile parquet data set defined by data access parameters, for example
+        python -m data_processing.data_access.parquet_profiler --data_local_config "{'input_folder': 'input', 'output_folder': 'output'}"
+    The profile is printed as JSON and, if requested, saved to a local file
+    :param args: command line arguments, sys.argv by default
+    :return: profile dictionary
+    """
+    # the factory imports all data accesses
+    from data_processing.data_access import DataAccessFactory
+
+    parser = argparse.ArgumentParser(
+        description="Profile parquet data set using file footers"
+    )
+    daf = DataAccessFactory()
+    daf.add_input_params(parser=parser)
+    parser.add_argument(
+        "--profile_workers", type=int, default=16, help="number of concurrent reads"
+    )
+    parser.add_argument(
+        "--profile_files",
+        type=int,
+        default=-1,
+        help="number of randomly chosen files to profile, all files by default",
+    )
+    parser.add_argument(
+        "--profile_output",
+        type=str,
+        default=None,
+        help="local file to save the profile JSON to",
+    )
+    parsed = parser.parse_args(args=args)
+    if not daf.apply_input_params(args=parsed):
+        raise ValueError("invalid data access parameters")
+    data_access = daf.create_data_access()
+    profile, retries = ParquetProfiler(
+        data_access=data_access, workers=parsed.profile_workers
+    ).profile(n_files=parsed.profile_files)
+    if retries > 0:
+        profile["data access retries"] = retries
+    content = json.dumps(profile, indent=2)
+    print(content)
+    if parsed.profile_output is not None:
+        with open(parsed.profile_output, "w") as f:
+            f.write(content)
+    return profile
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,179 @@
+import os
+import threading
+from typing import Any, Union
+
+import boto3
+from botocore.config import Config
+from data_processing.utils import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class S3ClientPool:
+    """
+    Process wide cache of boto3 S3 clients. Boto3 clients are thread safe, but expensive to create
+    (loading of the service model, credentials resolution), so all the data accesses of the process
+    using the same credentials, endpoint and client configuration share a single client and its
+    connection pool. Cached clients are dropped in forked processes, as their connections can not be
+    shared with the parent
+    """
+
+    # default size of the connection pool of a client (botocore default is 10)
+    MAX_POOL_CONNECTIONS = 50
+
+    _clients: dict[tuple, Any] = {}
+    _lock = threading.Lock()
+    # totals of the process
+    _counts = {"s3 clients created": 0, "s3 client reuses": 0, "s3 requests": 0}
+    # totals returned by the previous get_stats invocation
+    _reported = {}
+
+    @classmethod
+    def get_client(
+        cls,
+        access_key: str,
+        secret_key: str,
+        endpoint: str = None,
+        region: str = None,
+        max_attempts: int = 10,
+        max_pool_connections: int = MAX_POOL_CONNECTIONS,
+        tcp_keepalive: bool = True,
+        connect_timeout: float = 60,
+        read_timeout: float = 60,
+    ) -> Any:
+        """
+        Get S3 client, creating it on the first request for the given parameters
+        :param access_key: s3 access key
+        :param secret_key: s3 secret key
+        :param endpoint: s3 endpoint
+        :param region: s3 region
+        :param max_attempts: boto s3 client internal retries
+        :param max_pool_connections: maximum number of connections kept in the client pool, limiting the
+               number of concurrent requests of the client
+        :param tcp_keepalive: flag to enable TCP keep-alive probes on the pooled connections
+        :param connect_timeout: timeout (in sec) of establishing a connection
+        :param read_timeout: timeout (in sec) of reading from a connection
+        :return: boto3 S3 client
+        """
+        key = (
+            access_key,
+            secret_key,
+            endpoint,
+            region,
+            max_attempts,
+            max_pool_connections,
+            tcp_keepalive,
+            connect_timeout,
+            read_timeout,
+        )
+        with cls._lock:
+            client = cls._clients.get(key, None)
+            if client is not None:
+                cls._counts["s3 client reuses"] += 1
+                return client
+            client = boto3.client(
+                service_name="s3",
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                endpoint_url=endpoint,
+                region_name=region,
+                config=Config(
+                    retries={"max_attempts": max_attempts, "mode": "standard"},
+                    max_pool_connections=max_pool_connections,
+                    tcp_keepalive=tcp_keepalive,
+                    connect_timeout=connect_timeout,
+                    read_timeout=read_timeout,
+                ),
+            )
+            # count HTTP requests (including retries) of the client
+            client.meta.events.register("before-send.s3", cls._count_request)
+            cls._clients[key] = client
+            cls._counts["s3 clients created"] += 1
+            logger.debug(
+                f"Created S3 client for endpoint {endpoint}, pool size {max_pool_connections}"
+            )
+            return client
+
+    @classmethod
+    def _count_request(cls, **kwargs) -> None:
+        """
+        Count a request sent by a client (botocore before-send event handler)
+        :param kwargs: event arguments
+        :return: None, so that the request is sent
+        """
+        with cls._lock:
+            cls._counts["s3 requests"] += 1
+
+    @classmethod
+    def get_stats(cls) -> dict[str, int]:
+        """
+        Get statistics of the clients of the process accumulated since the previous invocation, so
+        that they can be published by every processor of the process
+        :return: dictionary of non zero values of:
+            s3 clients created - number of created clients
+            s3 client reuses - number of requests for a client served by the cached ones
+            s3 requests - number of HTTP requests sent by the clients
+            s3 connections - number of connections opened by the client pools (not reported, if the
+                             pools can not be accessed)
+        """
+        with cls._lock:
+            clients = list(cls._clients.values())
+            totals = dict(cls._counts)
+        connections = cls._get_connections(clients=clients)
+        if connections is not None:
+            totals["s3 connections"] = connections
+        stats = {}
+        with cls._lock:
+            for key, total in totals.items():
+                value = total - cls._reported.get(key, 0)
+                if value > 0:
+                    stats[key] = value
+                    cls._reported[key] = total
+        return stats
+
+    @staticmethod
+    def _get_connections(clients: list[Any]) -> Union[int, None]:
+        """
+        Get number of connections opened by the urllib3 connection pools of the clients. The pools
+        are internals of botocore, so any failure to access them is ignored
+        :param clients: boto3 clients
+        :return: number of connections, None if the pools can not be accessed
+        """
+        connections = 0
+        try:
+            for client in clients:
+                manager = client._endpoint.http_session._manager
+                for key in list(manager.pools.keys()):
+                    connections += manager.pools[key].num_connections
+        except Exception as e:
+            logger.debug(f"Can not access S3 client connection pools: {e}")
+            return None
+        return connections
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop cached clients and reset the statistics
+        :return: None
+        """
+        with cls._lock:
+            cls._clients = {}
+            cls._counts = dict.fromkeys(cls._counts, 0)
+            cls._reported = {}
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        """
+        Reset the cache in a forked process. Connections of the parent process can not be used by
+        the child and the lock could have been held by another thread of the parent
+        :return: None
+        """
+        cls._lock = threading.Lock()
+        cls._clients = {}
+        cls._counts = dict.fromkeys(cls._counts, 0)
+        cls._reported = {}
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=S3ClientPool._after_fork)
@@ -46,21 +46,23 @@ class NOOPFolderTransform(AbstractFolderTransform):
         """
         logger.debug(f"Transforming one folder {folder_name}")
         metadata = {}
-        # get folder files
-        files, retries = self.data_access.get_folder_files(path=folder_name)
-        if retries > 0:
-            metadata |= {"data access retries": retries}
-        result = [()] * len(files)
-        index = 0
-        for name, file in files.items():
-            result[index] = (file, self.data_access.get_output_location(name))
+        # files are read in the background, while the previous ones are processed
+        result = []
+        retries = 0
+        for name, file, r in self.data_access.iterate_folder_files(path=folder_name):
+            retries += r
             if self.sleep is not None:
                 logger.info(f"Sleep for {self.sleep} seconds")
                 time.sleep(self.sleep)
                 logger.info("Sleep completed - continue")
-            index += 1
+            if file is None:
+                # failed read
+                continue
+            result.append((file, self.data_access.get_output_location(name)))
+        if retries > 0:
+            metadata |= {"data access retries": retries}
         # Add some sample metadata.
-        metadata |= {"nfiles": len(files)}
+        metadata |= {"nfiles": len(result)}
         return result, metadata
 
 
@@ -2,6 +2,7 @@ from data_processing.runtime.execution_configuration import (
     TransformExecutionConfiguration as TransformExecutionConfiguration,
     runtime_cli_prefix as runtime_cli_prefix,
 )
+from data_processing.runtime.output_writer import OutputWriter as OutputWriter
 from data_processing.runtime.transform_file_processor import (
     AbstractTransformFileProcessor as AbstractTransformFileProcessor,
 )
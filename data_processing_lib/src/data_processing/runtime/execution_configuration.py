@@ -1,6 +1,6 @@
 import argparse
 
-from data_processing.utils import CLIArgumentProvider, get_logger
+from data_processing.utils import GB, MB, CLIArgumentProvider, get_logger
 
 
 logger = get_logger(__name__)
@@ -22,6 +22,12 @@ class TransformExecutionConfiguration(CLIArgumentProvider):
         """
         super().__init__()
         self.job_details = {}
+        self.prefetch_depth = 0
+        self.prefetch_max_bytes = 256 * MB
+        self.write_workers = 0
+        self.write_max_bytes = 256 * MB
+        self.streaming_threshold = GB
+        self.streaming_batch_bytes = 64 * MB
         self.name = name
         self.print_params = print_params
 
@@ -37,6 +43,45 @@ class TransformExecutionConfiguration(CLIArgumentProvider):
             default="preprocessing",
             help="job category",
         )
+        parser.add_argument(
+            f"--{runtime_cli_prefix}prefetch_depth",
+            type=int,
+            default=0,
+            help="number of input files read in the background by every worker, while the current "
+            "file is transformed. 0 disables prefetching",
+        )
+        parser.add_argument(
+            f"--{runtime_cli_prefix}prefetch_max_bytes",
+            type=int,
+            default=256 * MB,
+            help="maximum size of prefetched, not yet processed input files for every worker",
+        )
+        parser.add_argument(
+            f"--{runtime_cli_prefix}write_workers",
+            type=int,
+            default=0,
+            help="number of concurrent background writes of output files for every worker. "
+            "0 writes output files synchronously",
+        )
+        parser.add_argument(
+            f"--{runtime_cli_prefix}write_max_bytes",
+            type=int,
+            default=256 * MB,
+            help="maximum size of output files queued for background writing for every worker",
+        )
+        parser.add_argument(
+            f"--{runtime_cli_prefix}streaming_threshold",
+            type=int,
+            default=GB,
+            help="size of input files, above which streaming table transforms process them batch by "
+            "batch instead of loading them whole. 0 disables streaming",
+        )
+        parser.add_argument(
+            f"--{runtime_cli_prefix}streaming_batch_bytes",
+            type=int,
+            default=64 * MB,
+            help="approximate size of the decoded data of a batch passed to streaming table transforms",
+        )
 
     def apply_input_params(self, args: argparse.Namespace) -> bool:
         """
@@ -53,6 +98,26 @@ class TransformExecutionConfiguration(CLIArgumentProvider):
             "job name": self.name,
             "job type": "pure python",
         }
+        self.prefetch_depth = captured["prefetch_depth"]
+        self.prefetch_max_bytes = captured["prefetch_max_bytes"]
+        self.write_workers = captured["write_workers"]
+        self.write_max_bytes = captured["write_max_bytes"]
+        self.streaming_threshold = captured["streaming_threshold"]
+        self.streaming_batch_bytes = captured["streaming_batch_bytes"]
+        if self.streaming_batch_bytes <= 0:
+            logger.error(
+                f"streaming batch bytes {self.streaming_batch_bytes} has to be positive"
+            )
+            return False
+        if self.prefetch_depth > 0:
+            logger.info(
+                f"prefetching {self.prefetch_depth} files, up to {self.prefetch_max_bytes} bytes"
+            )
+        if self.write_workers > 0:
+            logger.info(
+                f"writing output files with {self.write_workers} background writers, "
+                f"up to {self.write_max_bytes} bytes"
+            )
         # print parameters
         if self.print_params:
             logger.info(f"job details {self.job_details}")
@@ -0,0 +1,97 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from data_processing.data_access import DataAccess
+from data_processing.utils import get_logger
+
+
+class OutputWriter:
+    """
+    Class implementing write-behind of the output files. Files are saved by a pool of threads,
+    while the caller continues processing. The size of the files queued for writing is bounded
+    by max_bytes - save_file blocks until there is enough room. Results of the writes are
+    accumulated and returned by get_stats, so that they can be published by the caller's thread
+    """
+
+    def __init__(self, data_access: DataAccess, workers: int, max_bytes: int):
+        """
+        Initialization
+        :param data_access: data access used for writing files
+        :param workers: number of concurrent writes
+        :param max_bytes: maximum size of the files queued for writing
+        """
+        self.logger = get_logger(__name__)
+        self.data_access = data_access
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="writer"
+        )
+        self.condition = threading.Condition()
+        self.queued_bytes = 0
+        self.pending = 0
+        self.retries = 0
+        self.failed_writes = 0
+
+    def save_file(self, path: str, data: bytes) -> None:
+        """
+        Queue file for writing. Blocks while the queued files exceed max_bytes
+        :param path: file path
+        :param data: file content
+        :return: None
+        """
+        size = len(data)
+        with self.condition:
+            # a single file larger than max_bytes is still written, when nothing else is queued
+            self.condition.wait_for(
+                lambda: self.pending == 0 or self.queued_bytes + size <= self.max_bytes
+            )
+            self.queued_bytes += size
+            self.pending += 1
+        self.executor.submit(self._save_file, path, data, size)
+
+    def _save_file(self, path: str, data: bytes, size: int) -> None:
+        """
+        Write file (executed by the writer threads)
+        :param path: file path
+        :param data: file content
+        :param size: file size
+        :return: None
+        """
+        try:
+            save_res, retries = self.data_access.save_file(path=path, data=data)
+        except Exception as e:
+            self.logger.warning(f"Exception writing file {path} - {e}")
+            save_res, retries = None, 0
+        if save_res is None:
+            self.logger.warning(f"Failed to write file {path}")
+        with self.condition:
+            self.retries += retries
+            if save_res is None:
+                self.failed_writes += 1
+            self.queued_bytes -= size
+            self.pending -= 1
+            self.condition.notify_all()
+
+    def wait(self) -> None:
+        """
+        Wait for completion of all queued writes
+        :return: None
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.pending == 0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get statistics of the writes completed since the previous invocation
+        :return: statistics dictionary
+        """
+        stats = {}
+        with self.condition:
+            if self.retries > 0:
+                stats["data access retries"] = self.retries
+            if self.failed_writes > 0:
+                stats["failed_writes"] = self.failed_writes
+            self.retries = 0
+            self.failed_writes = 0
+        return stats
@@ -60,4 +60,12 @@ class PythonTransformExecutionConfiguration(TransformExecutionConfiguration):
         get input parameters for job_input_params in metadata
         :return: dictionary of parameters
         """
-        return {"num_processors": self.num_processors}
+        return {
+            "num_processors": self.num_processors,
+            "prefetch_depth": self.prefetch_depth,
+            "prefetch_max_bytes": self.prefetch_max_bytes,
+            "write_workers": self.write_workers,
+            "write_max_bytes": self.write_max_bytes,
+            "streaming_threshold": self.streaming_threshold,
+            "streaming_batch_bytes": self.streaming_batch_bytes,
+        }
@@ -1,9 +1,9 @@
-from typing import Any
+from typing import Any, Iterable
 
 from data_processing.data_access import DataAccessFactory
 from data_processing.runtime import AbstractTransformFileProcessor
 from data_processing.transform import AbstractTransform, TransformStatistics
-from data_processing.utils import UnrecoverableException
+from data_processing.utils import GB, MB, UnrecoverableException
 
 
 class PythonTransformFileProcessor(AbstractTransformFileProcessor):
@@ -18,6 +18,12 @@ class PythonTransformFileProcessor(AbstractTransformFileProcessor):
         transform_params: dict[str, Any],
         transform_class: type[AbstractTransform],
         is_folder: bool,
+        prefetch_depth: int = 0,
+        prefetch_max_bytes: int = 256 * MB,
+        write_workers: int = 0,
+        write_max_bytes: int = 256 * MB,
+        streaming_threshold: int = GB,
+        streaming_batch_bytes: int = 64 * MB,
     ):
         """
         Init method
@@ -26,12 +32,24 @@ class PythonTransformFileProcessor(AbstractTransformFileProcessor):
         :param transform_params - transform parameters
         :param transform_class: transform class
         :param is_folder: folder transform flag
+        :param prefetch_depth: number of input files read in the background
+        :param prefetch_max_bytes: maximum size of prefetched files
+        :param write_workers: number of concurrent background writes
+        :param write_max_bytes: maximum size of output files queued for writing
+        :param streaming_threshold: size of input files, above which streaming transforms process them in batches
+        :param streaming_batch_bytes: approximate size of the decoded data of a streamed batch
         """
         # invoke superclass
         super().__init__(
             data_access_factory=data_access_factory,
             transform_parameters=dict(transform_params),
             is_folder=is_folder,
+            prefetch_depth=prefetch_depth,
+            prefetch_max_bytes=prefetch_max_bytes,
+            write_workers=write_workers,
+            write_max_bytes=write_max_bytes,
+            streaming_threshold=streaming_threshold,
+            streaming_batch_bytes=streaming_batch_bytes,
         )
         self.transform_params["statistics"] = statistics
         # Create local processor
@@ -49,7 +67,9 @@ class PythonTransformFileProcessor(AbstractTransformFileProcessor):
 
 class PythonPoolTransformFileProcessor(AbstractTransformFileProcessor):
     """
-    This is the class implementing the worker class processing of a single file
+    This is the class implementing the worker class processing of a single file. The processor is
+    passed to every pool worker once, by the pool initializer, and preserved between the tasks of the
+    worker, so background writes and writes batched by the data access are completed by flush
     """
 
     def __init__(
@@ -58,6 +78,12 @@ class PythonPoolTransformFileProcessor(AbstractTransformFileProcessor):
         transform_params: dict[str, Any],
         transform_class: type[AbstractTransform],
         is_folder: bool,
+        prefetch_depth: int = 0,
+        prefetch_max_bytes: int = 256 * MB,
+        write_workers: int = 0,
+        write_max_bytes: int = 256 * MB,
+        streaming_threshold: int = GB,
+        streaming_batch_bytes: int = 64 * MB,
     ):
         """
         Init method
@@ -65,32 +91,65 @@ class PythonPoolTransformFileProcessor(AbstractTransformFileProcessor):
         :param transform_params - transform parameters
         :param transform_class: transform class
         :param is_folder: folder transform flag
+        :param prefetch_depth: number of input files read in the background
+        :param prefetch_max_bytes: maximum size of prefetched files
+        :param write_workers: number of concurrent background writes
+        :param write_max_bytes: maximum size of output files queued for writing
+        :param streaming_threshold: size of input files, above which streaming transforms process them in batches
+        :param streaming_batch_bytes: approximate size of the decoded data of a streamed batch
         """
         super().__init__(
             data_access_factory=data_access_factory,
             transform_parameters=dict(transform_params),
             is_folder=is_folder,
+            prefetch_depth=prefetch_depth,
+            prefetch_max_bytes=prefetch_max_bytes,
+            write_workers=write_workers,
+            write_max_bytes=write_max_bytes,
+            streaming_threshold=streaming_threshold,
+            streaming_batch_bytes=streaming_batch_bytes,
         )
         # Add data access and statistics to the processor parameters
         self.transform_params["data_access"] = self.data_access
         self.transform_class = transform_class
         self.transform = None
 
-    def process_file(self, f_name: str) -> dict[str, Any]:
-        # re initialize statistics
-        self.stats = {}
+    def _create_transform(self) -> None:
+        """
+        Create transform, if it does not exist yet. Make sure to do this locally
+        :return: None
+        """
         if self.transform is None:
-            # create transform. Make sure to do this locally
             try:
                 self.transform = self.transform_class(self.transform_params)
             except Exception as e:
                 self.logger.error(f"Exception creating transform  {e}")
                 raise UnrecoverableException("failed creating transform")
+
+    def process_file(self, f_name: str) -> dict[str, Any]:
+        # re initialize statistics
+        self.stats = {}
+        self._create_transform()
         # Invoke superclass method
         super().process_file(f_name=f_name)
         # return collected statistics
         return self.stats
 
+    def process_files(self, f_names: Iterable[str]) -> tuple[int, dict[str, Any]]:
+        """
+        Processing of a batch of files
+        :param f_names: file names
+        :return: number of processed files and collected statistics
+        """
+        f_names = list(f_names)
+        # re initialize statistics
+        self.stats = {}
+        self._create_transform()
+        # Invoke superclass method
+        super().process_files(f_names=f_names)
+        # return collected statistics
+        return len(f_names), self.stats
+
     def flush(self) -> dict[str, Any]:
         # re initialize statistics
         self.stats = {}
@@ -1,8 +1,8 @@
 import os
 import time
 from logging import Logger
-from multiprocessing import Pool
-from typing import Any
+from multiprocessing import Barrier, Pool
+from typing import Any, Generator, Iterable
 
 import psutil
 from data_processing.data_access import DataAccessFactory
@@ -34,6 +34,53 @@ def _execution_resources() -> dict[str, Any]:
     }
 
 
+# file processor of the pool worker process, set by the pool initializer, so that the processor
+# (its transform, staged and background writes) is preserved between the tasks of the worker
+_worker_processor = None
+# barrier of the pool workers, making sure that every worker executes exactly one flush
+_worker_barrier = None
+
+
+def _init_worker(processor: PythonPoolTransformFileProcessor, barrier: Barrier) -> None:
+    """
+    Initialize pool worker process
+    :param processor: file processor
+    :param barrier: barrier of all pool workers
+    :return: None
+    """
+    global _worker_processor, _worker_barrier
+    _worker_processor = processor
+    _worker_barrier = barrier
+
+
+def _process_file(f_name: str) -> dict[str, Any]:
+    """
+    Process file by the processor of the worker
+    :param f_name: file name
+    :return: statistics
+    """
+    return _worker_processor.process_file(f_name=f_name)
+
+
+def _process_files(f_names: Iterable[str]) -> tuple[int, dict[str, Any]]:
+    """
+    Process batch of files by the processor of the worker
+    :param f_names: file names
+    :return: number of processed files and statistics
+    """
+    return _worker_processor.process_files(f_names=f_names)
+
+
+def _flush() -> dict[str, Any]:
+    """
+    Flush the processor of the worker. Waits for all workers to start their flush, so that,
+    when a flush is submitted for every worker, no worker executes two of them
+    :return: statistics
+    """
+    _worker_barrier.wait()
+    return _worker_processor.flush()
+
+
 class PythonTransformOrchestrator(TransformOrchestrator):
     """
     Class implementing transform orchestration for Python
@@ -85,23 +132,36 @@ class PythonTransformOrchestrator(TransformOrchestrator):
             transform_params=self.runtime.get_transform_config(
                 data_access_factory=self.data_access_factory,
                 statistics=self.statistics,
-                files=self.files_to_process,
+                files=self.get_files(),
             ),
             transform_class=self.runtime_config.get_transform_class(),
             is_folder=self.is_folder,
+            prefetch_depth=self.execution_params.prefetch_depth,
+            prefetch_max_bytes=self.execution_params.prefetch_max_bytes,
+            write_workers=self.execution_params.write_workers,
+            write_max_bytes=self.execution_params.write_max_bytes,
+            streaming_threshold=self.execution_params.streaming_threshold,
+            streaming_batch_bytes=self.execution_params.streaming_batch_bytes,
         )
         # process data
         t_start = time.time()
         completed = 0
-        path = self.next_file()
-        while path is not None:
-            executor.process_file(path)
-            completed += 1
-            if completed % self.print_interval == 0:
-                self.logger.info(
-                    f"Completed {completed} files in {round((time.time() - t_start) / 60.0, 3)} min"
-                )
+
+        def _files() -> Generator[str, None, None]:
+            nonlocal completed
             path = self.next_file()
+            while path is not None:
+                yield path
+                completed += 1
+                if completed % self.print_interval == 0:
+                    self.logger.info(
+                        f"Completed {completed} files in {round((time.time() - t_start) / 60.0, 3)} min"
+                    )
+                path = self.next_file()
+
+        # files are pulled one by one, with prefetching the following files are read
+        # while the current one is transformed
+        executor.process_files(f_names=_files())
         self.logger.info(
             f"Done processing {completed} files, waiting for flush() completion."
         )
@@ -120,40 +180,72 @@ class PythonTransformOrchestrator(TransformOrchestrator):
             transform_params=self.runtime.get_transform_config(
                 data_access_factory=self.data_access_factory,
                 statistics=self.statistics,
-                files=self.files_to_process,
+                files=self.get_files(),
             ),
             transform_class=self.runtime_config.get_transform_class(),
             is_folder=self.is_folder,
+            prefetch_depth=self.execution_params.prefetch_depth,
+            prefetch_max_bytes=self.execution_params.prefetch_max_bytes,
+            write_workers=self.execution_params.write_workers,
+            write_max_bytes=self.execution_params.write_max_bytes,
+            streaming_threshold=self.execution_params.streaming_threshold,
+            streaming_batch_bytes=self.execution_params.streaming_batch_bytes,
         )
         completed = 0
         t_start = time.time()
         # create multiprocessing pool
         size = self.execution_params.num_processors
-        with Pool(processes=size) as pool:
+        with Pool(
+            processes=size,
+            initializer=_init_worker,
+            initargs=(processor, Barrier(size)),
+        ) as pool:
             # execute for every input file
-            for result in pool.imap_unordered(
-                processor.process_file, self.files_to_process
-            ):
-                completed += 1
+            # files are pulled lazily, so that with streaming listing processing starts before
+            # the listing completes
+            for n_files, result in self._pool_results(pool=pool):
+                completed += n_files
                 # accumulate statistics
                 self._publish_stats(result)
-                if completed % self.print_interval == 0:
+                if completed % self.print_interval < n_files:
                     # print intermediate statistics
+                    if self.files_batches is None:
+                        progress = f"({round(100 * completed / len(self.files_to_process), 2)}%) "
+                    else:
+                        progress = ""
                     self.logger.info(
-                        f"Completed {completed} files ({round(100 * completed / len(self.files_to_process), 2)}%) "
+                        f"Completed {completed} files {progress}"
                         f"in {round((time.time() - t_start) / 60.0, 3)} min"
                     )
             self.logger.info(
                 f"Done processing {completed} files, waiting for flush() completion."
             )
-            results = [{}] * size
-            # flush
-            for i in range(size):
-                results[i] = pool.apply_async(processor.flush)
+            # flush every worker once - its transform, background writes and batched commits
+            results = [pool.apply_async(_flush) for _ in range(size)]
             for s in results:
                 self._publish_stats(s.get())
         self.logger.info(f"done flushing in {time.time() - t_start} sec")
 
+    def _pool_results(
+        self, pool: Pool
+    ) -> Generator[tuple[int, dict[str, Any]], None, None]:
+        """
+        Submit files to the multiprocessing pool, which workers were initialized with the file processor
+        :param pool: multiprocessing pool
+        :return: generator of the number of processed files and their statistics
+        """
+        if self.execution_params.prefetch_depth > 0 and not self.is_folder:
+            # with prefetching, every worker gets a batch of files, so that it can read
+            # the following files of the batch while transforming the current one
+            batch_size = self.execution_params.prefetch_depth + 1
+            yield from pool.imap_unordered(
+                _process_files,
+                iter(lambda: self.next_files(n_files=batch_size), None),
+            )
+        else:
+            for stats in pool.imap_unordered(_process_file, iter(self.next_file, None)):
+                yield 1, stats
+
     def _publish_stats(self, stats: dict[str, Any]) -> None:
         """
         Publishing execution statistics
@@ -103,4 +103,10 @@ class RayTransformExecutionConfiguration(TransformExecutionConfiguration):
             "number of workers": self.n_workers,
             "worker options": self.worker_options,
             "actor creation delay": self.creation_delay,
+            "prefetch depth": self.prefetch_depth,
+            "prefetch max bytes": self.prefetch_max_bytes,
+            "write workers": self.write_workers,
+            "write max bytes": self.write_max_bytes,
+            "streaming threshold": self.streaming_threshold,
+            "streaming batch bytes": self.streaming_batch_bytes,
         }
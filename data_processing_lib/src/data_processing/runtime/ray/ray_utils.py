@@ -176,6 +176,7 @@ class RayUtils:
         available_memory_gauge: Gauge,
         object_memory_gauge: Gauge,
         logger: logging.Logger,
+        batch_size: int = 1,
     ) -> int:
         """
         Process files
@@ -189,9 +190,47 @@ class RayUtils:
         :param available_memory_gauge: ray Gauge to report available memory
         :param object_memory_gauge: ray Gauge to report available object memory
         :param logger: logger
+        :param batch_size: number of files submitted to an actor at once. If greater than 1,
+               actor's process_files is used, allowing it to prefetch the files of the batch
         :return: number of actors failures
         """
         logger.debug("Begin processing files")
+        if batch_size > 1:
+
+            def next_item() -> list[str]:
+                return file_producer.next_files(n_files=batch_size)
+
+            def submit(a, v):
+                return a.process_files.remote(v)
+
+            def n_files(v) -> int:
+                return len(v)
+
+        else:
+
+            def next_item() -> str:
+                return file_producer.next_file()
+
+            def submit(a, v):
+                return a.process_file.remote(v)
+
+            def n_files(v) -> int:
+                return 1
+
+        # number of files in the submitted requests
+        submitted = 0
+
+        def completed_files(result: Any = None) -> int:
+            # batch requests return the number of processed files. A failed request is accounted as
+            # a full batch, limited by the number of the outstanding files
+            if isinstance(result, int):
+                n = result
+            elif result is None and batch_size > 1:
+                n = batch_size
+            else:
+                n = 1
+            return min(n, submitted - completed)
+
         actor_failures = 0
         RayUtils.get_available_resources(
             available_cpus_gauge=available_cpus_gauge,
@@ -203,17 +242,20 @@ class RayUtils:
         running = 0
         t_start = time.time()
         completed = 0
-        path = file_producer.next_file()
+        n_done = 1
+        path = next_item()
         while path is not None:
+            submitted += n_files(path)
             if executors.has_free():  # still have room
-                executors.submit(lambda a, v: a.process_file.remote(v), path)
+                executors.submit(submit, path)
                 running += 1
                 files_in_progress_gauge.set(running)
             else:  # need to wait for some actors
                 while True:
                     # we can have several workers fail here
                     try:
-                        _ = executors.get_next_unordered()
+                        n_done = completed_files(executors.get_next_unordered())
+                        completed += n_done
                         break
                     except Exception as e:
                         if isinstance(e, RayError):
@@ -223,13 +265,13 @@ class RayUtils:
                             break
                         logger.error(f"Failed to process request worker exception {e}")
                         actor_failures += 1
-                        completed += 1
+                        n_done = completed_files()
+                        completed += n_done
                         break
                 if terminate:
                     raise UnrecoverableException
-                executors.submit(lambda a, v: a.process_file.remote(v), path)
+                executors.submit(submit, path)
 
-                completed += 1
                 files_completed_gauge.set(completed)
                 RayUtils.get_available_resources(
                     available_cpus_gauge=available_cpus_gauge,
@@ -237,11 +279,11 @@ class RayUtils:
                     available_memory_gauge=available_memory_gauge,
                     object_memory_gauge=object_memory_gauge,
                 )
-                if completed % print_interval == 0:
+                if completed % print_interval < n_done:
                     logger.info(
                         f"Completed {completed} files in {round((time.time() - t_start) / 60.0, 3)} min"
                     )
-            path = file_producer.next_file()
+            path = next_item()
         # Wait for completion
         files_completed_gauge.set(completed)
         # Wait for completion
@@ -252,14 +294,13 @@ class RayUtils:
             while True:
                 # we can have several workers fail here
                 try:
-                    executors.get_next_unordered()
+                    completed += completed_files(executors.get_next_unordered())
                     break
                 except Exception as e:
                     logger.error(f"Failed to process request worker exception {e}")
                     actor_failures += 1
-                    completed += 1
+                    completed += completed_files()
             running -= 1
-            completed += 1
             files_in_progress_gauge.set(running)
             files_completed_gauge.set(completed)
             RayUtils.get_available_resources(
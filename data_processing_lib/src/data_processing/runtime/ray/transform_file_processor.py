@@ -2,7 +2,7 @@ from typing import Any
 
 import ray
 from data_processing.runtime import AbstractTransformFileProcessor
-from data_processing.utils import UnrecoverableException
+from data_processing.utils import GB, MB, UnrecoverableException
 
 
 @ray.remote(scheduling_strategy="SPREAD")
@@ -19,11 +19,23 @@ class RayTransformFileProcessor(AbstractTransformFileProcessor):
             transform_class: local transform class
             transform_params: dictionary of parameters for local transform creation
             statistics: object reference to statistics
+            prefetch_depth: number of input files read in the background
+            prefetch_max_bytes: maximum size of prefetched files
+            write_workers: number of concurrent background writes
+            write_max_bytes: maximum size of output files queued for writing
+            streaming_threshold: size of input files, above which streaming transforms process them in batches
+            streaming_batch_bytes: approximate size of the decoded data of a streamed batch
         """
         super().__init__(
             data_access_factory=params.get("data_access_factory", None),
             transform_parameters=dict(params.get("transform_params", {})),
             is_folder=params.get("is_folder", False),
+            prefetch_depth=params.get("prefetch_depth", 0),
+            prefetch_max_bytes=params.get("prefetch_max_bytes", 256 * MB),
+            write_workers=params.get("write_workers", 0),
+            write_max_bytes=params.get("write_max_bytes", 256 * MB),
+            streaming_threshold=params.get("streaming_threshold", GB),
+            streaming_batch_bytes=params.get("streaming_batch_bytes", 64 * MB),
         )
         # Create statistics
         self.stats = params.get("statistics", None)
@@ -38,5 +50,14 @@ class RayTransformFileProcessor(AbstractTransformFileProcessor):
             self.logger.error(f"Exception creating transform  {e}")
             raise UnrecoverableException("failed creating transform")
 
+    def process_files(self, f_names: list[str]) -> int:
+        """
+        Processing of a batch of files
+        :param f_names: file names
+        :return: number of processed files
+        """
+        super().process_files(f_names=f_names)
+        return len(f_names)
+
     def _publish_stats(self, stats: dict[str, Any]) -> None:
         self.stats.add_stats.remote(stats)
@@ -60,10 +60,16 @@ class RayTransformOrchestrator(TransformOrchestrator):
             "transform_params": self.runtime.get_transform_config(
                 data_access_factory=self.data_access_factory,
                 statistics=self.statistics,
-                files=self.files_to_process,
+                files=self.get_files(),
             ),
             "statistics": self.statistics,
             "is_folder": self.is_folder,
+            "prefetch_depth": self.execution_params.prefetch_depth,
+            "prefetch_max_bytes": self.execution_params.prefetch_max_bytes,
+            "write_workers": self.execution_params.write_workers,
+            "write_max_bytes": self.execution_params.write_max_bytes,
+            "streaming_threshold": self.execution_params.streaming_threshold,
+            "streaming_batch_bytes": self.execution_params.streaming_batch_bytes,
         }
         self.logger.debug("Creating actors")
         processors = RayUtils.create_actors(
@@ -100,6 +106,11 @@ class RayTransformOrchestrator(TransformOrchestrator):
             available_memory_gauge=available_memory_gauge,
             object_memory_gauge=available_object_memory_gauge,
             logger=self.logger,
+            # with prefetching, every actor gets a batch of files, so that it can read
+            # the following files of the batch while transforming the current one
+            batch_size=(
+                self.execution_params.prefetch_depth + 1 if not self.is_folder else 1
+            ),
         )
         if failures > 0:
             self._publish_stats({"actor failures": failures})
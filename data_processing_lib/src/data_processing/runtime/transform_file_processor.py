@@ -1,9 +1,20 @@
 import time
 import traceback
-from typing import Any
+from typing import Any, Iterable
 
-from data_processing.data_access import DataAccessFactory
-from data_processing.utils import TransformUtils, UnrecoverableException, get_logger
+from data_processing.data_access import DataAccessFactory, FilePrefetcher
+from data_processing.runtime.output_writer import OutputWriter
+from data_processing.transform import (
+    AbstractStreamingTableTransform,
+    AbstractTableTransform,
+)
+from data_processing.utils import (
+    GB,
+    MB,
+    TransformUtils,
+    UnrecoverableException,
+    get_logger,
+)
 
 
 class AbstractTransformFileProcessor:
@@ -16,12 +27,28 @@ class AbstractTransformFileProcessor:
         data_access_factory: list[DataAccessFactory],
         transform_parameters: dict[str, Any],
         is_folder: bool = False,
+        prefetch_depth: int = 0,
+        prefetch_max_bytes: int = 256 * MB,
+        write_workers: int = 0,
+        write_max_bytes: int = 256 * MB,
+        streaming_threshold: int = GB,
+        streaming_batch_bytes: int = 64 * MB,
     ):
         """
         Init method
         :param data_access_factory: Data Access Factory
         :param transform_parameters: Transform parameters
         :param is_folder: folder transform flag
+        :param prefetch_depth: number of input files read in the background by process_files,
+               while the current file is transformed. 0 disables prefetching
+        :param prefetch_max_bytes: maximum size of prefetched files, that were not processed yet
+        :param write_workers: number of concurrent background writes of the output files.
+               0 writes output files synchronously
+        :param write_max_bytes: maximum size of output files queued for background writing
+        :param streaming_threshold: size of input files, above which streaming table transforms
+               process them batch by batch. 0 disables streaming
+        :param streaming_batch_bytes: approximate size of the decoded data of a batch passed to
+               streaming table transforms
         """
         self.logger = get_logger(__name__)
         # validate parameters
@@ -42,7 +69,54 @@ class AbstractTransformFileProcessor:
         self.transform_params = transform_parameters
         self.transform_params["data_access"] = self.data_access
         self.transform_params["data_access_factory"] = data_access_factory
+        # output tables are written using parquet options of the output data access factory
+        output_factory = data_access_factory[1]
+        self.transform_params["parquet_write_options"] = (
+            output_factory.get_parquet_write_options()
+        )
         self.is_folder = is_folder
+        self.prefetch_depth = prefetch_depth
+        self.prefetch_max_bytes = prefetch_max_bytes
+        self.prefetcher = None
+        self.write_workers = write_workers
+        self.write_max_bytes = write_max_bytes
+        # created on the first write, as the processor can be pickled by multiprocessing pool
+        self.writer = None
+        self.streaming_threshold = streaming_threshold
+        self.streaming_batch_bytes = streaming_batch_bytes
+
+    def process_files(self, f_names: Iterable[str]) -> None:
+        """
+        Processing of multiple files. If prefetching is enabled, the following files are read
+        in the background, while the current one is transformed. Prefetching is not used with
+        streaming transforms, as it would read large files as a whole, and with transforms reading
+        only some columns or row groups, which open files instead of reading them
+        :param f_names: file names (can be a lazy iterator)
+        :return: None
+        """
+        if (
+            self.is_folder
+            or self.prefetch_depth <= 0
+            or self._is_streaming()
+            or self._is_partial_read()
+        ):
+            for f_name in f_names:
+                self._process_file(f_name=f_name)
+            return
+        self.prefetcher = FilePrefetcher(
+            data_access=self.data_access,
+            files=f_names,
+            depth=self.prefetch_depth,
+            max_bytes=self.prefetch_max_bytes,
+        )
+        try:
+            f_name = self.prefetcher.next_file()
+            while f_name is not None:
+                self._process_file(f_name=f_name)
+                f_name = self.prefetcher.next_file()
+        finally:
+            self.prefetcher.close()
+            self.prefetcher = None
 
     def process_file(self, f_name: str) -> None:
         """
@@ -50,16 +124,36 @@ class AbstractTransformFileProcessor:
         :param f_name: file name
         :return: None
         """
+        self._process_file(f_name=f_name)
+
+    def _process_file(self, f_name: str) -> None:
+        """
+        individual file processing, shared by process_file and process_files
+        :param f_name: file name
+        :return: None
+        """
         self.logger.debug(f"Begin processing file {f_name}")
         if self.data_access is None:
             self.logger.warning("No data_access found. Returning.")
             return
         t_start = time.time()
+        source = None
         if not self.is_folder:
+            source, size, streaming = self._open_source(f_name=f_name)
+        if source is not None:
+            # file is streamed or read partially by the transform
+            self._publish_stats({"source_files": 1, "source_size": size})
+        elif not self.is_folder:
             # Read source file only if we are processing file
-            filedata, retries = self.data_access.get_file(path=f_name)
+            if self.prefetcher is not None:
+                filedata, retries = self.prefetcher.get_file(path=f_name)
+            else:
+                filedata, retries = self.data_access.get_file(path=f_name)
             if retries > 0:
                 self._publish_stats({"data access retries": retries})
+            cache_stats = self.data_access.get_cache_stats()
+            if len(cache_stats) > 0:
+                self._publish_stats(cache_stats)
             if filedata is None:
                 self.logger.warning(
                     f"File read resulted in None for {f_name}. Returning."
@@ -70,11 +164,20 @@ class AbstractTransformFileProcessor:
         # Process input file
         try:
             self.logger.debug(f"Begin transforming file {f_name}")
+            if not self.is_folder and source is not None and streaming:
+                # the result is written to the output file as it is produced
+                self._stream_file(f_name=f_name, source=source, t_start=t_start)
+                return
             if not self.is_folder:
                 # execute local processing
-                out_files, stats = self.transform.transform_binary(
-                    file_name=f_name, byte_array=filedata
-                )
+                if source is not None:
+                    out_files, stats = self.transform.transform_file(
+                        file_name=f_name, source=source
+                    )
+                else:
+                    out_files, stats = self.transform.transform_binary(
+                        file_name=f_name, byte_array=filedata
+                    )
                 name_extension = TransformUtils.get_file_extension(f_name)
                 self.last_file_name = name_extension[0]
                 self.last_file_name_next_index = None
@@ -99,12 +202,147 @@ class AbstractTransformFileProcessor:
                 f"Exception processing file {f_name}: {traceback.format_exc()}"
             )
             self._publish_stats({"transform execution exception": 1})
+        finally:
+            if source is not None:
+                source.close()
+                # S3 files count retries of their range requests
+                if getattr(source, "retries", 0) > 0:
+                    self._publish_stats({"data access retries": source.retries})
+
+    def _stream_file(self, f_name: str, source: Any, t_start: float) -> None:
+        """
+        Transform a file by a streaming transform, writing its result to the output stream of the output
+        file, so that neither the decoded input nor the encoded output of the file are kept in memory
+        :param f_name: file name
+        :param source: opened input file
+        :param t_start: execution start time
+        :return: None
+        """
+        name, extension = TransformUtils.get_file_extension(f_name)
+        output_name = self.data_access.get_output_location(path=f"{name}.parquet")
+        sink, retries = self.data_access_output.open_output_stream(path=output_name)
+        if retries > 0:
+            self._publish_stats({"data access retries": retries})
+        if sink is None:
+            self.logger.warning(f"Failed to open output file {output_name}")
+            self._publish_stats({"failed_writes": 1})
+            return
+        try:
+            out_files, stats = self.transform.transform_stream(
+                file_name=f_name,
+                source=source,
+                batch_bytes=self.streaming_batch_bytes,
+                sink=sink,
+            )
+        except Exception:
+            sink.abort()
+            raise
+        self.last_file_name = name
+        self.last_file_name_next_index = None
+        self.last_extension = extension
+        if len(out_files) == 0:
+            # no output file, the partially written file is discarded
+            sink.abort()
+            self._submit_file(t_start=t_start, out_files=[], stats=stats)
+            return
+        sink.close()
+        if sink.retries > 0:
+            self._publish_stats({"data access retries": sink.retries})
+        if sink.result is None:
+            self.logger.warning(f"Failed to write file {output_name}")
+            self._publish_stats({"failed_writes": 1})
+        else:
+            self._publish_stats(
+                {
+                    "result_files": 1,
+                    "result_size": sink.size,
+                    "processing_time": time.time() - t_start,
+                }
+            )
+            self.last_file_name_next_index = 0
+        if len(stats) > 0:
+            self._publish_stats(stats)
+
+    def _is_streaming(self) -> bool:
+        """
+        Check whether large files are streamed by the transform
+        :return: True if the transform is a streaming one and streaming is enabled
+        """
+        return self.streaming_threshold > 0 and isinstance(
+            self.transform, AbstractStreamingTableTransform
+        )
+
+    def _is_partial_read(self) -> bool:
+        """
+        Check whether the transform reads only some of the columns or row groups
+        :return: True if the transform is a table transform declaring read columns or filter
+        """
+        return (
+            isinstance(self.transform, AbstractTableTransform)
+            and type(self.transform).transform_binary
+            is AbstractTableTransform.transform_binary
+            and (
+                self.transform.get_read_columns() is not None
+                or self.transform.get_filter() is not None
+            )
+        )
+
+    def _open_source(self, f_name: str) -> tuple[Any, int, bool]:
+        """
+        Open input file for random access, if the transform streams it (the file is larger than the
+        streaming threshold) or reads only some of its columns or row groups
+        :param f_name: file name
+        :return: opened file (None if the file should be read as a whole), its size and streaming flag
+        """
+        streaming = self._is_streaming()
+        partial = self._is_partial_read()
+        if (
+            not (streaming or partial)
+            or TransformUtils.get_file_extension(f_name)[1] != ".parquet"
+        ):
+            return None, 0, False
+        try:
+            source, retries = self.data_access.open_file(path=f_name)
+        except Exception as e:
+            # data access does not support random access, read the file as a whole
+            self.logger.debug(f"Can not open file {f_name} for random access - {e}")
+            return None, 0, False
+        if retries > 0:
+            self._publish_stats({"data access retries": retries})
+        if source is None:
+            return None, 0, False
+        size = source.seek(0, 2)
+        source.seek(0)
+        streaming = streaming and size > self.streaming_threshold
+        if not (streaming or partial):
+            source.close()
+            return None, 0, False
+        self.logger.debug(
+            f"Reading file {f_name} of size {size}, streaming {streaming}"
+        )
+        return source, size, streaming
 
     def flush(self) -> None:
         """
         This is supporting method for transformers, that implement buffering of data, for example resize.
         These transformers can have buffers containing data that were not written to the output. Flush is
-        the hook for them to return back locally stored data and their statistics.
+        the hook for them to return back locally stored data and their statistics. It also waits for
+        completion of all background writes, publishes statistics of the shared data access clients and
+        releases threads of the data accesses.
+        :return: None
+        """
+        self._flush_transform()
+        self._wait_writes()
+        for data_access in [self.data_access, self.data_access_output]:
+            pool_stats = data_access.get_pool_stats()
+            if len(pool_stats) > 0:
+                self._publish_stats(pool_stats)
+        self.data_access.close()
+        self.data_access_output.close()
+
+    def _flush_transform(self) -> None:
+        """
+        Flush the transform and write its results
         :return: None
         """
         if self.is_folder:
@@ -177,14 +415,7 @@ class AbstractTransformFileProcessor:
                 self.logger.debug(
                     f"Writing transformed file {self.last_file_name}{self.last_extension} to {output_name}"
                 )
-                save_res, retries = self.data_access_output.save_file(
-                    path=output_name, data=dt
-                )
-                if retries > 0:
-                    self._publish_stats({"data access retries": retries})
-                if save_res is None:
-                    self.logger.warning(f"Failed to write file {output_name}")
-                    self._publish_stats({"failed_writes": 1})
+                self._save_file(path=output_name, data=dt)
                 # Store execution statistics. Doing this async
                 self._publish_stats(
                     {
@@ -224,16 +455,7 @@ class AbstractTransformFileProcessor:
                         )
                         dt = file_ext[0]
                     file_sizes += len(dt)
-                    save_res, retries = self.data_access_output.save_file(
-                        path=output_name_indexed, data=dt
-                    )
-                    if retries > 0:
-                        self._publish_stats({"data access retries": retries})
-                    if save_res is None:
-                        self.logger.warning(
-                            f"Failed to write file {output_name_indexed}"
-                        )
-                        self._publish_stats({"failed_writes": 1})
+                    if not self._save_file(path=output_name_indexed, data=dt):
                         break
                 self.last_file_name_next_index = start_index + count
                 self._publish_stats(
@@ -247,6 +469,53 @@ class AbstractTransformFileProcessor:
         if len(stats) > 0:
             self._publish_stats(stats)
 
+    def _save_file(self, path: str, data: bytes) -> bool:
+        """
+        Write output file. If write-behind is enabled, the file is queued for background writing
+        and the statistics of the completed writes are published
+        :param path: file path
+        :param data: file content
+        :return: False if the write failed, True otherwise
+        """
+        if self.write_workers > 0:
+            if self.writer is None:
+                self.writer = OutputWriter(
+                    data_access=self.data_access_output,
+                    workers=self.write_workers,
+                    max_bytes=self.write_max_bytes,
+                )
+            self.writer.save_file(path=path, data=data)
+            stats = self.writer.get_stats()
+            if len(stats) > 0:
+                self._publish_stats(stats)
+            return True
+        save_res, retries = self.data_access_output.save_file(path=path, data=data)
+        if retries > 0:
+            self._publish_stats({"data access retries": retries})
+        if save_res is None:
+            self.logger.warning(f"Failed to write file {path}")
+            self._publish_stats({"failed_writes": 1})
+            return False
+        return True
+
+    def _wait_writes(self) -> None:
+        """
+        Wait for completion of the background writes and of the writes batched by the data access
+        and publish their statistics
+        :return: None
+        """
+        if self.writer is not None:
+            self.writer.wait()
+            stats = self.writer.get_stats()
+            if len(stats) > 0:
+                self._publish_stats(stats)
+        failed, retries = self.data_access_output.flush_files()
+        if retries > 0:
+            self._publish_stats({"data access retries": retries})
+        if failed > 0:
+            self.logger.warning(f"Failed to write {failed} files")
+            self._publish_stats({"failed_writes": failed})
+
     def _publish_stats(self, stats: dict[str, Any]) -> None:
         """
         execution statistics publishing
@@ -15,6 +15,9 @@ from data_processing.utils import UnrecoverableException, get_logger
 
 logger = get_logger(__name__)
 
+# print interval used when the number of files is not known upfront (streaming listing)
+STREAMING_PRINT_INTERVAL = 100
+
 
 class TransformOrchestrator:
     """
@@ -54,6 +57,7 @@ class TransformOrchestrator:
         self.statistics = None
         self.resources = None
         self.files_to_process = None
+        self.files_batches = None
         self.print_interval = 0
         self.current_file = -1
         self.is_folder = False
@@ -67,7 +71,7 @@ class TransformOrchestrator:
     def get_files_to_process(self) -> int:
         """
         Get files to process
-        :return number of files
+        :return number of files or -1 if files are streamed, and their number is not known upfront
         """
         self.is_folder = issubclass(
             self.runtime_config.get_transform_class(), AbstractFolderTransform
@@ -75,9 +79,16 @@ class TransformOrchestrator:
         if self.is_folder:
             # folder transform
             files = self.runtime.get_folders(data_access=self.data_access)
+            # log retries of the folders listing
+            if self.data_access.folders_retries > 0:
+                self._publish_stats(
+                    {"data access retries": self.data_access.folders_retries}
+                )
             self.logger.info(
                 f"Number of folders is {len(files)}"
             )  # Get files to process
+        elif self.data_access.streaming_listing:
+            return self._get_files_to_process_streaming()
         else:
             files, profile, retries = self.data_access.get_files_to_process()
             # log retries
@@ -97,6 +108,36 @@ class TransformOrchestrator:
         self.files_to_process = files
         return n_files
 
+    def _get_files_to_process_streaming(self) -> int:
+        """
+        Start streaming listing of files to process. Only the first batch of files is listed here,
+        the rest are listed as they are requested by next_file()
+        :return 0 if there are no files to process or -1 if there are
+        """
+        self.files_batches = self.data_access.iterate_files_to_process()
+        self.files_to_process = self._next_files_batch()
+        if self.files_to_process is None:
+            self.logger.error("No input files to process - exiting")
+            return 0
+        self.logger.info(
+            f"Streaming files listing, first batch contains {len(self.files_to_process)} files"
+        )
+        self.print_interval = STREAMING_PRINT_INTERVAL
+        return -1
+
+    def _next_files_batch(self) -> list[str]:
+        """
+        Get next non empty batch of files from the streaming listing
+        :return: batch of files or None if the listing is completed
+        """
+        for batch, retries in self.files_batches:
+            # log retries
+            if retries > 0:
+                self._publish_stats({"data access retries": retries})
+            if len(batch) > 0:
+                return batch
+        return None
+
     def next_file(self) -> str:
         """
         Gen next file to process
@@ -104,9 +145,41 @@ class TransformOrchestrator:
         """
         self.current_file += 1
         if self.current_file >= len(self.files_to_process):
+            if self.files_batches is None:
+                return None
+            # streaming listing - get the next batch
+            batch = self._next_files_batch()
+            if batch is None:
+                return None
+            self.files_to_process = batch
+            self.current_file = 0
+        return self.files_to_process[self.current_file]
+
+    def next_files(self, n_files: int) -> list[str]:
+        """
+        Get the next batch of files to process
+        :param n_files: maximum number of files in the batch
+        :return: list of files or None if there are no more files
+        """
+        files = []
+        while len(files) < n_files:
+            path = self.next_file()
+            if path is None:
+                break
+            files.append(path)
+        if len(files) == 0:
             return None
-        else:
-            return self.files_to_process[self.current_file]
+        return files
+
+    def get_files(self) -> list[str]:
+        """
+        Get the list of files to process, passed to the transform runtime. Returns an empty
+        list, when files are streamed, as their list is not known upfront
+        :return: list of files
+        """
+        if self.files_batches is not None:
+            return []
+        return self.files_to_process
 
     def process_data(self) -> None:
         """
@@ -121,6 +194,20 @@ class TransformOrchestrator:
         """
         # Compute execution statistics
         self.logger.debug("Computing execution stats")
+        if self.data_access.checkpoint_skipped > 0:
+            # files skipped by checkpointing are known only once the listing is completed
+            self._publish_stats(
+                {"checkpoint skipped files": self.data_access.checkpoint_skipped}
+            )
+        if self.data_access.checkpoint_collisions > 0:
+            self._publish_stats(
+                {"checkpoint hash collisions": self.data_access.checkpoint_collisions}
+            )
+        # clients of the orchestrator's data accesses (listing), processors publish their own
+        for data_access in [self.data_access, self.data_access_out]:
+            pool_stats = data_access.get_pool_stats()
+            if len(pool_stats) > 0:
+                self._publish_stats(pool_stats)
         stats = self.runtime.compute_execution_stats(self._get_stats())
         if "processing_time" in stats:
             stats["processing_time"] = round(stats["processing_time"], 3)
@@ -187,8 +274,12 @@ def orchestrate(
         logger.error(f"Exception creating orchestrator {e}")
         return 1
     # get files to process
-    if executor.get_files_to_process() == 0:
-        return 0
+    try:
+        if executor.get_files_to_process() == 0:
+            return 0
+    except Exception as e:
+        logger.error(f"Exception listing files to process {e}")
+        return 1
     status = "success"
     return_code = 0
     try:
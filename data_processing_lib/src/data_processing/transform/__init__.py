@@ -10,6 +10,9 @@ from data_processing.transform.binary_transform import (
 from data_processing.transform.table_transform import (
     AbstractTableTransform as AbstractTableTransform,
 )
+from data_processing.transform.streaming_table_transform import (
+    AbstractStreamingTableTransform as AbstractStreamingTableTransform,
+)
 from data_processing.transform.transform_statistics import (
     TransformStatistics as TransformStatistics,
 )
@@ -1,7 +1,9 @@
 from typing import Any, Union
 
+import pyarrow as pa
 from data_processing.transform import (
     AbstractBinaryTransform,
+    AbstractTableTransform,
     TransformRuntime,
     TransformRuntimeConfiguration,
 )
@@ -11,7 +13,10 @@ from data_processing.utils import TransformUtils, UnrecoverableException, get_lo
 class AbstractPipelineTransform(AbstractBinaryTransform):
     """
     Transform that executes a set of base transforms sequentially. Data is passed between
-    participating transforms in memory
+    participating transforms in memory. Consecutive table transforms exchange pa.Table objects
+    directly - parquet is decoded once, when the first table transform needs it, and encoded
+    only when a binary transform needs it or at the end of the pipeline. In the case of fork, all
+    table transforms of the fork share the same decoded table
     """
 
     def __init__(self, config: dict[str, Any]):
@@ -39,6 +44,8 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
             raise UnrecoverableException(
                 "pipeline transform - Statistics is not defined"
             )
+        # parquet writer options of the pipeline output
+        self.parquet_write_options = config.get("parquet_write_options", None)
         self.transforms = transforms
         participants = []
         # for every transform in the pipeline
@@ -100,7 +107,9 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
                 # no data returned by this transform
                 return [], stats
         # all done
-        return self._convert_output(data), stats
+        return self._convert_output(
+            data=data, stats=stats, write_options=self.parquet_write_options
+        ), stats
 
     def _execute_transform(
         self,
@@ -114,13 +123,26 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
         """
         Execute a single or fork/join of transforms
         :param transform: single or list of transform for forking
-        :param data: source data
+        :param data: source data, containing either binary or tables
         :param stats: source stats
         :return: resulting data and statistics
         """
         res = []
+        # source data is converted at most once, and shared by all transforms of the fork
+        tables = None
+        binaries = None
         for t in transform:
-            dt, st = self._process_transform(transform=t[0], data=data)
+            if self._is_table_transform(t[0]):
+                if tables is None:
+                    tables = self._decode_data(data=data)
+                dt, st = self._process_transform(transform=t[0], data=tables)
+            else:
+                if binaries is None:
+                    # binary transforms can return their input as is, so it is encoded as the output
+                    binaries = self._encode_data(
+                        data=data, stats=stats, write_options=self.parquet_write_options
+                    )
+                dt, st = self._process_transform(transform=t[0], data=binaries)
             # Accumulate stats
             stats |= st
             res.append(dt)
@@ -134,7 +156,8 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
         """
         Merging fork results. We assume only a single fork in the overall pipeline.
         This is a very simple implementation that just flattens array of arrays. For
-        all other use cases this method has to be overwritten
+        all other use cases this method has to be overwritten. Note that data elements can be
+        either binary or pa.Table
         :param data: list of data returned by fork execution
         :return: merged data
         """
@@ -144,15 +167,87 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
         return res_data
 
     @staticmethod
-    def _convert_output(data: list[tuple[bytes, str]]) -> list[tuple[bytes, str]]:
-        res = [None] * len(data)
-        i = 0
+    def _is_table_transform(transform: AbstractBinaryTransform) -> bool:
+        """
+        Check whether transform can process tables directly. Table transforms overwriting
+        transform_binary are treated as binary ones
+        :param transform: transform
+        :return: True if the transform accepts tables
+        """
+        return (
+            isinstance(transform, AbstractTableTransform)
+            and type(transform).transform_binary
+            is AbstractTableTransform.transform_binary
+        )
+
+    @staticmethod
+    def _decode_data(
+        data: list[tuple[Union[bytes, pa.Table], str]],
+    ) -> list[tuple[Union[bytes, pa.Table], str]]:
+        """
+        Convert parquet files to tables. Files that can not be converted are left as is, so that
+        the transform reports them
+        :param data: list of data and file names
+        :return: list of data and file names
+        """
+        res = []
         for dt in data:
-            f_name = TransformUtils.get_file_extension(dt[1])
-            res[i] = (dt[0], f_name[1])
-            i += 1
+            if (
+                not isinstance(dt[0], pa.Table)
+                and TransformUtils.get_file_extension(dt[1])[1] == ".parquet"
+            ):
+                table = TransformUtils.convert_binary_to_arrow(data=dt[0])
+                if table is not None:
+                    dt = (table, dt[1])
+            res.append(dt)
         return res
 
+    @staticmethod
+    def _encode_data(
+        data: list[tuple[Union[bytes, pa.Table], str]],
+        stats: dict[str, Any],
+        write_options: dict[str, Any] = None,
+    ) -> list[tuple[bytes, str]]:
+        """
+        Convert tables to parquet files
+        :param data: list of data and file names (or extensions)
+        :param stats: statistics, updated with the conversion failures
+        :param write_options: parquet writer options, default profile if not specified
+        :return: list of binary data and file names (or extensions)
+        """
+        res = []
+        for dt in data:
+            if isinstance(dt[0], pa.Table):
+                binary = TransformUtils.convert_arrow_to_binary(
+                    table=dt[0], write_options=write_options
+                )
+                if binary is None:
+                    stats["failed_writes"] = stats.get("failed_writes", 0) + 1
+                    continue
+                dt = (binary, dt[1])
+            res.append(dt)
+        return res
+
+    @staticmethod
+    def _convert_output(
+        data: list[tuple[Union[bytes, pa.Table], str]],
+        stats: dict[str, Any],
+        write_options: dict[str, Any] = None,
+    ) -> list[tuple[bytes, str]]:
+        """
+        Convert pipeline results to the output files
+        :param data: list of data and file names
+        :param stats: statistics, updated with the conversion failures
+        :param write_options: parquet writer options, default profile if not specified
+        :return: list of binary data and file extensions
+        """
+        return [
+            (dt[0], TransformUtils.get_file_extension(dt[1])[1])
+            for dt in AbstractPipelineTransform._encode_data(
+                data=data, stats=stats, write_options=write_options
+            )
+        ]
+
     @staticmethod
     def _process_transform(
         transform: AbstractBinaryTransform, data: list[tuple[bytes, str]]
@@ -168,9 +263,15 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
         for dt in data:
             # for every data element
             src = TransformUtils.get_file_extension(dt[1])
-            out_files, st = transform.transform_binary(
-                byte_array=dt[0], file_name=dt[1]
-            )
+            if isinstance(dt[0], pa.Table):
+                out_tables, st = transform.transform_tables(
+                    file_name=dt[1], table=dt[0]
+                )
+                out_files = [(table, ".parquet") for table in out_tables or []]
+            else:
+                out_files, st = transform.transform_binary(
+                    byte_array=dt[0], file_name=dt[1]
+                )
             # Accumulate results
             for ouf in out_files:
                 res.append((ouf[0], src[0] + ouf[1]))
@@ -195,7 +296,7 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
         for transform in self.participants:
             partial = []
             for t in transform:
-                dt, st = t[0].flush_binary()
+                dt, st = self._flush_transform(transform=t[0])
                 # Accumulate stats
                 stats |= st
                 partial.append(dt)
@@ -212,14 +313,35 @@ class AbstractPipelineTransform(AbstractBinaryTransform):
                     if len(data) == 0:
                         # no data returned by this transform
                         break
-                    res += self._convert_output(data)
+                    res += self._convert_output(
+                        data=data,
+                        stats=stats,
+                        write_options=self.parquet_write_options,
+                    )
             else:
-                res += out_files
+                res += self._encode_data(
+                    data=out_files,
+                    stats=stats,
+                    write_options=self.parquet_write_options,
+                )
             i += 1
         # Done flushing, compute execution stats
         self._compute_execution_statistics(stats)
         return res, {}
 
+    def _flush_transform(
+        self, transform: AbstractBinaryTransform
+    ) -> tuple[list[tuple[Union[bytes, pa.Table], str]], dict[str, Any]]:
+        """
+        Flush individual transform, keeping tables flushed by table transforms
+        :param transform: transform
+        :return: a tuple of a list of data and extensions and statistics
+        """
+        if self._is_table_transform(transform):
+            out_tables, stats = transform.flush_tables()
+            return [(table, ".parquet") for table in out_tables or []], stats
+        return transform.flush_binary()
+
     def _compute_execution_statistics(self, stats: dict[str, Any]) -> None:
         """
         Compute execution statistics
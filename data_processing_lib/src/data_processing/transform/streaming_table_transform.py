@@ -0,0 +1,185 @@
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_processing.transform import AbstractTableTransform
+from data_processing.utils import MB, TransformUtils
+
+
+class AbstractStreamingTableTransform(AbstractTableTransform):
+    """
+    Extends AbstractTableTransform with the ability to process a parquet file as a stream of record
+    batches. Subclasses implement transform() exactly as for AbstractTableTransform, but it has to
+    be independent of other batches of the same file (filters, annotators, etc.). Files larger than
+    the runtime streaming threshold are passed to transform_stream, which invokes transform() for every
+    batch and incrementally writes the results into a single parquet file, streamed to the output file
+    by the runtime. This bounds the memory used for the decoded data by the batch size (runtime
+    streaming_batch_bytes) instead of the file size. Smaller files are processed as a whole by
+    transform_binary.
+    """
+
+    # default size of the decoded data of a batch passed to transform()
+    STREAMING_BATCH_BYTES = 64 * MB
+
+    def transform_stream(
+        self,
+        file_name: str,
+        source: Any,
+        batch_bytes: int = STREAMING_BATCH_BYTES,
+        sink: Any = None,
+    ) -> tuple[list[tuple[bytes, str]], dict[str, Any]]:
+        """
+        Converts input file into 0 or 1 output file, reading and transforming it batch by batch.
+        If there is an error, an exception must be raised - exit()ing is not generally allowed.
+        :param file_name: the file name of the file to be transformed.
+        :param source: seekable binary file object of the input file (see DataAccess.open_file)
+        :param batch_bytes: approximate size of the decoded data of a batch. The number of rows of
+               a batch is derived from the uncompressed size of the read columns in the row groups metadata
+        :param sink: writable binary stream (see DataAccess.open_output_stream), to which the row groups of
+               the result are written as they are produced. It is not closed by the transform. If it is not
+               given, the result is kept in memory
+        :return: a tuple of a list of 0 or more tuples and a dictionary of statistics that will be propagated
+                to metadata.  Each element of the return list, is a tuple of the transformed bytes (None, if
+                they were written to the sink) and a string holding the extension to be used when writing out
+                the new bytes.
+        """
+        # validate extension
+        if TransformUtils.get_file_extension(file_name)[1] != ".parquet":
+            self.logger.warning(f"Get wrong file type {file_name}")
+            return [], {"wrong file type": 1}
+        try:
+            parquet_file = pq.ParquetFile(source)
+            columns = parquet_file.schema_arrow.names
+            read_columns, pass_through = self._get_projection(columns=columns)
+            if read_columns is not None:
+                # keep the input columns order
+                columns = [
+                    column
+                    for column in columns
+                    if column in read_columns or column in pass_through
+                ]
+        except Exception as e:
+            self.logger.warning(f"Could not open parquet file {file_name}: {e}")
+            return [], {"failed_reads": 1}
+        num_rows = parquet_file.metadata.num_rows
+        if num_rows == 0:
+            self.logger.warning("table is empty, skipping processing")
+            return [], {"skipped empty tables": 1}
+        row_groups, filter_stats = self._get_row_groups(
+            source=source, metadata=parquet_file.metadata
+        )
+        if row_groups is not None and len(row_groups) == 0:
+            # no rows can match the filter
+            return [], filter_stats | {
+                "source_doc_count": num_rows,
+                "result_doc_count": 0,
+            }
+        batch_rows = self._get_batch_rows(
+            metadata=parquet_file.metadata,
+            row_groups=row_groups,
+            columns=None if read_columns is None else columns,
+            batch_bytes=batch_bytes,
+        )
+        stats = {}
+        buffer = None
+        if sink is None:
+            buffer = pa.BufferOutputStream()
+            sink = buffer
+        write_options = self.parquet_write_options
+        if write_options is None:
+            write_options = TransformUtils.get_parquet_write_options()
+        # row group size is an argument of write_table, not of the writer
+        write_options = dict(write_options)
+        row_group_size = write_options.pop("row_group_size", None)
+        writer = None
+        # schema of empty results, used if no rows were produced
+        empty_schema = None
+        try:
+            for batch in parquet_file.iter_batches(
+                batch_size=batch_rows,
+                row_groups=row_groups,
+                # transform_tables splits read and pass through columns
+                columns=None if read_columns is None else columns,
+            ):
+                if batch.num_rows == 0:
+                    continue
+                out_tables, batch_stats = self.transform_tables(
+                    file_name=file_name, table=pa.Table.from_batches([batch])
+                )
+                if out_tables is None:
+                    # duplicate columns - the whole file is rejected
+                    return [], batch_stats
+                self._add_stats(stats=stats, batch_stats=batch_stats)
+                for table in out_tables:
+                    if table.num_rows == 0:
+                        empty_schema = table.schema
+                        continue
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            where=sink, schema=table.schema, **write_options
+                        )
+                    elif not table.schema.equals(writer.schema):
+                        table = table.cast(writer.schema)
+                    writer.write_table(table, row_group_size=row_group_size)
+            if writer is None and empty_schema is not None:
+                # all rows were filtered out, produce an empty file as transform_binary does
+                writer = pq.ParquetWriter(
+                    where=sink, schema=empty_schema, **write_options
+                )
+        finally:
+            if writer is not None:
+                writer.close()
+        # documents in the skipped row groups are part of the source
+        stats |= filter_stats | {"source_doc_count": num_rows}
+        if writer is None:
+            return [], stats
+        if buffer is None:
+            return [(None, ".parquet")], stats
+        return [(buffer.getvalue(), ".parquet")], stats
+
+    @staticmethod
+    def _get_batch_rows(
+        metadata: pq.FileMetaData,
+        row_groups: list[int],
+        columns: list[str],
+        batch_bytes: int,
+    ) -> int:
+        """
+        Get number of rows of a batch, so that its decoded data is about batch_bytes
+        :param metadata: parquet file metadata
+        :param row_groups: indexes of the read row groups, None for all of them
+        :param columns: read columns, None for all of them
+        :param batch_bytes: size of the decoded data of a batch
+        :return: number of rows in a batch
+        """
+        if row_groups is None:
+            row_groups = range(metadata.num_row_groups)
+        rows = 0
+        size = 0
+        for i in row_groups:
+            row_group = metadata.row_group(i)
+            rows += row_group.num_rows
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                # nested columns are stored as multiple leaf columns
+                if columns is None or column.path_in_schema.split(".")[0] in columns:
+                    size += column.total_uncompressed_size
+        if rows == 0 or size == 0:
+            return max(rows, 1)
+        return max(batch_bytes * rows // size, 1)
+
+    @staticmethod
+    def _add_stats(stats: dict[str, Any], batch_stats: dict[str, Any]) -> None:
+        """
+        Accumulate statistics of a batch. Numeric values are summed, other ones are replaced
+        :param stats: statistics of the file
+        :param batch_stats: statistics of the batch
+        :return: None
+        """
+        for key, val in batch_stats.items():
+            if isinstance(val, (int, float)) and isinstance(
+                stats.get(key, 0), (int, float)
+            ):
+                stats[key] = stats.get(key, 0) + val
+            else:
+                stats[key] = val
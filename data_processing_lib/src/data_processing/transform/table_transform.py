@@ -1,6 +1,8 @@
-from typing import Any
+from typing import Any, Callable
 
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from data_processing.transform import AbstractBinaryTransform
 from data_processing.utils import TransformUtils
 
@@ -9,6 +11,12 @@ class AbstractTableTransform(AbstractBinaryTransform):
     """
     Extends AbstractBinaryTransform to expect the byte arrays from to contain a pyarrow Table.
     Subclasses are expected to implement transform() on the parsed Table instances.
+    Subclasses, that use only some of the table columns, can declare them with get_read_columns().
+    Only these columns are then decoded and passed to transform(), while the pass through columns
+    (see get_pass_through_columns()) are added to the transform result as is. Filtering subclasses
+    can declare their filter with get_filter(), which allows to skip row groups based on parquet statistics.
+    Output tables are written using the parquet writer options of the job (see
+    DataAccessFactory.get_parquet_write_options), passed by the runtime as parquet_write_options.
     """
 
     def __init__(self, config: dict[str, Any]):
@@ -19,6 +27,7 @@ class AbstractTableTransform(AbstractBinaryTransform):
 
         super().__init__(config)
         self.logger = get_logger(__name__)
+        self.parquet_write_options = config.get("parquet_write_options", None)
 
     def transform_binary(
         self, file_name: str, byte_array: bytes
@@ -36,21 +45,243 @@ class AbstractTableTransform(AbstractBinaryTransform):
         if TransformUtils.get_file_extension(file_name)[1] != ".parquet":
             self.logger.warning(f"Get wrong file type {file_name}")
             return [], {"wrong file type": 1}
+        if self.get_read_columns() is not None or self.get_filter() is not None:
+            # decode only the required columns and row groups
+            return self._transform_parquet(
+                file_name=file_name, source=pa.BufferReader(byte_array)
+            )
         # convert to table
         table = TransformUtils.convert_binary_to_arrow(data=byte_array)
         if table is None:
             self.logger.warning("Transformation of file to table failed")
             return [], {"failed_reads": 1}
+        # transform table
+        out_tables, stats = self.transform_tables(file_name=file_name, table=table)
+        if out_tables is None:
+            return [], stats
+        # convert tables to files
+        return self._convert_tables(out_tables=out_tables, stats=stats)
+
+    def transform_file(
+        self, file_name: str, source: Any
+    ) -> tuple[list[tuple[bytes, str]], dict[str, Any]]:
+        """
+        Converts input file into 0 or more output files, reading it from a random access file. Only
+        footer and the chunks of the required columns are read, which, for remote storage, avoids
+        downloading the columns that are not used. Used by the runtime for transforms declaring read columns
+        :param file_name: the file name of the file to be transformed.
+        :param source: seekable binary file object of the input file (see DataAccess.open_file)
+        :return: a tuple of a list of 0 or more tuples and a dictionary of statistics that will be propagated
+                to metadata.  Each element of the return list, is a tuple of the transformed bytes and a string
+                holding the extension to be used when writing out the new bytes.
+        """
+        # validate extension
+        if TransformUtils.get_file_extension(file_name)[1] != ".parquet":
+            self.logger.warning(f"Get wrong file type {file_name}")
+            return [], {"wrong file type": 1}
+        return self._transform_parquet(file_name=file_name, source=source)
+
+    def get_read_columns(self) -> list[str]:
+        """
+        Get columns used by transform(). If defined, only these columns are decoded and passed to
+        transform(). Columns, that do not exist in the input, are ignored
+        :return: list of column names or None (default) to read all columns
+        """
+        return None
+
+    def get_pass_through_columns(self) -> list[str]:
+        """
+        Get columns, that are not used by transform(), but are copied as is to its result. This is only
+        used if read columns are defined. In this case, if any pass through columns are present, transform()
+        has to return a single table with the same rows (in the same order) as its input
+        :return: list of column names, None (default) for all columns that are not read, or empty list,
+                 if the result contains only columns returned by transform()
+        """
+        return None
+
+    def get_filter(self) -> pc.Expression:
+        """
+        Get filter expression, that all rows returned by transform() satisfy. If defined, readers use
+        parquet row group statistics to skip row groups (or whole files), that can not contain
+        matching rows. Rows of the remaining row groups are still passed to transform(), which
+        is responsible for the actual filtering
+        :return: pyarrow compute expression or None (default) if there is no filter
+        """
+        return None
+
+    def _get_projection(self, columns: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Get columns to read and to pass through for a given input
+        :param columns: input columns
+        :return: columns to read (None for all columns) and columns to pass through
+        """
+        read_columns = self.get_read_columns()
+        if read_columns is None:
+            return None, []
+        read_columns = [column for column in read_columns if column in columns]
+        pass_through = self.get_pass_through_columns()
+        if pass_through is None:
+            pass_through = columns
+        return read_columns, [
+            column
+            for column in columns
+            if column in pass_through and column not in read_columns
+        ]
+
+    def _transform_parquet(
+        self, file_name: str, source: Any
+    ) -> tuple[list[tuple[bytes, str]], dict[str, Any]]:
+        """
+        Transform parquet file, decoding only the required columns of the row groups, that can match
+        the filter. Pass through columns are decoded only if the transform returns rows
+        :param file_name: the file name of the file to be transformed.
+        :param source: file object (or buffer reader) of the input file
+        :return: a tuple of a list of 0 or more files and statistics
+        """
+        try:
+            parquet_file = pq.ParquetFile(source, pre_buffer=True)
+            columns = parquet_file.schema_arrow.names
+            read_columns, pass_through = self._get_projection(columns=columns)
+            num_rows = parquet_file.metadata.num_rows
+            if num_rows == 0:
+                self.logger.warning("table is empty, skipping processing")
+                return [], {"skipped empty tables": 1}
+            row_groups, filter_stats = self._get_row_groups(
+                source=source, metadata=parquet_file.metadata
+            )
+            if row_groups is not None and len(row_groups) == 0:
+                # no rows can match the filter
+                return [], filter_stats | {
+                    "source_doc_count": num_rows,
+                    "result_doc_count": 0,
+                }
+
+            def _read(read: list[str]) -> pa.Table:
+                if row_groups is None:
+                    return parquet_file.read(columns=read)
+                return parquet_file.read_row_groups(row_groups, columns=read)
+
+            table = _read(read_columns)
+        except Exception as e:
+            self.logger.warning(f"Transformation of file to table failed: {e}")
+            return [], {"failed_reads": 1}
+        out_tables, stats = self._transform_projected(
+            file_name=file_name,
+            table=table,
+            columns=columns,
+            pass_through=pass_through,
+            read_pass_through=lambda: _read(pass_through),
+        )
+        if out_tables is None:
+            return [], stats
+        # documents in the skipped row groups are part of the source
+        out_tables, stats = self._check_tables(
+            out_tables=out_tables,
+            stats=stats | filter_stats | {"source_doc_count": num_rows},
+        )
+        if out_tables is None:
+            return [], stats
+        return self._convert_tables(out_tables=out_tables, stats=stats)
+
+    def _get_row_groups(
+        self, source: Any, metadata: pq.FileMetaData
+    ) -> tuple[list[int], dict[str, Any]]:
+        """
+        Get row groups that can contain rows matching the transform filter
+        :param source: file object (or buffer reader) of the input file
+        :param metadata: parquet file metadata
+        :return: list of row group indexes (None to read all of them) and statistics of the skipped ones
+        """
+        filter = self.get_filter()
+        if filter is None:
+            return None, {}
+        row_groups, stats = TransformUtils.get_row_groups(
+            source=source, metadata=metadata, filter=filter
+        )
+        if len(stats) == 0:
+            # nothing to skip
+            return None, {}
+        return row_groups, stats
+
+    def _transform_projected(
+        self,
+        file_name: str,
+        table: pa.Table,
+        columns: list[str],
+        pass_through: list[str],
+        read_pass_through: Callable[[], pa.Table],
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        """
+        Transform table containing read columns and add pass through columns to the result
+        :param file_name: the file name of the file containing the given table.
+        :param table: table of read columns
+        :param columns: all input columns, defining the order of the result columns
+        :param pass_through: pass through columns
+        :param read_pass_through: function returning table of pass through columns
+        :return: a tuple of a list of 0 or more converted tables (None, if the result is rejected) and
+                 statistics
+        """
+        out_tables, stats = self.transform(table=table, file_name=file_name)
+        if len(pass_through) == 0:
+            return out_tables, stats
+        if len(out_tables) != 1 or out_tables[0].num_rows != table.num_rows:
+            self.logger.warning(
+                "Transform with pass through columns has to return a single table with the input rows"
+            )
+            return None, {"pass through columns mismatch": 1}
+        result = out_tables[0]
+        passed = read_pass_through()
+        # keep the input columns order, new columns are added at the end
+        names = [
+            name
+            for name in columns
+            if name in result.schema.names or name in pass_through
+        ]
+        names += [name for name in result.schema.names if name not in names]
+        sources = [result if name in result.schema.names else passed for name in names]
+        schema = pa.schema(
+            [source.schema.field(name) for source, name in zip(sources, names)],
+            metadata=result.schema.metadata,
+        )
+        return [
+            pa.Table.from_arrays(
+                [source.column(name) for source, name in zip(sources, names)],
+                schema=schema,
+            )
+        ], stats
+
+    def transform_tables(
+        self, file_name: str, table: pa.Table
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        """
+        Table counterpart of transform_binary, used by pipelines to pass tables between participating
+        transforms without encoding them to parquet. Validates input and output tables and adds
+        document counts to the statistics
+        :param file_name: the file name of the file containing the given table.
+        :param table: input table
+        :return: a tuple of a list of 0 or more converted tables (None, if the input was rejected) and
+                a dictionary of statistics that will be propagated to metadata
+        """
         # Ensure that table is not empty
         if table.num_rows == 0:
             self.logger.warning("table is empty, skipping processing")
-            return [], {"skipped empty tables": 1}
-        # transform table
-        out_tables, stats = self.transform(table=table, file_name=file_name)
+            return None, {"skipped empty tables": 1}
+        columns = table.schema.names
+        read_columns, pass_through = self._get_projection(columns=columns)
+        if read_columns is None:
+            out_tables, stats = self.transform(table=table, file_name=file_name)
+        else:
+            out_tables, stats = self._transform_projected(
+                file_name=file_name,
+                table=table.select(read_columns),
+                columns=columns,
+                pass_through=pass_through,
+                read_pass_through=lambda: table.select(pass_through),
+            )
+            if out_tables is None:
+                return None, stats
         # Add number of rows to stats
-        stats = stats | {"source_doc_count": table.num_rows}
-        # convert tables to files
-        return self._check_and_convert_tables(
+        return self._check_tables(
             out_tables=out_tables, stats=stats | {"source_doc_count": table.num_rows}
         )
 
@@ -77,8 +308,20 @@ class AbstractTableTransform(AbstractBinaryTransform):
         :return: a tuple of a list of 0 or more converted file and a dictionary of statistics that will be
                  propagated to metadata
         """
+        out_tables, stats = self.flush_tables()
+        if out_tables is None:
+            return [], stats
+        return self._convert_tables(out_tables=out_tables, stats=stats)
+
+    def flush_tables(self) -> tuple[list[pa.Table], dict[str, Any]]:
+        """
+        Table counterpart of flush_binary, used by pipelines. Validates flushed tables and adds document
+        count to the statistics
+        :return: a tuple of a list of 0 or more converted tables (None, if the tables were rejected) and
+                 a dictionary of statistics that will be propagated to metadata
+        """
         out_tables, stats = self.flush()
-        return self._check_and_convert_tables(out_tables=out_tables, stats=stats)
+        return self._check_tables(out_tables=out_tables, stats=stats)
 
     def flush(self) -> tuple[list[pa.Table], dict[str, Any]]:
         """
@@ -92,23 +335,41 @@ class AbstractTableTransform(AbstractBinaryTransform):
         """
         return [], {}
 
-    def _check_and_convert_tables(
+    def _check_tables(
         self, out_tables: list[pa.Table], stats: dict[str, Any]
-    ) -> tuple[list[tuple[bytes, str]], dict[str, Any]]:
-        out_files = [tuple[bytes, str]] * len(out_tables)
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        """
+        Verify that resulting tables do not contain duplicate columns and count their documents
+        :param out_tables: resulting tables
+        :param stats: statistics
+        :return: tables (None, if they are rejected) and updated statistics
+        """
         out_docs = 0
-        for i in range(len(out_tables)):
-            if not TransformUtils.verify_no_duplicate_columns(
-                table=out_tables[i], file=""
-            ):
+        for table in out_tables:
+            if not TransformUtils.verify_no_duplicate_columns(table=table, file=""):
                 self.logger.warning(
                     "Transformer created file with the duplicate columns"
                 )
-                return [], {"duplicate columns result": 1}
-            out_binary = TransformUtils.convert_arrow_to_binary(table=out_tables[i])
+                return None, {"duplicate columns result": 1}
+            out_docs += table.num_rows
+        return out_tables, stats | {"result_doc_count": out_docs}
+
+    def _convert_tables(
+        self, out_tables: list[pa.Table], stats: dict[str, Any]
+    ) -> tuple[list[tuple[bytes, str]], dict[str, Any]]:
+        """
+        Convert checked tables to parquet files
+        :param out_tables: resulting tables
+        :param stats: statistics
+        :return: a tuple of a list of files and statistics
+        """
+        out_files = [tuple[bytes, str]] * len(out_tables)
+        for i in range(len(out_tables)):
+            out_binary = TransformUtils.convert_arrow_to_binary(
+                table=out_tables[i], write_options=self.parquet_write_options
+            )
             if out_binary is None:
                 self.logger.warning("Failed to convert table to binary")
                 return [], {"failed_writes": 1}
-            out_docs += out_tables[i].num_rows
             out_files[i] = (out_binary, ".parquet")
-        return out_files, stats | {"result_doc_count": out_docs}
+        return out_files, stats
@@ -15,3 +15,6 @@ from data_processing.utils.cli_utils import (
 from data_processing.utils.unrecoverable import (
     UnrecoverableException as UnrecoverableException,
 )
+from data_processing.utils.compression_utils import (
+    CompressionUtils as CompressionUtils,
+)
@@ -0,0 +1,177 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pyarrow as pa
+from data_processing.utils.transform_utils import MB
+
+
+# number of threads used for decompression of multi frame zstd data
+DECOMPRESS_WORKERS = min(8, os.cpu_count() or 1)
+# minimal compressed size for using multiple threads
+PARALLEL_THRESHOLD = 16 * MB
+
+_ZSTD_MAGIC = 0xFD2FB528
+_ZSTD_SKIPPABLE_MASK = 0xFFFFFFF0
+_ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+
+class CompressionUtils:
+    """
+    Class implementing support for compressed (gzip, zstd, lz4 and bz2) input files. Decompression is
+    done by pyarrow codecs, either streaming (CompressedInputStream), so that the compressed content is
+    never fully loaded, or from an in memory (or memory mapped) buffer. Zstd data consisting of multiple
+    frames (produced, for example, by pzstd or zstd -B) is decompressed using multiple threads.
+    Decompressed content is returned as bytes
+    """
+
+    # file extension to pyarrow codec name
+    CODECS = {
+        ".gz": "gzip",
+        ".zst": "zstd",
+        ".zstd": "zstd",
+        ".lz4": "lz4",
+        ".bz2": "bz2",
+    }
+
+    @staticmethod
+    def get_codec(path: str) -> str:
+        """
+        Get compression codec of the file based on its extension
+        :param path: file path
+        :return: pyarrow codec name or None if the file is not compressed
+        """
+        _, extension = os.path.splitext(path)
+        return CompressionUtils.CODECS.get(extension.lower(), None)
+
+    @staticmethod
+    def open_stream(
+        source: Any, codec: str, buffer_size: int = 8 * MB
+    ) -> pa.NativeFile:
+        """
+        Open decompressing stream. The stream reads the compressed source incrementally, so the compressed
+        content is never fully in memory. The caller is responsible for closing the stream
+        :param source: compressed source - pa.NativeFile or python binary file object
+        :param codec: pyarrow codec name
+        :param buffer_size: size of reads from the source. Remote files (S3, Hugging Face) serve every read
+                            by a request, so reads are buffered. Non positive value disables buffering
+        :return: stream of decompressed content
+        """
+        if not isinstance(source, pa.NativeFile):
+            source = pa.PythonFile(source, mode="r")
+        if buffer_size > 0:
+            source = pa.BufferedInputStream(source, buffer_size=buffer_size)
+        return pa.CompressedInputStream(source, compression=codec)
+
+    @staticmethod
+    def decompress(data: Any, codec: str, workers: int = DECOMPRESS_WORKERS) -> bytes:
+        """
+        Decompress in memory content. Zstd content larger than PARALLEL_THRESHOLD consisting of
+        multiple frames is decompressed by multiple threads, other content is decompressed by
+        streaming through it
+        :param data: compressed content - bytes, pa.Buffer (possibly memory mapped) or other bytes-like object
+        :param codec: pyarrow codec name
+        :param workers: number of decompression threads
+        :return: decompressed content
+        """
+        if codec == "zstd" and workers > 1 and len(data) >= PARALLEL_THRESHOLD:
+            frames = CompressionUtils.get_zstd_frames(data)
+            if len(frames) > 1:
+                return CompressionUtils._decompress_zstd_frames(
+                    data=pa.py_buffer(data), frames=frames, workers=workers
+                )
+        with pa.CompressedInputStream(pa.BufferReader(data), compression=codec) as f:
+            return f.read()
+
+    @staticmethod
+    def get_zstd_frames(data: Any) -> list[tuple[int, int, int]]:
+        """
+        Find frames of zstd content by walking frame and block headers (without decompressing).
+        Skippable frames are omitted
+        :param data: zstd compressed content
+        :return: list of frames as offset, size and decompressed size (-1 if it is not stored in the frame header).
+                 For content, that is not a valid zstd, an empty list is returned
+        """
+        view = memoryview(data).cast("B")
+        size = len(view)
+        frames = []
+        offset = 0
+        while offset + 4 <= size:
+            magic = int.from_bytes(view[offset : offset + 4], "little")
+            if magic & _ZSTD_SKIPPABLE_MASK == _ZSTD_SKIPPABLE_MAGIC:
+                if offset + 8 > size:
+                    return []
+                offset += 8 + int.from_bytes(view[offset + 4 : offset + 8], "little")
+                continue
+            if magic != _ZSTD_MAGIC or offset + 5 > size:
+                return []
+            start = offset
+            descriptor = view[offset + 4]
+            offset += 5
+            content_size_flag = descriptor >> 6
+            single_segment = (descriptor >> 5) & 1
+            checksum = (descriptor >> 2) & 1
+            if not single_segment:
+                # window descriptor
+                offset += 1
+            offset += (0, 1, 2, 4)[descriptor & 3]
+            content_size_bytes = (single_segment, 2, 4, 8)[content_size_flag]
+            if offset + content_size_bytes > size:
+                return []
+            content_size = -1
+            if content_size_bytes > 0:
+                content_size = int.from_bytes(
+                    view[offset : offset + content_size_bytes], "little"
+                )
+                if content_size_bytes == 2:
+                    content_size += 256
+            offset += content_size_bytes
+            # blocks
+            last = False
+            while not last:
+                if offset + 3 > size:
+                    return []
+                header = int.from_bytes(view[offset : offset + 3], "little")
+                last = bool(header & 1)
+                block_type = (header >> 1) & 3
+                if block_type == 3:
+                    return []
+                # RLE blocks store a single byte
+                offset += 3 + (1 if block_type == 1 else header >> 3)
+            if checksum:
+                offset += 4
+            if offset > size:
+                return []
+            frames.append((start, offset - start, content_size))
+        if offset != size:
+            return []
+        return frames
+
+    @staticmethod
+    def _decompress_zstd_frames(
+        data: pa.Buffer, frames: list[tuple[int, int, int]], workers: int
+    ) -> bytes:
+        """
+        Decompress zstd frames concurrently
+        :param data: zstd compressed content
+        :param frames: frames of the content (see get_zstd_frames)
+        :param workers: number of decompression threads
+        :return: decompressed content
+        """
+
+        def _decompress_frame(frame: tuple[int, int, int]) -> pa.Buffer:
+            offset, length, content_size = frame
+            compressed = data.slice(offset, length)
+            if content_size >= 0:
+                # pyarrow releases GIL during decompression
+                return pa.decompress(
+                    compressed, decompressed_size=content_size, codec="zstd"
+                )
+            with pa.CompressedInputStream(
+                pa.BufferReader(compressed), compression="zstd"
+            ) as f:
+                return f.read_buffer()
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(frames))) as executor:
+            parts = list(executor.map(_decompress_frame, frames))
+        return b"".join(parts)
@@ -7,6 +7,8 @@ from typing import Any
 
 import mmh3
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 
@@ -23,6 +25,37 @@ class TransformUtils:
     Class implementing support methods for filter implementation
     """
 
+    # parquet writer profiles - keyword arguments of pq.ParquetWriter used for writing output tables.
+    # "fast" is CPU lean (for intermediate data), "compact" minimizes the output size and adds page
+    # index, allowing readers to skip pages (for published data). Besides writer arguments, options
+    # can contain row_group_size (maximum number of rows of a row group), passed to write_table
+    PARQUET_PROFILES = {
+        "default": {"compression": "zstd"},
+        "fast": {"compression": "snappy"},
+        "compact": {
+            "compression": "zstd",
+            "compression_level": 9,
+            "write_page_index": True,
+        },
+    }
+
+    @staticmethod
+    def get_parquet_write_options(
+        profile: str = "default", options: dict[str, Any] = None
+    ) -> dict[str, Any]:
+        """
+        Get parquet writer options of a profile
+        :param profile: profile name, one of PARQUET_PROFILES
+        :param options: optional pq.ParquetWriter keyword arguments (and row_group_size) overriding the
+                        ones of the profile
+        :return: pq.ParquetWriter keyword arguments and optional row_group_size
+        """
+        if profile not in TransformUtils.PARQUET_PROFILES:
+            raise ValueError(
+                f"unknown parquet profile {profile}, supported profiles are {list(TransformUtils.PARQUET_PROFILES)}"
+            )
+        return TransformUtils.PARQUET_PROFILES[profile] | (options or {})
+
     @staticmethod
     def deep_get_size(ob) -> int:
         """
@@ -84,7 +117,8 @@ class TransformUtils:
                       otherwise empty string if an error occurs during decoding.
         """
         try:
-            content_string = content_bytes.decode(encoding)
+            # str() accepts any bytes-like object, including pa.Buffer
+            content_string = str(content_bytes, encoding)
             return content_string
         except Exception:
             return ""
@@ -162,28 +196,77 @@ class TransformUtils:
         return table
 
     @staticmethod
-    def convert_arrow_to_binary(table: pa.Table) -> bytes:
+    def convert_arrow_to_binary(
+        table: pa.Table, write_options: dict[str, Any] = None
+    ) -> pa.Buffer:
         """
-        Convert Arrow table to byte array
+        Convert Arrow table to byte array. The result is the Arrow buffer the table was written to,
+        returned without copying it to bytes. It supports len() and the buffer protocol and is accepted
+        by DataAccess.save_file and convert_binary_to_arrow. Use bytes() on it, if bytes are required
         :param table: Arrow table
+        :param write_options: pq.ParquetWriter keyword arguments and optional row_group_size (see get_parquet_write_options),
+                              default profile if not specified
         :return: byte array or None if conversion fails
         """
         from data_processing.utils import get_logger
 
         logger = get_logger(__name__)
+        if write_options is None:
+            write_options = TransformUtils.PARQUET_PROFILES["default"]
         try:
             # convert table to bytes
             writer = pa.BufferOutputStream()
-            # Update default snappy compression to ZSTD.
             # See https://arrow.apache.org/docs/python/generated/pyarrow.parquet.write_table.html
-            pq.write_table(table=table, where=writer, compression="ZSTD")
-            return bytes(writer.getvalue())
+            pq.write_table(table=table, where=writer, **write_options)
+            return writer.getvalue()
         except Exception as e:
             logger.error(
                 f"Failed to convert arrow table to byte array, exception {e}. Skipping it"
             )
             return None
 
+    @staticmethod
+    def get_row_groups(
+        source: Any, metadata: pq.FileMetaData, filter: pc.Expression
+    ) -> tuple[list[int], dict[str, int]]:
+        """
+        Get row groups of parquet file that can contain rows matching the filter. Row groups are
+        eliminated based on the min/max statistics of their column chunks
+        :param source: file object or buffer reader of the parquet file
+        :param metadata: parquet file metadata
+        :param filter: filter expression
+        :return: list of row group indexes (None if the filter could not be evaluated) and
+                 statistics of the skipped row groups
+        """
+        from data_processing.utils import get_logger
+
+        try:
+            fragment = ds.ParquetFileFormat().make_fragment(source)
+            row_groups = [
+                row_group.id for row_group in fragment.subset(filter=filter).row_groups
+            ]
+        except Exception as e:
+            get_logger(__name__).warning(
+                f"Could not evaluate filter {filter} on row groups: {e}"
+            )
+            return None, {}
+        selected = set(row_groups)
+        skipped = [i for i in range(metadata.num_row_groups) if i not in selected]
+        if len(skipped) == 0:
+            return row_groups, {}
+        skipped_bytes = 0
+        for i in skipped:
+            row_group = metadata.row_group(i)
+            for column in range(row_group.num_columns):
+                skipped_bytes += row_group.column(column).total_compressed_size
+        stats = {
+            "filter skipped row groups": len(skipped),
+            "filter skipped bytes": skipped_bytes,
+        }
+        if len(row_groups) == 0:
+            stats["filter skipped files"] = 1
+        return row_groups, stats
+
     @staticmethod
     def add_column(table: pa.Table, name: str, content: list[Any]) -> pa.Table:
         """
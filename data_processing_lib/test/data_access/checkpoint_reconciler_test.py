@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from data_processing.data_access.checkpoint_reconciler import CheckpointReconciler
+
+
+def _files(folder: str, names: list[str]) -> list[dict]:
+    return [{"name": f"{folder}/{name}", "size": 10} for name in names]
+
+
+def test_checkpoint_reconciler():
+    """
+    Testing filtering of already processed files
+    """
+    reconciler = CheckpointReconciler(
+        input_folder="bucket/input", output_folder="bucket/output"
+    )
+    # outputs are added in several batches, can have different extension and duplicates
+    reconciler.add_processed_files(
+        _files("bucket/output", ["a.parquet", "dir/b.parquet"])
+    )
+    reconciler.add_processed_files(_files("bucket/output", ["c.jsonl", "a.parquet"]))
+    reconciler.build()
+    inputs = _files(
+        "bucket/input",
+        ["a.parquet", "b.parquet", "c.zip", "dir/b.parquet", "dir/d.parquet"],
+    )
+    filtered = reconciler.filter_files(inputs[:3])
+    filtered.extend(reconciler.filter_files(inputs[3:]))
+    assert [f["name"] for f in filtered] == [
+        "bucket/input/b.parquet",
+        "bucket/input/dir/d.parquet",
+    ]
+    assert reconciler.skipped == 3
+
+
+def test_checkpoint_reconciler_collision():
+    """
+    Testing that a file, which primary hash collides with a processed file, is not skipped
+    """
+    hashes = {"a": (1, 10), "b": (1, 20), "c": (2, 30)}
+    with patch.object(
+        CheckpointReconciler, "_hash", staticmethod(lambda name: hashes[name])
+    ):
+        reconciler = CheckpointReconciler(input_folder="in", output_folder="out")
+        reconciler.add_processed_files(_files("out", ["a.parquet", "c.parquet"]))
+        filtered = reconciler.filter_files(
+            _files("in", ["a.parquet", "b.parquet", "c.parquet"])
+        )
+    assert [f["name"] for f in filtered] == ["in/b.parquet"]
+    assert reconciler.skipped == 2
+    assert reconciler.collisions == 1
+
+
+def test_checkpoint_reconciler_empty():
+    """
+    Testing filtering without processed files
+    """
+    reconciler = CheckpointReconciler(
+        input_folder="/tmp/input", output_folder="/tmp/output"
+    )
+    inputs = _files("/tmp/input", ["a.parquet", "b.parquet"])
+    assert reconciler.filter_files(inputs) == inputs
+    assert reconciler.filter_files([]) == []
+    assert reconciler.skipped == 0
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from data_processing.data_access import ContentCache
+
+
+def test_content_cache():
+    """
+    Testing cache hits, misses and versions
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        cache = ContentCache(folder=os.path.join(folder, "cache"), max_bytes=1000)
+        assert cache.get(path="bucket/a.parquet", version="1") is None
+        cache.put(path="bucket/a.parquet", version="1", data=b"content 1")
+        assert cache.get(path="bucket/a.parquet", version="1") == b"content 1"
+        # modified file is not served from the cache
+        assert cache.get(path="bucket/a.parquet", version="2") is None
+        assert cache.get_stats() == {"cache hits": 1, "cache misses": 2}
+        # statistics are reset by get_stats
+        assert cache.get_stats() == {}
+        # content larger than the cache is not cached
+        cache.put(path="bucket/b.parquet", version="1", data=b"0" * 1001)
+        assert cache.get(path="bucket/b.parquet", version="1") is None
+
+
+def test_content_cache_eviction():
+    """
+    Testing eviction of the least recently used entries
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        cache = ContentCache(folder=folder, max_bytes=300)
+        for name in ["a", "b", "c"]:
+            cache.put(path=name, version="1", data=name.encode() * 100)
+            # make modification times distinct
+            time.sleep(0.01)
+        # use "a", making "b" the least recently used
+        assert cache.get(path="a", version="1") is not None
+        cache.put(path="d", version="1", data=b"d" * 100)
+        assert cache.get(path="b", version="1") is None
+        for name in ["a", "c", "d"]:
+            assert cache.get(path=name, version="1") == name.encode() * 100
+        assert cache.get_stats()["cache evictions"] == 1
+        # cache shared by another process sees the same entries
+        other = ContentCache(folder=folder, max_bytes=300)
+        assert other.get(path="a", version="1") == b"a" * 100
+
+
+def test_content_cache_concurrent_writers():
+    """
+    Testing that concurrent writers of the same entries never expose partial content
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        caches = [ContentCache(folder=folder, max_bytes=10000) for _ in range(4)]
+        data = {f"file{i}": bytes([i]) * 1000 for i in range(20)}
+
+        def _write(cache: ContentCache) -> None:
+            for path, content in data.items():
+                cache.put(path=path, version="1", data=content)
+                cached = cache.get(path=path, version="1")
+                assert cached is None or cached == content
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_write, caches))
+        assert (
+            sum(os.path.getsize(os.path.join(folder, f)) for f in os.listdir(folder))
+            <= 10000
+        )
+        assert not any(f.endswith(".tmp") for f in os.listdir(folder))
+
+
+def test_content_cache_running_size():
+    """
+    Testing that the cache folder is scanned only when the cache size exceeds the limit
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        cache = ContentCache(folder=folder, max_bytes=1000)
+        with patch.object(cache, "_scan", wraps=cache._scan) as scan:
+            for name in ["a", "b", "c", "d", "e"]:
+                cache.put(path=name, version="1", data=name.encode() * 200)
+            assert scan.call_count == 0
+            cache.put(path="f", version="1", data=b"f" * 200)
+            assert scan.call_count == 1
+        assert cache.size == 1000
+        assert cache.get_stats()["cache evictions"] == 1
+        # size of the existing entries is found by the initial scan
+        assert ContentCache(folder=folder, max_bytes=1000).size == 1000
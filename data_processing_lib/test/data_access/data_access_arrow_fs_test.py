@@ -0,0 +1,191 @@
+import os
+import socket
+import tempfile
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from data_processing.data_access import (
+    DataAccessArrowFS,
+    DataAccessFactory,
+    compute_data_location,
+)
+from moto.server import ThreadedMotoServer
+
+
+def _populate(d_a: DataAccessArrowFS, n_files: int) -> bytes:
+    loc = compute_data_location("test-data/input/sample1.parquet")
+    with open(loc, "rb") as file:
+        bdata = file.read()
+    for i in range(n_files):
+        result, _ = d_a.save_file(
+            path=f"{d_a.get_input_folder()}/sub{i % 2}/sample{i}.parquet", data=bdata
+        )
+        assert result is not None
+    return bdata
+
+
+def _check_data_access(d_a: DataAccessArrowFS) -> None:
+    """
+    Check data access operations on a populated input folder
+    """
+    d_a.set_output_data_access(d_a)
+    bdata = _populate(d_a=d_a, n_files=4)
+    input_folder = d_a.get_input_folder()
+    # listing
+    files, _, retries = d_a.get_files_folder(
+        path=input_folder, files_to_use=[".parquet"], cm_files=-1
+    )
+    assert [file["name"] for file in files] == [
+        f"{input_folder}/sub{i % 2}/sample{i}.parquet" for i in [0, 2, 1, 3]
+    ]
+    assert all(file["size"] == len(bdata) for file in files)
+    assert 0 == retries
+    folders, _ = d_a.get_folders(path=input_folder)
+    assert folders == [f"{input_folder}/sub0", f"{input_folder}/sub1"]
+    # reading
+    path = files[0]["name"]
+    data, _ = d_a.get_file(path=path)
+    assert data == bdata
+    assert isinstance(data, bytes)
+    source, _ = d_a.open_file(path=path)
+    with source:
+        assert (
+            pq.ParquetFile(source, pre_buffer=True)
+            .read()
+            .equals(pq.read_table(pa.BufferReader(bdata)))
+        )
+    missing, _ = d_a.get_file(path=f"{input_folder}/missing.parquet")
+    assert missing is None
+    # compressed files are compressed on save and decompressed on read
+    content = b"This is a compressed test file.\n" * 1000
+    for extension, codec in [("gz", "gzip"), ("zst", "zstd")]:
+        path = f"{input_folder}/file.{extension}"
+        result, _ = d_a.save_file(path=path, data=content)
+        assert result["size"] == len(content)
+        with d_a.fs.open_input_stream(path, compression=None) as f:
+            assert len(f.read()) < len(content)
+        data, _ = d_a.get_file(path=path)
+        assert data == content
+        assert isinstance(data, bytes)
+        stream, _ = d_a.open_stream(path=path)
+        with stream:
+            assert stream.read() == content
+    # incremental writes
+    path = f"{input_folder}/streamed/file.bin"
+    stream, _ = d_a.open_output_stream(path=path)
+    stream.write(b"streamed ")
+    stream.write(b"data")
+    stream.close()
+    assert stream.result == {"name": path, "size": 13}
+    assert d_a.get_file(path=path)[0] == b"streamed data"
+    stream, _ = d_a.open_output_stream(path=f"{input_folder}/aborted.bin")
+    stream.write(b"data")
+    stream.abort()
+    assert d_a.get_file(path=f"{input_folder}/aborted.bin")[0] is None
+    # size of a bytes-like object is its size in bytes, not its number of items
+    path = f"{input_folder}/ints.bin"
+    ints = memoryview(content).cast("I")
+    result, _ = d_a.save_file(path=path, data=ints)
+    assert result["size"] == len(content)
+    data, _ = d_a.get_file(path=path)
+    assert data == content
+    # checkpointing
+    output_location = d_a.get_output_location(path=files[0]["name"])
+    assert output_location == f"{d_a.get_output_folder()}/sub0/sample0.parquet"
+    d_a.save_file(path=output_location, data=bdata)
+    d_a.checkpoint = True
+    to_process, _, _ = d_a.get_files_to_process()
+    assert len(to_process) == 3
+    # metadata
+    result, _ = d_a.save_job_metadata({"job details": {}})
+    assert result is not None
+
+
+def test_local_fs():
+    """
+    Testing data access using local file system
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        d_a = DataAccessArrowFS(
+            fs_config={
+                "input_folder": os.path.join(folder, "input"),
+                "output_folder": os.path.join(folder, "output"),
+            }
+        )
+        assert isinstance(d_a.fs, pafs.LocalFileSystem)
+        _check_data_access(d_a=d_a)
+        # folders of sub tree file system are relative to its root
+        d_a = DataAccessArrowFS(
+            fs_config={"input_folder": "input", "output_folder": "output"},
+            filesystem=pafs.SubTreeFileSystem(folder, pafs.LocalFileSystem()),
+        )
+        files, _, _ = d_a.get_files_folder(
+            path="input", files_to_use=[".parquet"], cm_files=-1
+        )
+        assert len(files) == 4
+        assert files[0]["name"] == "input/sub0/sample0.parquet"
+
+
+def test_s3_fs():
+    """
+    Testing data access using S3 file system, created by the data access factory
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    try:
+        s3_cred = {
+            "access_key": "access",
+            "secret_key": "secret",
+            "url": f"http://127.0.0.1:{port}",
+            "region": "us-east-1",
+        }
+        pafs.S3FileSystem(
+            access_key="access",
+            secret_key="secret",
+            endpoint_override=s3_cred["url"],
+            allow_bucket_creation=True,
+        ).create_dir("test")
+        daf = DataAccessFactory()
+        assert daf.apply_input_params(
+            {
+                "data_s3_cred": s3_cred,
+                "data_arrow_fs_config": {
+                    "input_folder": "s3://test/input/",
+                    "output_folder": "s3://test/output/",
+                },
+            }
+        )
+        d_a = daf.create_data_access()
+        assert isinstance(d_a, DataAccessArrowFS)
+        assert isinstance(d_a.fs, pafs.S3FileSystem)
+        assert d_a.get_input_folder() == "test/input"
+        _check_data_access(d_a=d_a)
+    finally:
+        server.stop()
+
+
+def test_factory_validation():
+    """
+    Testing validation of arrow fs configuration
+    """
+    for params in [
+        # mixed file systems
+        {
+            "data_arrow_fs_config": {
+                "input_folder": "s3://test/input",
+                "output_folder": "/tmp",
+            }
+        },
+        # missing S3 credentials
+        {"data_arrow_fs_config": {"input_folder": "s3://test/input"}},
+        # multiple configurations
+        {
+            "data_arrow_fs_config": {"input_folder": "/tmp"},
+            "data_local_config": {"input_folder": "/tmp"},
+        },
+    ]:
+        assert not DataAccessFactory().apply_input_params(params)
@@ -0,0 +1,307 @@
+import os
+import pickle
+import shutil
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from data_processing.data_access import ContentCache, DataAccessHF
+from huggingface_hub import CommitOperationAdd
+
+
+class _LocalHfFileSystem:
+    """
+    Offline stand-in for HfFileSystem, serving repository paths from a local folder
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.find_calls = 0
+        self.info_calls = 0
+        self.range_reads = 0
+
+    def find(
+        self,
+        path: str,
+        maxdepth: int = None,
+        withdirs: bool = False,
+        detail: bool = False,
+    ) -> dict[str, dict[str, Any]]:
+        self.find_calls += 1
+        res = {}
+        root = os.path.join(self.root, path)
+        for folder, dirs, files in os.walk(root):
+            # depth of the folder entries
+            depth = (
+                1 if folder == root else os.path.relpath(folder, root).count(os.sep) + 2
+            )
+            if maxdepth is not None and depth > maxdepth:
+                dirs.clear()
+                continue
+            if withdirs:
+                for d in dirs:
+                    name = os.path.relpath(os.path.join(folder, d), self.root)
+                    res[name] = {"name": name, "size": 0, "type": "directory"}
+            for file in files:
+                name = os.path.relpath(os.path.join(folder, file), self.root)
+                res[name] = {
+                    "name": name,
+                    "size": os.path.getsize(os.path.join(folder, file)),
+                    "type": "file",
+                }
+        return {name: res[name] for name in sorted(res)}
+
+    def info(self, path: str) -> dict[str, Any]:
+        self.info_calls += 1
+        return {"name": path, "size": os.path.getsize(os.path.join(self.root, path))}
+
+    def open(self, path: str, mode: str) -> Any:
+        return open(os.path.join(self.root, path), mode)
+
+    def cat_file(self, path: str, start: int, end: int) -> bytes:
+        self.range_reads += 1
+        with open(os.path.join(self.root, path), "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def invalidate_cache(self) -> None:
+        pass
+
+    @staticmethod
+    def resolve_path(path: str) -> SimpleNamespace:
+        repo_type, owner, name = path.split("/")[:3]
+        return SimpleNamespace(
+            repo_type=repo_type[:-1],
+            repo_id=f"{owner}/{name}",
+            revision=None,
+            path_in_repo="/".join(path.split("/")[3:]),
+        )
+
+
+class _LocalHfApi:
+    """
+    Offline stand-in for HfApi, returning a configurable repository commit and committing
+    files to a local folder
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.sha = "commit1"
+        self.commits = []
+        # number of the following create_commit invocations, that fail
+        self.failures = 0
+
+    def repo_info(
+        self, repo_id: str, repo_type: str, revision: str = None
+    ) -> SimpleNamespace:
+        return SimpleNamespace(sha=self.sha)
+
+    def create_commit(
+        self,
+        repo_id: str,
+        operations: list[CommitOperationAdd],
+        commit_message: str,
+        repo_type: str,
+        revision: str = None,
+    ) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("commit failed")
+        for operation in operations:
+            path = os.path.join(
+                self.root, f"{repo_type}s", repo_id, operation.path_in_repo
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copyfile(operation.path_or_fileobj, path)
+        self.commits.append([operation.path_in_repo for operation in operations])
+
+
+def _create_data_access(
+    root: str, cache: ContentCache = None, options: dict[str, Any] = None
+) -> tuple[DataAccessHF, _LocalHfFileSystem, _LocalHfApi]:
+    data_access = DataAccessHF(
+        hf_config={
+            "hf_token": "token",
+            "input_folder": "datasets/owner/repo/data",
+            "output_folder": "datasets/owner/repo/output",
+        },
+        content_cache=cache,
+        hf_options=options,
+    )
+    data_access.fs = _LocalHfFileSystem(root=root)
+    data_access.apis = _LocalHfApi(root=root)
+    return data_access, data_access.fs, data_access.apis
+
+
+def _list(data_access: DataAccessHF) -> list[dict[str, Any]]:
+    files, _, retries = data_access.get_files_folder(
+        path="datasets/owner/repo/data", files_to_use=[".parquet"], cm_files=-1
+    )
+    assert retries == 0
+    return files
+
+
+def _populate(root: str) -> None:
+    for name, size in [("a.parquet", 10), ("b.parquet", 20), ("sub/c.parquet", 30)]:
+        path = os.path.join(root, "datasets/owner/repo/data", name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"0" * size)
+    # files without extension are not listed
+    with open(os.path.join(root, "datasets/owner/repo/data/LICENSE"), "wb") as f:
+        f.write(b"license")
+
+
+def test_listing_sizes():
+    """
+    Testing that files are listed with their sizes by a single listing
+    """
+    with tempfile.TemporaryDirectory() as root:
+        _populate(root)
+        data_access, fs, _ = _create_data_access(root=root)
+        assert _list(data_access) == [
+            {"name": "datasets/owner/repo/data/a.parquet", "size": 10},
+            {"name": "datasets/owner/repo/data/b.parquet", "size": 20},
+            {"name": "datasets/owner/repo/data/sub/c.parquet", "size": 30},
+        ]
+        assert fs.find_calls == 1
+        assert fs.info_calls == 0
+
+
+def test_listing_snapshot():
+    """
+    Testing that listing of the same repository commit is served from the snapshot
+    """
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache:
+        _populate(root)
+        data_access, fs, _ = _create_data_access(
+            root=root, cache=ContentCache(folder=cache)
+        )
+        files = _list(data_access)
+        assert fs.find_calls == 1
+        # another data access, sharing the cache, does not list the repository
+        data_access, fs, api = _create_data_access(
+            root=root, cache=ContentCache(folder=cache)
+        )
+        assert _list(data_access) == files
+        assert fs.find_calls == 0
+        # new commit is listed again
+        os.remove(os.path.join(root, "datasets/owner/repo/data/a.parquet"))
+        api.sha = "commit2"
+        files = _list(data_access)
+        assert fs.find_calls == 1
+        assert len(files) == 2
+
+
+def test_batched_commits():
+    """
+    Testing that output files are staged and pushed by multi-file commits
+    """
+    with tempfile.TemporaryDirectory() as root:
+        data_access, _, api = _create_data_access(
+            root=root, options={"commit_files": 2}
+        )
+        for i in range(5):
+            res, _ = data_access.save_file(
+                path=f"datasets/owner/repo/output/file{i}.parquet",
+                data=f"content {i}".encode(),
+            )
+            assert res == {
+                "name": f"datasets/owner/repo/output/file{i}.parquet",
+                "size": 9,
+            }
+        assert api.commits == [
+            ["output/file0.parquet", "output/file1.parquet"],
+            ["output/file2.parquet", "output/file3.parquet"],
+        ]
+        # remaining file is committed by flush
+        assert data_access.flush_files() == (0, 0)
+        assert api.commits[2] == ["output/file4.parquet"]
+        with open(
+            os.path.join(root, "datasets/owner/repo/output/file4.parquet"), "rb"
+        ) as f:
+            assert f.read() == b"content 4"
+        # metadata is committed immediately
+        data_access.save_job_metadata({"job details": {}})
+        assert api.commits[3] == ["output/metadata.json"]
+
+
+def test_commit_retries():
+    """
+    Testing that failed commits are retried, before the staged files are dropped
+    """
+    with tempfile.TemporaryDirectory() as root, patch("time.sleep"):
+        data_access, _, api = _create_data_access(
+            root=root, options={"commit_files": 10, "commit_retries": 3}
+        )
+        data_access.save_file(path="datasets/owner/repo/output/a.parquet", data=b"a")
+        api.failures = 2
+        assert data_access.flush_files() == (0, 2)
+        assert api.commits == [["output/a.parquet"]]
+        data_access.save_file(path="datasets/owner/repo/output/b.parquet", data=b"b")
+        api.failures = 3
+        assert data_access.flush_files() == (1, 2)
+        assert len(api.commits) == 1
+
+
+def test_pickle():
+    """
+    Testing that data access with staged files can be pickled, without copying the staged files
+    """
+    with tempfile.TemporaryDirectory() as root:
+        data_access, _, api = _create_data_access(
+            root=root, options={"commit_files": 10}
+        )
+        data_access.save_file(path="datasets/owner/repo/output/a.parquet", data=b"a")
+        copy = pickle.loads(pickle.dumps(data_access))
+        assert copy.staged == []
+        copy.save_file(path="datasets/owner/repo/output/b.parquet", data=b"b")
+        assert copy.flush_files() == (0, 0)
+        assert data_access.flush_files() == (0, 0)
+        assert api.commits == [["output/a.parquet"]]
+        assert copy.apis.commits == [["output/b.parquet"]]
+
+
+def test_concurrent_reads():
+    """
+    Testing concurrent reads of folder files and range reads of large files
+    """
+    with tempfile.TemporaryDirectory() as root:
+        _populate(root)
+        data_access, fs, _ = _create_data_access(
+            root=root,
+            options={"read_concurrency": 4, "read_part_size": 8, "read_threshold": 15},
+        )
+        files, retries = data_access.get_folder_files(
+            path="datasets/owner/repo/data", extensions=[".parquet"]
+        )
+        assert retries == 0
+        assert {name: len(data) for name, data in files.items()} == {
+            "datasets/owner/repo/data/a.parquet": 10,
+            "datasets/owner/repo/data/b.parquet": 20,
+            "datasets/owner/repo/data/sub/c.parquet": 30,
+        }
+        assert bytes(files["datasets/owner/repo/data/sub/c.parquet"]) == b"0" * 30
+        # files larger than threshold are read by 8 bytes ranges
+        assert fs.range_reads == 3 + 4
+
+
+def test_get_folders():
+    """
+    Testing folders listing
+    """
+    with tempfile.TemporaryDirectory() as root:
+        _populate(root)
+        os.makedirs(os.path.join(root, "datasets/owner/repo/data/sub/part"))
+        data_access, _, _ = _create_data_access(root=root)
+        folders, retries = data_access.get_folders(path="datasets/owner/repo/data")
+        assert retries == 0
+        assert folders == [
+            "datasets/owner/repo/data/sub",
+            "datasets/owner/repo/data/sub/part",
+        ]
+        folders, _ = data_access.get_folders(
+            path="datasets/owner/repo/data", max_depth=1
+        )
+        assert folders == ["datasets/owner/repo/data/sub"]
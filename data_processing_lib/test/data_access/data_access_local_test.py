@@ -1,12 +1,32 @@
+import asyncio
 import gzip
 import json
 import os
+import pickle
+import shutil
+import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
-from data_processing.data_access import DataAccessLocal
-from data_processing.utils import GB, MB, get_logger
+from data_processing.data_access import (
+    DataAccessLocal,
+    FilePrefetcher,
+    compute_data_location,
+)
+from data_processing.examples.noop.python.noop_transform import (
+    NOOPTransform,
+    sleep_key,
+)
+from data_processing.utils import (
+    GB,
+    MB,
+    CompressionUtils,
+    TransformUtils,
+    get_logger,
+)
 
 
 logger = get_logger(__name__)
@@ -126,6 +146,71 @@ class TestGetFilesFolder(TestInit):
         assert result == ([], self.size_stat_dict_empty, 0)
 
 
+class TestGetFolders(TestInit):
+    def test_nested_folders(self):
+        """
+        Tests listing of nested folders with and without depth limit.
+        """
+        directory = os.path.join(self.dal.input_folder, "folders_dir")
+        for sub in ["a/b/c", "a/d", "e"]:
+            os.makedirs(os.path.join(directory, sub), exist_ok=True)
+        folders, retries = self.dal.get_folders(path=directory)
+        top_folders, _ = self.dal.get_folders(path=directory, max_depth=1)
+        shutil.rmtree(directory)
+        expected = ["a", "a/b", "a/b/c", "a/d", "e"]
+        assert folders == [os.path.join(directory, f) for f in expected]
+        assert top_folders == [os.path.join(directory, f) for f in ["a", "e"]]
+        assert retries == 0
+
+    def test_parallel_walk(self):
+        """
+        Tests that folders scanned in parallel are listed in the sorted paths order,
+        including folders, which were not scanned ahead.
+        """
+        directory = os.path.join(self.dal.input_folder, "walk_dir")
+        for i in range(6):
+            for sub in [f"d{i}", f"d{i}/s"]:
+                os.makedirs(os.path.join(directory, sub), exist_ok=True)
+                for name in ["a.parquet", "z.parquet"]:
+                    with open(os.path.join(directory, sub, name), "wb") as f:
+                        f.write(b"0" * i)
+        expected = sorted(
+            str(p) for p in Path(directory).rglob("*.parquet") if p.is_file()
+        )
+        with patch(
+            "data_processing.data_access.data_access_local.LISTING_MAX_PENDING", 2
+        ):
+            files, _, _ = self.dal.get_files_folder(
+                path=directory, files_to_use=[".parquet"], cm_files=-1
+            )
+            # listing stopped early
+            first, _, _ = self.dal.get_files_folder(
+                path=directory, files_to_use=[".parquet"], cm_files=3
+            )
+        shutil.rmtree(directory)
+        assert [f["name"] for f in files] == expected
+        assert files[-1]["size"] == 5
+        assert [f["name"] for f in first] == expected[:3]
+
+    def test_symlink_loop(self):
+        """
+        Tests that symbolic links to folders are not followed, so that a link loop terminates.
+        """
+        directory = os.path.join(self.dal.input_folder, "link_dir")
+        os.makedirs(os.path.join(directory, "a"), exist_ok=True)
+        with open(os.path.join(directory, "a", "f.parquet"), "wb") as f:
+            f.write(b"0")
+        # link to the parent folder
+        os.symlink(directory, os.path.join(directory, "a", "loop"))
+        try:
+            files, _, _ = self.dal.get_files_folder(
+                path=directory, files_to_use=[".parquet"], cm_files=-1
+            )
+        finally:
+            shutil.rmtree(directory)
+        assert [f["name"] for f in files] == [os.path.join(directory, "a", "f.parquet")]
+
+
 class TestGetInputFiles(TestInit):
     def setup_directories(self):
         """
@@ -559,6 +644,43 @@ class TestGetFile(TestInit):
             self.dal.get_file("invalid_gz.gz")
         os.remove("invalid_gz.gz")
 
+    def test_compressed_files(self):
+        content = b"This is a compressed test file.\n" * 1000
+        with tempfile.TemporaryDirectory() as folder:
+            for extension, codec in CompressionUtils.CODECS.items():
+                path = os.path.join(folder, f"test_file{extension}")
+                with pa.CompressedOutputStream(path, compression=codec) as f:
+                    f.write(content)
+                data, _ = self.dal.get_file(path)
+                assert data == content
+                assert isinstance(data, bytes)
+                stream, _ = self.dal.open_stream(path)
+                with stream:
+                    assert stream.read(32) == b"This is a compressed test file.\n"
+                    assert stream.read() == content[32:]
+
+    def test_zstd_frames(self):
+        # multi frame zstd content, as produced by pzstd, is decompressed by multiple threads
+        parts = [bytes([i]) * 10000 + os.urandom(1000) for i in range(8)]
+        content = b"".join(parts)
+        frames = [pa.compress(part, codec="zstd", asbytes=True) for part in parts]
+        skippable = (
+            (0x184D2A50).to_bytes(4, "little") + (4).to_bytes(4, "little") + b"skip"
+        )
+        compressed = frames[0] + skippable + b"".join(frames[1:])
+        found = CompressionUtils.get_zstd_frames(compressed)
+        assert [(length, size) for _, length, size in found] == [
+            (len(frame), len(part)) for frame, part in zip(frames, parts)
+        ]
+        with patch("data_processing.utils.compression_utils.PARALLEL_THRESHOLD", 0):
+            data = CompressionUtils.decompress(compressed, codec="zstd", workers=4)
+            assert isinstance(data, bytes)
+            assert data == content
+        assert (
+            CompressionUtils.decompress(compressed, codec="zstd", workers=1) == content
+        )
+        assert CompressionUtils.get_zstd_frames(compressed[:-1]) == []
+
     def test_mock_open(self):
         with patch("builtins.open") as mock_open:
             mock_open.return_value.__enter__.return_value.read.return_value = (
@@ -567,6 +689,48 @@ class TestGetFile(TestInit):
             data, _ = self.dal.get_file("some_file.txt")
             assert data == b"Mock data"
 
+    def test_memory_map(self):
+        dal = DataAccessLocal(memory_map=True)
+        input_file = os.path.abspath(
+            os.path.join(
+                os.path.dirname(__file__), "../../test-data/noop/input/sample1.parquet"
+            )
+        )
+        data, _ = dal.get_file(input_file)
+        assert isinstance(data, pa.Buffer)
+        with open(input_file, "rb") as f:
+            assert data == f.read()
+        # memory mapped buffer is accepted by table transforms
+        out_files, stats = NOOPTransform({sleep_key: None}).transform_binary(
+            file_name=input_file, byte_array=data
+        )
+        table = TransformUtils.convert_binary_to_arrow(data=out_files[0][0])
+        assert stats["source_doc_count"] == table.num_rows
+        assert table.equals(pq.read_table(input_file))
+        # compressed files are still returned as bytes
+        gzip_file_path = os.path.join(os.sep, "tmp", "test_file_mmap.gz")
+        with gzip.open(gzip_file_path, "wb") as f:
+            f.write(b"This is a compressed test file.")
+        data, _ = dal.get_file(gzip_file_path)
+        os.remove(gzip_file_path)
+        assert data == b"This is a compressed test file."
+        with pytest.raises(FileNotFoundError):
+            dal.get_file("nonexistent_file.parquet")
+
+    def test_open_file(self):
+        input_file = os.path.abspath(
+            os.path.join(
+                os.path.dirname(__file__), "../../test-data/noop/input/sample1.parquet"
+            )
+        )
+        for dal in [self.dal, DataAccessLocal(memory_map=True)]:
+            source, retries = dal.open_file(input_file)
+            assert retries == 0
+            with source:
+                assert pq.ParquetFile(source).read().equals(pq.read_table(input_file))
+        with pytest.raises(FileNotFoundError):
+            self.dal.open_file("nonexistent_file.parquet")
+
 
 class TestGetFolderFiles(TestInit):
     # create test folder and test files (text pdf and bin) inside test folder
@@ -613,6 +777,54 @@ class TestGetFolderFiles(TestInit):
             contents_txt_pdf[self.pdf_file_path][:4] == b"\x25\x50\x44\x46"
         )  # Check PDF header
 
+    def test_iterate_folder_files(self):
+        contents_all, _ = self.dal.get_folder_files(self.test_dir)
+        with patch.object(self.dal, "get_file", wraps=self.dal.get_file) as get_file:
+            files = self.dal.iterate_folder_files(self.test_dir, depth=2)
+            name, data, retries = next(files)
+            # only the files read ahead are read
+            assert get_file.call_count <= 3
+            iterated = {name: data} | {n: d for n, d, _ in files}
+        assert retries == 0
+        assert iterated == contents_all
+        assert list(iterated) == list(contents_all)
+
+    def test_iterate_folder_files_max_bytes(self):
+        contents_all, _ = self.dal.get_folder_files(self.test_dir)
+        assert self.dal.get_file_size(self.text_file_path)[0] == len(
+            contents_all[self.text_file_path]
+        )
+        assert self.dal.get_file_size("nonexistent_file")[0] is None
+        with patch.object(self.dal, "get_file", wraps=self.dal.get_file) as get_file:
+            files = self.dal.iterate_folder_files(self.test_dir, depth=4, max_bytes=1)
+            name, data, _ = next(files)
+            # reads, that were started, reserve the size of files, so a single file is read ahead
+            assert get_file.call_count <= 2
+            iterated = {name: data} | {n: d for n, d, _ in files}
+        assert iterated == contents_all
+
+    def test_prefetch_file_names(self):
+        contents_all, _ = self.dal.get_folder_files(self.test_dir)
+        with (
+            patch.object(self.dal, "get_file_size") as get_file_size,
+            patch.object(self.dal, "get_file", wraps=self.dal.get_file) as get_file,
+        ):
+            prefetcher = FilePrefetcher(
+                data_access=self.dal, files=list(contents_all), depth=4, max_bytes=1
+            )
+            try:
+                first = prefetcher.next_file()
+                # a file of unknown size reserves max_bytes, so a single file is read ahead
+                assert get_file.call_count <= 2
+                iterated = {first: prefetcher.get_file(first)[0]}
+                while (name := prefetcher.next_file()) is not None:
+                    iterated[name] = prefetcher.get_file(name)[0]
+            finally:
+                prefetcher.close()
+            # sizes of files given by name are not requested
+            get_file_size.assert_not_called()
+        assert iterated == contents_all
+
     def test_nonexistent_files(self):
         contents, _ = self.dal.get_folder_files("nonexistent_dir", ["txt"])
         os.remove(self.text_file_path)
@@ -635,6 +847,55 @@ class TestSaveFile(TestInit):
         }
         os.remove(self.new_file_path)
 
+    def test_save_buffer(self):
+        for data in [
+            pa.py_buffer(b"This is new data"),
+            memoryview(b"This is new data"),
+        ]:
+            file_info, _ = self.dal.save_file(self.new_file_path, data)
+            assert file_info["size"] == len(data)
+            with open(self.new_file_path, "rb") as f:
+                assert f.read() == b"This is new data"
+            os.remove(self.new_file_path)
+
     def test_invalid_filename(self):
         file_info, _ = self.dal.save_file("", b"Data")
         assert file_info is None
+
+    def test_output_stream(self):
+        path = os.path.join(os.sep, "tmp", "new_folder", "new_file.bin")
+        folder = os.path.dirname(path)
+        stream, _ = self.dal.open_output_stream(path)
+        stream.write(b"This is ")
+        stream.write(memoryview(b"new data"))
+        # the file is created by close
+        assert not os.path.exists(path)
+        stream.close()
+        assert stream.result == {"name": path, "size": 16}
+        with open(path, "rb") as f:
+            assert f.read() == b"This is new data"
+        # aborted file is not created
+        stream, _ = self.dal.open_output_stream(path)
+        stream.write(b"Partial data")
+        stream.abort()
+        assert stream.result is None
+        with open(path, "rb") as f:
+            assert f.read() == b"This is new data"
+        assert os.listdir(folder) == ["new_file.bin"]
+        shutil.rmtree(folder)
+
+
+def test_async_close():
+    """
+    Testing that threads of the async API are released and not pickled
+    """
+    d_a = DataAccessLocal(
+        local_config={"input_folder": "input", "output_folder": "output"}
+    )
+    loc = compute_data_location("test-data/input/sample1.parquet")
+    data, _ = asyncio.run(d_a.aget_file(path=loc))
+    assert data is not None
+    assert d_a.async_executor is not None
+    assert pickle.loads(pickle.dumps(d_a)).async_executor is None
+    d_a.close()
+    assert d_a.async_executor is None
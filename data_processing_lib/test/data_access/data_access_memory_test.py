@@ -0,0 +1,259 @@
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from multiprocessing import shared_memory
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import ray
+from data_processing.data_access import (
+    DataAccessFactory,
+    DataAccessMemory,
+    compute_data_location,
+)
+from data_processing.data_access import memory_store
+
+
+def _memory_config(**kwargs) -> dict[str, Any]:
+    return {
+        "input_folder": "input",
+        "output_folder": "output",
+        "source_folder": compute_data_location("test-data/input"),
+    } | kwargs
+
+
+def _read_files(config: dict[str, Any]) -> tuple[bool, list[int]]:
+    # executed in a spawned process, attaching to the store published by the test process
+    d_a = DataAccessMemory(memory_config=config)
+    files, _, _ = d_a.get_files_to_process()
+    sizes = [len(d_a.get_file(path=path)[0]) for path in files]
+    return d_a.store.owner, sizes
+
+
+def test_memory_data_access():
+    """
+    Testing data access operations on test data and generated files
+    """
+    d_a = DataAccessMemory(memory_config=_memory_config(n_files=3, rows=10))
+    d_a.set_output_data_access(d_a)
+    # listing
+    files, profile, _ = d_a.get_files_to_process()
+    assert files == [
+        "input/generated_000000.parquet",
+        "input/generated_000001.parquet",
+        "input/generated_000002.parquet",
+        "input/sample1.parquet",
+    ]
+    assert profile["max_file_size"] > 0
+    # reading
+    with open(compute_data_location("test-data/input/sample1.parquet"), "rb") as f:
+        bdata = f.read()
+    data, _ = d_a.get_file(path="input/sample1.parquet")
+    assert data == bdata
+    table = pq.read_table(pa.BufferReader(d_a.get_file(files[0])[0]))
+    assert table.column_names == ["document_id", "contents"]
+    assert table.num_rows == 10
+    source, _ = d_a.open_file(path="input/sample1.parquet")
+    assert (
+        pq.ParquetFile(source).metadata.num_rows
+        == pq.read_metadata(pa.BufferReader(bdata)).num_rows
+    )
+    assert d_a.get_file(path="input/missing.parquet")[0] is None
+    # writing and checkpointing
+    d_a.save_file(path=d_a.get_output_location(files[0]), data=bdata)
+    d_a.save_file(path="input/sub/file.gz", data=pa.compress(bdata, codec="gzip"))
+    assert d_a.get_file(path="input/sub/file.gz")[0] == bdata
+    assert d_a.get_folders(path="input")[0] == ["input/sub"]
+    d_a.checkpoint = True
+    files, _, _ = d_a.get_files_to_process()
+    assert len(files) == 3
+    result, _ = d_a.save_job_metadata({"job details": {}})
+    assert result["name"] == "output/metadata.json"
+
+
+def test_shared_store():
+    """
+    Testing that the store is shared by data accesses of the same content and by other processes
+    """
+    config = _memory_config(n_files=2, rows=10)
+    d_a = DataAccessMemory(memory_config=config)
+    assert d_a.store is DataAccessMemory(memory_config=config).store
+    assert d_a.store is not DataAccessMemory(memory_config=_memory_config()).store
+    assert pickle.loads(pickle.dumps(d_a.store)) is d_a.store
+    files, _, _ = d_a.get_files_to_process()
+    sizes = [len(d_a.get_file(path=path)[0]) for path in files]
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        owner, child_sizes = pool.apply(_read_files, (config,))
+    assert not owner
+    assert child_sizes == sizes
+
+
+def test_ray_actors():
+    """
+    Testing that the store is read by Ray actors
+    """
+    config = _memory_config(n_files=2, rows=20)
+    d_a = DataAccessMemory(memory_config=config)
+    files, _, _ = d_a.get_files_to_process()
+    ray.init(num_cpus=1)
+    try:
+        actors = [
+            ray.remote(DataAccessMemory)
+            .options(num_cpus=0)
+            .remote(memory_config=config)
+            for _ in range(2)
+        ]
+        for actor in actors:
+            # actors attach to the store published by the test process
+            assert not ray.get(actor.__ray_call__.remote(lambda d: d.store.owner))
+            assert ray.get(actor.get_files_to_process.remote())[0] == files
+            for path in files:
+                data, _ = ray.get(actor.get_file.remote(path=path))
+                assert data == d_a.get_file(path=path)[0]
+    finally:
+        ray.shutdown()
+    assert d_a.store.owner
+
+
+def test_discard_output():
+    """
+    Testing that only names and sizes of saved files are kept if output is discarded
+    """
+    d_a = DataAccessMemory(memory_config=_memory_config(discard_output=True))
+    d_a.set_output_data_access(d_a)
+    files, _, _ = d_a.get_files_to_process()
+    result, _ = d_a.save_file(path=d_a.get_output_location(files[0]), data=b"data")
+    assert result == {"name": "output/sample1.parquet", "size": 4}
+    assert d_a.get_file(path="output/sample1.parquet")[0] is None
+    assert d_a.get_files_folder(path="output", files_to_use=None, cm_files=-1)[0] == [
+        {"name": "output/sample1.parquet", "size": 4}
+    ]
+    # input files are not discarded
+    assert d_a.get_file(path=files[0])[0] is not None
+
+
+def test_output_stream():
+    """
+    Testing that output streams of data accesses without incremental writes are saved on close
+    """
+    d_a = DataAccessMemory(memory_config=_memory_config())
+    stream, _ = d_a.open_output_stream(path="output/streamed.bin")
+    stream.write(b"streamed ")
+    stream.write(b"data")
+    assert d_a.get_file(path="output/streamed.bin")[0] is None
+    stream.close()
+    assert stream.result == {"name": "output/streamed.bin", "size": 13}
+    assert d_a.get_file(path="output/streamed.bin")[0] == b"streamed data"
+    stream, _ = d_a.open_output_stream(path="output/aborted.bin")
+    stream.write(b"data")
+    stream.abort()
+    assert d_a.get_file(path="output/aborted.bin")[0] is None
+
+
+def test_checkpoint_not_supported():
+    """
+    Testing that checkpointing is disabled, as outputs of other processes are not visible
+    """
+    d_a = DataAccessMemory(memory_config=_memory_config(), checkpoint=True)
+    d_a.set_output_data_access(d_a)
+    d_a.save_file(path="output/sample1.parquet", data=b"data")
+    assert d_a.get_files_to_process()[0] == ["input/sample1.parquet"]
+    assert not DataAccessFactory().apply_input_params(
+        {"data_memory_config": _memory_config(), "data_checkpointing": True}
+    )
+
+
+def test_source_version():
+    """
+    Testing that a modified source folder is published as a new store
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        shutil.copy(compute_data_location("test-data/input/sample1.parquet"), folder)
+        config = _memory_config(source_folder=folder)
+        store = DataAccessMemory(memory_config=config).store
+        assert DataAccessMemory(memory_config=config).store is store
+        with open(os.path.join(folder, "sample1.parquet"), "ab") as f:
+            f.write(b"modified")
+        d_a = DataAccessMemory(memory_config=config)
+        assert d_a.store is not store
+        assert d_a.get_file(path="input/sample1.parquet")[0][-8:] == b"modified"
+
+
+def test_incomplete_store():
+    """
+    Testing that an incomplete segment, left by a killed publisher, is replaced
+    """
+    config = _memory_config(n_files=1, rows=30)
+    store = DataAccessMemory(memory_config=config).store
+    name = store.name
+    store.close()
+    memory_store._stores.pop(name)
+    # segment without index, as left by a publisher killed while writing it
+    stale = shared_memory.SharedMemory(name=name, create=True, size=1024)
+    stale.close()
+    d_a = DataAccessMemory(memory_config=config)
+    assert d_a.store.owner
+    files, _, _ = d_a.get_files_to_process()
+    assert len(files) == 2
+    assert d_a.get_file(path=files[0])[0] is not None
+
+
+def test_concurrent_publish():
+    """
+    Testing that a segment, which is being published by another process, is waited for and not replaced
+    """
+    config = _memory_config(n_files=1, rows=40)
+    store = DataAccessMemory(memory_config=config).store
+    name = store.name
+    store.close()
+    memory_store._stores.pop(name)
+    result = {}
+    with memory_store._creation_lock(name=name):
+        # segment without index, which publication is in progress
+        segment = shared_memory.SharedMemory(name=name, create=True, size=1024)
+        reader = threading.Thread(
+            target=lambda: result.update(d_a=DataAccessMemory(memory_config=config))
+        )
+        reader.start()
+        reader.join(timeout=0.5)
+        assert reader.is_alive()
+        # complete the publication
+        header = b'{"input/published.parquet": [0, 4]}'
+        segment.buf[8 : 8 + len(header)] = header
+        segment.buf[8 + len(header) : 12 + len(header)] = b"data"
+        segment.buf[:8] = len(header).to_bytes(8, "little")
+    reader.join()
+    d_a = result["d_a"]
+    try:
+        assert not d_a.store.owner
+        assert d_a.get_files_to_process()[0] == ["input/published.parquet"]
+        assert d_a.get_file(path="input/published.parquet")[0] == b"data"
+    finally:
+        d_a.store.close()
+        memory_store._stores.pop(name)
+        segment.close()
+        segment.unlink()
+
+
+def test_factory():
+    """
+    Testing creation of memory data access by the data access factory
+    """
+    daf = DataAccessFactory()
+    assert daf.apply_input_params({"data_memory_config": _memory_config()})
+    assert isinstance(daf.create_data_access(), DataAccessMemory)
+    for params in [
+        {"data_memory_config": {}},
+        {"data_memory_config": _memory_config(source_folder="/missing/folder")},
+        {"data_memory_config": _memory_config(n_files=-1)},
+        {"data_memory_config": _memory_config(discard_output="yes")},
+        {
+            "data_memory_config": _memory_config(),
+            "data_local_config": {"input_folder": "/tmp"},
+        },
+    ]:
+        assert not DataAccessFactory().apply_input_params(params)
@@ -1,6 +1,27 @@
-from data_processing.data_access import DataAccessS3
+import asyncio
+import os
+import socket
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_processing.data_access import (
+    ContentCache,
+    DataAccessFactory,
+    DataAccessS3,
+    S3ClientPool,
+)
+from data_processing.examples.noop.python.noop_transform import NOOPTransform
+from data_processing.runtime.python.transform_file_processor import (
+    PythonTransformFileProcessor,
+)
+from data_processing.transform import TransformStatistics
 from moto import mock_aws
+from moto.server import ThreadedMotoServer
 from data_processing.data_access import compute_data_location
+from data_processing.utils import MB, TransformUtils
 
 
 s3_cred = {
@@ -48,6 +69,7 @@ def test_file_read_write():
         print(f"\nGot file with the length {len(data)}")
         assert 0 == retries
         assert 36132 == len(data)
+        assert d_a.get_file_size(path=input_location) == (36132, 0)
         # get table output location
         output_location = d_a.get_output_location(input_location)
         print(f"Output location {output_location}")
@@ -114,3 +136,499 @@ def test_files_to_process():
         assert 0.034458160400390625 == profile["max_file_size"]
         assert 0.034458160400390625 == profile["min_file_size"]
         assert 0.20674896240234375 == profile["total_file_size"]
+
+
+def test_streaming_files_to_process():
+    """
+    Testing streaming listing of files to process
+    :return: None
+    """
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred, s3_config=s3_conf, checkpoint=False, m_files=-1
+        )
+        d_a.set_output_data_access(d_a)
+        # populate bucket
+        _create_and_populate_files(
+            d_a=d_a, input_location=f"{s3_conf['input_folder']}dataset=d1/", n_files=4
+        )
+        _create_and_populate_files(
+            d_a=d_a, input_location=f"{s3_conf['input_folder']}dataset=d2/", n_files=4
+        )
+        # stream files to process
+        files = []
+        for batch, _ in d_a.iterate_files_to_process():
+            files.extend(batch)
+        print(f"\nstreamed files {len(files)}")
+        assert files == d_a.get_files_to_process()[0]
+        # max files
+        d_a.m_files = 3
+        files = []
+        for batch, _ in d_a.iterate_files_to_process():
+            files.extend(batch)
+        assert 3 == len(files)
+        # use checkpoint
+        _create_and_populate_files(
+            d_a=d_a, input_location=f"{s3_conf['output_folder']}dataset=d2/", n_files=2
+        )
+        d_a.m_files = -1
+        d_a.checkpoint = True
+        files = []
+        for batch, _ in d_a.iterate_files_to_process():
+            files.extend(batch)
+        print(f"streamed files with checkpointing {len(files)}")
+        assert 6 == len(files)
+        assert f"{s3_conf['input_folder']}dataset=d2/sample0.parquet" not in files
+        # failure in the middle of the listing is raised, not truncating the files to process
+        d_a.checkpoint = False
+
+        def _failing_listing(key: str):
+            yield [{"name": f"{key}sample0.parquet", "size": 100}], 0
+            raise RuntimeError("listing failure")
+
+        files = []
+        with patch.object(d_a.arrS3, "iterate_files", _failing_listing):
+            try:
+                for batch, _ in d_a.iterate_files_to_process():
+                    files.extend(batch)
+                assert False, "listing failure is not raised"
+            except RuntimeError:
+                pass
+        assert 1 == len(files)
+
+
+def test_parallel_listing():
+    """
+    Testing prefix-sharded parallel listing
+    :return: None
+    """
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred,
+            s3_config=s3_conf,
+            checkpoint=False,
+            m_files=-1,
+            s3_options={"list_workers": 3, "list_fan_out": 2},
+        )
+        d_a.set_output_data_access(d_a)
+        # populate bucket, including files above the fan out levels
+        _create_and_populate_files(
+            d_a=d_a, input_location=s3_conf["input_folder"], n_files=2
+        )
+        for d in range(5):
+            for p in range(2):
+                _create_and_populate_files(
+                    d_a=d_a,
+                    input_location=f"{s3_conf['input_folder']}dataset=d{d}/part={p}/",
+                    n_files=3,
+                )
+        # list in parallel and compare with the serial listing
+        files, _ = d_a.arrS3.list_files(key=d_a.get_input_folder())
+        d_a.arrS3.list_workers = 1
+        serial_files, _ = d_a.arrS3.list_files(key=d_a.get_input_folder())
+        print(f"\nlisted {len(files)} files in parallel")
+        assert 32 == len(files)
+        assert sorted(files, key=lambda f: f["name"]) == serial_files
+        # stopping iteration early stops the listing
+        d_a.arrS3.list_workers = 3
+        batches = d_a.arrS3.iterate_files(key=d_a.get_input_folder())
+        first, _ = next(batches)
+        batches.close()
+        assert 2 == len(first)
+
+
+def test_get_folders():
+    """
+    Testing concurrent breadth first folders listing
+    :return: None
+    """
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred,
+            s3_config=s3_conf,
+            checkpoint=False,
+            m_files=-1,
+            s3_options={"list_workers": 4},
+        )
+        d_a.set_output_data_access(d_a)
+        # populate bucket
+        for d in range(3):
+            for p in range(2):
+                _create_and_populate_files(
+                    d_a=d_a,
+                    input_location=f"{s3_conf['input_folder']}dataset=d{d}/part={p}/",
+                    n_files=1,
+                )
+        folders, retries = d_a.get_folders(path=d_a.get_input_folder())
+        print(f"\ngot folders {folders}")
+        assert 9 == len(folders)
+        assert 0 == retries
+        assert f"{s3_conf['input_folder']}dataset=d0/" == folders[0]
+        assert f"{s3_conf['input_folder']}dataset=d0/part=0/" == folders[1]
+        # limit depth
+        folders, _ = d_a.get_folders(path=d_a.get_input_folder(), max_depth=1)
+        assert 3 == len(folders)
+        # folder failing to be listed fails the listing instead of dropping its sub folders
+        list_level = d_a.arrS3._list_prefix_level
+
+        def _failing_list_level(bucket: str, prefix: str) -> Any:
+            if prefix.endswith("dataset=d1/"):
+                raise RuntimeError("listing failure")
+            return list_level(bucket=bucket, prefix=prefix)
+
+        d_a.arrS3.retries = 2
+        with patch.object(d_a.arrS3, "_list_prefix_level", _failing_list_level):
+            try:
+                d_a.get_folders(path=d_a.get_input_folder())
+                assert False, "listing failure is not reported"
+            except IOError as e:
+                assert "dataset=d1/" in str(e)
+
+
+def test_ranged_read():
+    """
+    Testing concurrent ranged reads
+    :return: None
+    """
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred,
+            s3_config=s3_conf,
+            checkpoint=False,
+            m_files=-1,
+            s3_options={
+                "read_part_size": 4096,
+                "read_concurrency": 4,
+                "read_threshold": 10000,
+            },
+        )
+        d_a.set_output_data_access(d_a)
+        # populate bucket
+        input_location = "test/table_read_write/input/"
+        _create_and_populate_files(d_a=d_a, input_location=input_location, n_files=1)
+        d_a.save_file(path=f"{input_location}empty.parquet", data=b"")
+        loc = compute_data_location("test-data/input/sample1.parquet")
+        with open(loc, "rb") as file:
+            expected = file.read()
+        # concurrent ranges
+        data, retries = d_a.get_file(path=f"{input_location}sample0.parquet")
+        assert 0 == retries
+        assert expected == data
+        # below threshold the file is read by a single request
+        d_a.arrS3.read_threshold = 64 * 1024
+        with patch.object(
+            d_a.arrS3.s3_client, "get_object", wraps=d_a.arrS3.s3_client.get_object
+        ) as get:
+            data, _ = d_a.get_file(path=f"{input_location}sample0.parquet")
+            assert get.call_count == 1
+        assert expected == data
+        # empty file
+        data, _ = d_a.get_file(path=f"{input_location}empty.parquet")
+        assert b"" == data
+        # ranges of a different version are not read
+        key = f"{input_location}sample0.parquet"
+        bucket, prefix = d_a.arrS3._get_bucket_key(key)
+        data, _, version, _ = d_a.arrS3._read_range(
+            key=key, bucket=bucket, prefix=prefix, start=0, end=10
+        )
+        assert version == d_a.arrS3.get_file_version(key=key)[0]
+        data, _, _, _ = d_a.arrS3._read_range(
+            key=key, bucket=bucket, prefix=prefix, start=0, end=10, version='"other"'
+        )
+        assert data is None
+
+
+def test_save_buffer():
+    """
+    Testing saving of Arrow buffers and memory views
+    :return: None
+    """
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred, s3_config=s3_conf, checkpoint=False, m_files=-1
+        )
+        d_a.set_output_data_access(d_a)
+        d_a.arrS3.s3_client.create_bucket(Bucket="test")
+        loc = compute_data_location("test-data/input/sample1.parquet")
+        table = pq.read_table(loc)
+        data = TransformUtils.convert_arrow_to_binary(table=table)
+        assert isinstance(data, pa.Buffer)
+        output_location = f"{d_a.get_output_folder()}buffer.parquet"
+        for d in [data, memoryview(data)]:
+            result, retries = d_a.save_file(path=output_location, data=d)
+            assert result is not None
+            assert 0 == retries
+            res, _ = d_a.get_file(path=output_location)
+            assert data == res
+            assert table.equals(TransformUtils.convert_binary_to_arrow(data=res))
+
+
+def test_output_stream():
+    """
+    Testing writes of large files by multipart uploads
+    :return: None
+    """
+    with mock_aws():
+        d_a = DataAccessS3(s3_credentials=s3_cred, s3_config=s3_conf)
+        d_a.arrS3.s3_client.create_bucket(Bucket="test")
+        data = os.urandom(12 * MB)
+        path = "test/output/large.bin"
+        with patch.object(
+            d_a.arrS3.s3_client,
+            "upload_part",
+            wraps=d_a.arrS3.s3_client.upload_part,
+        ) as upload_part:
+            stream, _ = d_a.open_output_stream(path=path)
+            for start in range(0, len(data), MB):
+                stream.write(data[start : start + MB])
+            # parts are uploaded as they are filled
+            assert upload_part.call_count == 1
+            stream.close()
+            assert upload_part.call_count == 2
+        assert stream.result == {"name": path, "size": len(data)}
+        assert d_a.get_file(path=path)[0] == data
+        # small files are uploaded by a single request
+        stream, _ = d_a.open_output_stream(path="test/output/small.bin")
+        stream.write(b"small")
+        stream.close()
+        assert d_a.get_file(path="test/output/small.bin")[0] == b"small"
+        # aborted upload does not create the object
+        stream, _ = d_a.open_output_stream(path="test/output/aborted.bin")
+        stream.write(data)
+        stream.abort()
+        assert d_a.get_file_size(path="test/output/aborted.bin")[0] is None
+        assert (
+            d_a.arrS3.s3_client.list_multipart_uploads(Bucket="test").get("Uploads", [])
+            == []
+        )
+
+
+def test_open_file():
+    """
+    Testing random access reading
+    :return: None
+    """
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred, s3_config=s3_conf, checkpoint=False, m_files=-1
+        )
+        d_a.set_output_data_access(d_a)
+        # populate bucket
+        input_location = "test/table_read_write/input/"
+        _create_and_populate_files(d_a=d_a, input_location=input_location, n_files=1)
+        loc = compute_data_location("test-data/input/sample1.parquet")
+        source, retries = d_a.open_file(path=f"{input_location}sample0.parquet")
+        assert 0 == retries
+        assert 36132 == source.seek(0, 2)
+        source.seek(0)
+        with source:
+            parquet_file = pq.ParquetFile(source)
+            assert parquet_file.read().equals(pq.read_table(loc))
+            assert 0 == source.retries
+        # non existent file
+        source, _ = d_a.open_file(path=f"{input_location}missing.parquet")
+        assert source is None
+
+
+def test_async_api():
+    """
+    Testing async data access API
+    :return: None
+    """
+
+    async def _run(d_a: DataAccessS3) -> None:
+        input_location = "test/table_read_write/input/"
+        data, retries = await d_a.aget_file(path=f"{input_location}sample0.parquet")
+        assert 0 == retries
+        assert 36132 == len(data)
+        result, _ = await d_a.asave_file(
+            path=f"{s3_conf['output_folder']}sample0.parquet", data=data
+        )
+        assert result is not None
+        files = []
+        async for batch, _ in d_a.aiterate_files_folder(
+            path=input_location, files_to_use=[".parquet"], cm_files=-1
+        ):
+            files.extend(batch)
+        assert 5 == len(files)
+        contents, _ = await d_a.aget_folder_files(
+            path=input_location, extensions=[".parquet"]
+        )
+        assert 5 == len(contents)
+        assert all(36132 == len(c) for c in contents.values())
+
+    with mock_aws():
+        # create data access
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred, s3_config=s3_conf, checkpoint=False, m_files=-1
+        )
+        d_a.set_output_data_access(d_a)
+        _create_and_populate_files(
+            d_a=d_a, input_location="test/table_read_write/input/", n_files=5
+        )
+        asyncio.run(_run(d_a))
+        # async threads are released by close
+        assert d_a.async_executor is not None
+        d_a.close()
+        assert d_a.async_executor is None
+        # and created again on demand
+        asyncio.run(_run(d_a))
+        d_a.close()
+
+
+def test_content_cache():
+    """
+    Testing that cached files are downloaded only once, unless they are modified
+    """
+    with mock_aws(), tempfile.TemporaryDirectory() as folder:
+        d_a = DataAccessS3(
+            s3_credentials=s3_cred,
+            s3_config=s3_conf,
+            content_cache=ContentCache(folder=folder),
+        )
+        input_location = d_a.get_input_folder()
+        _create_and_populate_files(d_a=d_a, input_location=input_location, n_files=1)
+        path = f"{input_location}sample0.parquet"
+        with patch.object(
+            d_a.arrS3, "read_file_versioned", wraps=d_a.arrS3.read_file_versioned
+        ) as read:
+            data, _ = d_a.get_file(path=path)
+            cached, _ = d_a.get_file(path=path)
+            assert cached == data
+            assert read.call_count == 1
+            # modified file is read again
+            d_a.save_file(path=path, data=b"modified")
+            modified, _ = d_a.get_file(path=path)
+            assert modified == b"modified"
+            assert read.call_count == 2
+        assert d_a.get_cache_stats() == {"cache hits": 1, "cache misses": 2}
+        # file modified between HEAD and GET is cached under the version returned by GET
+        path = f"{input_location}sample1.parquet"
+        d_a.save_file(path=path, data=b"version 1")
+        old_version, _ = d_a.arrS3.get_file_version(key=path)
+        d_a.save_file(path=path, data=b"version 2")
+        new_version, _ = d_a.arrS3.get_file_version(key=path)
+        with patch.object(d_a.arrS3, "get_file_version", return_value=(old_version, 0)):
+            assert d_a.get_file(path=path)[0] == b"version 2"
+        assert d_a.content_cache.get(path=path, version=old_version) is None
+        assert d_a.content_cache.get(path=path, version=new_version) == b"version 2"
+
+
+def test_compressed_files():
+    """
+    Testing reading of compressed files, decompressed while downloaded and from the content cache
+    """
+    content = b"This is a compressed test file.\n" * 1000
+    with mock_aws(), tempfile.TemporaryDirectory() as folder:
+        d_a = DataAccessS3(s3_credentials=s3_cred, s3_config=s3_conf)
+        d_a.arrS3.s3_client.create_bucket(Bucket="test")
+        cached = DataAccessS3(
+            s3_credentials=s3_cred,
+            s3_config=s3_conf,
+            content_cache=ContentCache(folder=folder),
+        )
+        input_location = d_a.get_input_folder()
+        for extension, codec in [("gz", "gzip"), ("zst", "zstd"), ("lz4", "lz4")]:
+            path = f"{input_location}file.{extension}"
+            d_a.save_file(path=path, data=pa.compress(content, codec=codec))
+            with patch.object(
+                d_a.arrS3, "read_file", wraps=d_a.arrS3.read_file
+            ) as read:
+                data, retries = d_a.get_file(path=path)
+                assert data == content
+                assert isinstance(data, bytes)
+                assert 0 == retries
+                # streamed through a single GET
+                assert read.call_count == 0
+            data, _ = cached.get_file(path=path)
+            assert data == content
+            stream, _ = d_a.open_stream(path=path)
+            with stream:
+                assert stream.read(32) == b"This is a compressed test file.\n"
+        # large file is downloaded by a single request, not by buffer size ranges
+        large = os.urandom(20 * MB)
+        path = f"{input_location}large.gz"
+        d_a.save_file(path=path, data=pa.compress(large, codec="gzip"))
+        with patch.object(
+            d_a.arrS3.s3_client, "get_object", wraps=d_a.arrS3.s3_client.get_object
+        ) as get:
+            data, _ = d_a.get_file(path=path)
+            assert data == large
+            assert get.call_count == 1
+        # invalid compressed content
+        path = f"{input_location}invalid.gz"
+        d_a.save_file(path=path, data=b"Invalid data")
+        data, _ = d_a.get_file(path=path)
+        assert data is None
+
+
+def test_shared_client():
+    """
+    Testing that S3 clients and their connection pools are shared by data accesses of the process
+    :return: None
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    try:
+        S3ClientPool.clear()
+        cred = s3_cred | {"url": f"http://127.0.0.1:{port}"}
+        d_a = DataAccessS3(s3_credentials=cred, s3_config=s3_conf)
+        other = DataAccessS3(s3_credentials=cred, s3_config=s3_conf)
+        assert d_a.arrS3.s3_client is other.arrS3.s3_client
+        # different client options use a different client
+        tuned = DataAccessS3(
+            s3_credentials=cred,
+            s3_config=s3_conf,
+            s3_options={"max_pool_connections": 4, "read_timeout": 10},
+        )
+        assert tuned.arrS3.s3_client is not d_a.arrS3.s3_client
+        assert tuned.arrS3.s3_client.meta.config.max_pool_connections == 4
+        _create_and_populate_files(
+            d_a=d_a, input_location=d_a.get_input_folder(), n_files=3
+        )
+        files, _, _ = other.get_files_to_process()
+        for path in files:
+            assert other.get_file(path=path)[0] is not None
+        stats = d_a.get_pool_stats()
+        assert stats["s3 clients created"] == 2
+        assert stats["s3 client reuses"] == 1
+        # requests of both data accesses reuse the connections of the shared pool
+        assert stats["s3 requests"] >= 7
+        assert 1 <= stats["s3 connections"] < stats["s3 requests"]
+        # statistics are reported once
+        assert other.get_pool_stats() == {}
+        # connection pools, that can not be accessed, are not reported
+        with patch.object(
+            S3ClientPool, "_get_connections", staticmethod(lambda clients: None)
+        ):
+            other.get_file(path=files[0])
+            assert other.get_pool_stats() == {"s3 requests": 1}
+        # file processors publish the statistics of the clients
+        daf = DataAccessFactory()
+        assert daf.apply_input_params({"data_s3_cred": cred, "data_s3_config": s3_conf})
+        statistics = TransformStatistics()
+        processor = PythonTransformFileProcessor(
+            data_access_factory=[daf, daf],
+            statistics=statistics,
+            transform_params={"sleep_sec": 0},
+            transform_class=NOOPTransform,
+            is_folder=False,
+        )
+        processor.process_files(files[:1])
+        processor.flush()
+        stats = statistics.get_execution_stats()
+        assert stats["s3 client reuses"] == 2
+        # read and write
+        assert stats["s3 requests"] >= 2
+    finally:
+        S3ClientPool.clear()
+        server.stop()
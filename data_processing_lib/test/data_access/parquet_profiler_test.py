@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_processing.data_access import DataAccessLocal, ParquetProfiler
+from data_processing.data_access.parquet_profiler import main
+
+
+def _populate(folder: str) -> None:
+    for name, rows in [("a.parquet", 100), ("sub/b.parquet", 300)]:
+        os.makedirs(os.path.dirname(os.path.join(folder, name)), exist_ok=True)
+        pq.write_table(
+            pa.table({"id": list(range(rows)), "text": ["doc"] * rows}),
+            os.path.join(folder, name),
+        )
+    # different schema
+    pq.write_table(pa.table({"id": list(range(50))}), os.path.join(folder, "c.parquet"))
+    # not a parquet file
+    with open(os.path.join(folder, "d.parquet"), "wb") as f:
+        f.write(b"not a parquet file")
+
+
+def test_profile():
+    """
+    Testing profile of all files
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        _populate(folder)
+        profiler = ParquetProfiler(data_access=DataAccessLocal(), workers=2)
+        profile, retries = profiler.profile(path=folder)
+    assert retries == 0
+    assert profile["files"] == 4
+    assert profile["profiled files"] == 3
+    assert profile["failed files"] == 1
+    assert profile["rows"] == 450
+    assert "estimated rows" not in profile
+    assert 0 < profile["compressed size MB"] < profile["total file size MB"]
+    assert profile["uncompressed size MB"] > 0
+    assert not profile["schema consistent"]
+    assert [(s["schema"], s["files"]) for s in profile["schemas"]] == [
+        ({"id": "int64", "text": "string"}, 2),
+        ({"id": "int64"}, 1),
+    ]
+    assert profile["rows histogram"] == {"<= 64": 1, "<= 128": 1, "<= 512": 1}
+    assert sum(profile["file size histogram MB"].values()) == 4
+
+
+def test_profile_missing_file():
+    """
+    Testing that a file removed after listing is counted as failed
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        _populate(folder)
+        d_a = DataAccessLocal()
+        files, profile, retries = d_a.get_files_folder(
+            path=folder, files_to_use=[".parquet"], cm_files=-1
+        )
+        files.append({"name": os.path.join(folder, "removed.parquet"), "size": 100})
+        with patch.object(
+            d_a, "get_files_folder", return_value=(files, profile, retries)
+        ):
+            profile, _ = ParquetProfiler(data_access=d_a, workers=2).profile(
+                path=folder
+            )
+    assert profile["files"] == 5
+    assert profile["profiled files"] == 3
+    assert profile["failed files"] == 2
+
+
+def test_profile_sample():
+    """
+    Testing profile of randomly chosen files and the command line entry point
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        _populate(folder)
+        os.remove(os.path.join(folder, "d.parquet"))
+        output = os.path.join(folder, "profile.json")
+        profile = main(
+            [
+                "--data_local_config",
+                f"{{'input_folder': '{folder}', 'output_folder': '{folder}'}}",
+                "--profile_files",
+                "2",
+                "--profile_output",
+                output,
+            ]
+        )
+        with open(output) as f:
+            assert json.load(f) == profile
+    assert profile["files"] == 3
+    assert profile["profiled files"] == 2
+    assert profile["estimated rows"] == profile["rows"] * 3 / 2
@@ -18,6 +18,29 @@ class TestPythonNOOPTransform(AbstractTransformLauncherTest):
         basedir = compute_data_location("test-data/noop")
         launcher = PythonTransformLauncher(NOOPPythonTransformConfiguration())
         fixtures = [
-            (launcher, {"noop_sleep_sec": 0}, basedir + "/input", basedir + "/expected")
+            (
+                launcher,
+                {"noop_sleep_sec": 0},
+                basedir + "/input",
+                basedir + "/expected",
+            ),
+            (
+                launcher,
+                {"noop_sleep_sec": 0, "data_streaming_listing": True},
+                basedir + "/input",
+                basedir + "/expected",
+            ),
+            (
+                launcher,
+                {"noop_sleep_sec": 0, "runtime_prefetch_depth": 2},
+                basedir + "/input",
+                basedir + "/expected",
+            ),
+            (
+                launcher,
+                {"noop_sleep_sec": 0, "data_memory_map": True},
+                basedir + "/input",
+                basedir + "/expected",
+            ),
         ]
         return fixtures
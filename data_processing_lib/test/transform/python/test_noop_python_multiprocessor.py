@@ -26,4 +26,29 @@ class TestPythonNOOPTransform(AbstractTransformLauncherTest):
                 basedir + "/expected",
             )
         )
+        fixtures.append(
+            (
+                launcher,
+                {
+                    "noop_sleep_sec": 0,
+                    "runtime_num_processors": 2,
+                    "data_streaming_listing": True,
+                },
+                basedir + "/input",
+                basedir + "/expected",
+            )
+        )
+        fixtures.append(
+            (
+                launcher,
+                {
+                    "noop_sleep_sec": 0,
+                    "runtime_num_processors": 2,
+                    "runtime_prefetch_depth": 2,
+                    "runtime_write_workers": 2,
+                },
+                basedir + "/input",
+                basedir + "/expected",
+            )
+        )
         return fixtures
@@ -0,0 +1,144 @@
+import os
+import tempfile
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from data_processing.data_access import DataAccessFactory
+from data_processing.runtime.python.transform_file_processor import (
+    PythonTransformFileProcessor,
+)
+from data_processing.transform import (
+    AbstractStreamingTableTransform,
+    AbstractTableTransform,
+    TransformStatistics,
+)
+from data_processing.utils import TransformUtils
+
+
+class _CopyTransform(AbstractTableTransform):
+    """
+    Transform returning its input table
+    """
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        return [table], {}
+
+
+class _StreamingCopyTransform(AbstractStreamingTableTransform):
+    """
+    Streaming transform returning its input batches
+    """
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        return [table], {}
+
+
+def _create_factory(folder: str, params: dict[str, Any]) -> DataAccessFactory:
+    daf = DataAccessFactory()
+    assert daf.apply_input_params(
+        {
+            "data_local_config": {
+                "input_folder": os.path.join(folder, "input"),
+                "output_folder": os.path.join(folder, "output"),
+            }
+        }
+        | params
+    )
+    return daf
+
+
+def test_write_options():
+    """
+    Testing parquet writer profiles and options of the data access factory
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        daf = _create_factory(folder=folder, params={})
+        assert daf.get_parquet_write_options() == {"compression": "zstd"}
+        daf = _create_factory(
+            folder=folder,
+            params={
+                "data_parquet_profile": "compact",
+                "data_parquet_options": {"compression_level": 5},
+            },
+        )
+        assert daf.get_parquet_write_options() == {
+            "compression": "zstd",
+            "compression_level": 5,
+            "write_page_index": True,
+        }
+        assert daf.get_input_params()["parquet_profile"] == "compact"
+        # invalid profile and options are rejected
+        for params in [
+            {"data_parquet_profile": "unknown"},
+            {"data_parquet_options": {"compression": "unknown"}},
+            {"data_parquet_options": {"unknown": 1}},
+            {"data_parquet_options": {"row_group_size": 0}},
+        ]:
+            daf = DataAccessFactory()
+            assert not daf.apply_input_params(
+                {"data_local_config": {"input_folder": folder}} | params
+            )
+
+
+def test_processor_profile():
+    """
+    Testing that output tables are written using the parquet profile of the output data access factory
+    """
+    table = pa.table(
+        {"id": list(range(1000)), "text": [f"doc {i}" for i in range(1000)]}
+    )
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        os.makedirs(input_folder)
+        f_name = os.path.join(input_folder, "sample.parquet")
+        pq.write_table(table, f_name)
+        for profile, compression in [("default", "ZSTD"), ("fast", "SNAPPY")]:
+            daf = _create_factory(
+                folder=folder, params={"data_parquet_profile": profile}
+            )
+            for transform_class in [_CopyTransform, _StreamingCopyTransform]:
+                processor = PythonTransformFileProcessor(
+                    data_access_factory=[daf, daf],
+                    statistics=TransformStatistics(),
+                    transform_params={},
+                    transform_class=transform_class,
+                    is_folder=False,
+                    streaming_threshold=0 if transform_class == _CopyTransform else 1,
+                )
+                processor.process_files([f_name])
+                metadata = pq.read_metadata(
+                    os.path.join(folder, "output", "sample.parquet")
+                )
+                assert metadata.num_rows == 1000
+                assert metadata.row_group(0).column(0).compression == compression
+        # row group size
+        daf = _create_factory(
+            folder=folder, params={"data_parquet_options": {"row_group_size": 300}}
+        )
+        for transform_class in [_CopyTransform, _StreamingCopyTransform]:
+            processor = PythonTransformFileProcessor(
+                data_access_factory=[daf, daf],
+                statistics=TransformStatistics(),
+                transform_params={},
+                transform_class=transform_class,
+                is_folder=False,
+                streaming_threshold=0 if transform_class == _CopyTransform else 1,
+            )
+            processor.process_files([f_name])
+            metadata = pq.read_metadata(
+                os.path.join(folder, "output", "sample.parquet")
+            )
+            assert [
+                metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+            ] == [300, 300, 300, 100]
+    # page index of compact profile
+    data = TransformUtils.convert_arrow_to_binary(
+        table=table, write_options=TransformUtils.get_parquet_write_options("compact")
+    )
+    metadata = pq.read_metadata(pa.BufferReader(data))
+    assert metadata.row_group(0).column(0).has_offset_index
@@ -0,0 +1,116 @@
+from typing import Any
+from unittest.mock import patch
+
+import pyarrow as pa
+from data_processing.data_access import DataAccessFactory
+from data_processing.runtime.python import PythonTransformRuntimeConfiguration
+from data_processing.transform import (
+    AbstractBinaryTransform,
+    AbstractTableTransform,
+    TransformConfiguration,
+    TransformStatistics,
+)
+from data_processing.transform.python import PythonPipelineTransform
+from data_processing.utils import TransformUtils
+
+
+class _TableTransform(AbstractTableTransform):
+    """
+    Table transform recording the tables it received
+    """
+
+    tables = []
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        _TableTransform.tables.append(table)
+        return [table], {}
+
+
+class _BinaryTransform(AbstractBinaryTransform):
+    """
+    Binary transform, copying its input
+    """
+
+    def transform_binary(
+        self, file_name: str, byte_array: bytes
+    ) -> tuple[list[tuple[bytes, str]], dict[str, Any]]:
+        return [(byte_array, ".parquet")], {}
+
+
+def _configuration(
+    name: str, clazz: type[AbstractBinaryTransform]
+) -> PythonTransformRuntimeConfiguration:
+    return PythonTransformRuntimeConfiguration(
+        transform_config=TransformConfiguration(name=name, transform_class=clazz)
+    )
+
+
+def _run_pipeline(transforms: list) -> tuple[list[tuple[bytes, str]], int, int]:
+    pipeline = PythonPipelineTransform(
+        {
+            "transforms": transforms,
+            "data_access_factory": DataAccessFactory(),
+            "statistics": TransformStatistics(),
+        }
+    )
+    table = pa.table({"a": [1, 2, 3]})
+    data = TransformUtils.convert_arrow_to_binary(table=table)
+    _TableTransform.tables = []
+    with (
+        patch.object(
+            TransformUtils,
+            "convert_binary_to_arrow",
+            wraps=TransformUtils.convert_binary_to_arrow,
+        ) as decode,
+        patch.object(
+            TransformUtils,
+            "convert_arrow_to_binary",
+            wraps=TransformUtils.convert_arrow_to_binary,
+        ) as encode,
+    ):
+        out_files, _ = pipeline.transform_binary(
+            file_name="test.parquet", byte_array=data
+        )
+    for out_file in out_files:
+        assert out_file[1] == ".parquet"
+        assert TransformUtils.convert_binary_to_arrow(data=out_file[0]).equals(table)
+    return out_files, decode.call_count, encode.call_count
+
+
+def test_table_hand_off():
+    """
+    Testing that table transforms exchange tables, which are encoded only at the pipeline boundary
+    """
+    out_files, decodes, encodes = _run_pipeline(
+        [
+            [_configuration("t1", _TableTransform)],
+            [
+                _configuration("t2", _TableTransform),
+                _configuration("t3", _TableTransform),
+            ],
+        ]
+    )
+    assert len(out_files) == 2
+    assert decodes == 1
+    assert encodes == 2
+    # fork shares the table produced by the first transform
+    assert len(_TableTransform.tables) == 3
+    assert _TableTransform.tables[1] is _TableTransform.tables[2]
+
+
+def test_binary_transform_in_pipeline():
+    """
+    Testing that tables are encoded for binary transforms
+    """
+    out_files, decodes, encodes = _run_pipeline(
+        [
+            [_configuration("t1", _TableTransform)],
+            [_configuration("b1", _BinaryTransform)],
+            [_configuration("t2", _TableTransform)],
+        ]
+    )
+    assert len(out_files) == 1
+    assert decodes == 2
+    assert encodes == 2
@@ -0,0 +1,53 @@
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+
+from data_processing.data_access import DataAccessLocal, compute_data_location
+from data_processing.examples.noop.python import NOOPPythonTransformConfiguration
+from data_processing.runtime.python import PythonTransformLauncher
+from data_processing.utils import ParamsUtils
+
+
+def test_pool_flush_once_per_worker():
+    """
+    Testing that pool workers keep their processor between tasks and flush writes once, at the end
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        os.makedirs(input_folder)
+        for i in range(6):
+            shutil.copyfile(
+                compute_data_location("test-data/input/sample1.parquet"),
+                os.path.join(input_folder, f"sample{i}.parquet"),
+            )
+        flushes = os.path.join(folder, "flushes")
+
+        def _flush_files(self) -> tuple[int, int]:
+            # invoked in the pool workers (forked), so the invocations are recorded in a file
+            with open(flushes, "a") as f:
+                f.write(f"{os.getpid()}\n")
+            return 0, 0
+
+        params = {
+            "data_local_config": ParamsUtils.convert_to_ast(
+                {
+                    "input_folder": input_folder,
+                    "output_folder": os.path.join(folder, "output"),
+                }
+            ),
+            "noop_sleep_sec": 0,
+            "runtime_num_processors": 2,
+        }
+        sys.argv = ParamsUtils.dict_to_req(d=params)
+        launcher = PythonTransformLauncher(
+            runtime_config=NOOPPythonTransformConfiguration()
+        )
+        with patch.object(DataAccessLocal, "flush_files", _flush_files):
+            assert launcher.launch() == 0
+        with open(flushes) as f:
+            pids = f.read().split()
+        assert len(pids) == 2
+        assert len(set(pids)) == 2
+        assert len(os.listdir(os.path.join(folder, "output"))) == 6 + 1
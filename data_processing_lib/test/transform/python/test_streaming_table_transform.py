@@ -0,0 +1,195 @@
+import os
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from data_processing.data_access import DataAccessFactory, DataAccessLocal
+from data_processing.runtime.python.transform_file_processor import (
+    PythonTransformFileProcessor,
+)
+from data_processing.transform import (
+    AbstractStreamingTableTransform,
+    TransformStatistics,
+)
+from data_processing.utils import TransformUtils
+
+
+class _FilterTransform(AbstractStreamingTableTransform):
+    """
+    Streaming transform, keeping even ids
+    """
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        return [table.filter(pc.equal(pc.bit_wise_and(table["id"], 1), 0))], {
+            "batches": 1
+        }
+
+
+def _write_input(folder: str, rows: int) -> pa.Table:
+    table = pa.table(
+        {"id": list(range(rows)), "text": [f"doc {i}" for i in range(rows)]}
+    )
+    pq.write_table(table, os.path.join(folder, "sample.parquet"), row_group_size=256)
+    return table
+
+
+def _batch_bytes(f_name: str, rows: int) -> int:
+    # size of the decoded data of rows, as estimated from the parquet metadata
+    metadata = pq.read_metadata(f_name)
+    size = sum(
+        metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups)
+    )
+    return -(-size * rows // metadata.num_rows)
+
+
+def test_transform_file():
+    """
+    Testing batch by batch processing produces the same result as the whole file processing
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        _write_input(folder=folder, rows=1000)
+        f_name = os.path.join(folder, "sample.parquet")
+        transform = _FilterTransform({})
+        with pa.OSFile(f_name, "r") as source:
+            out_files, stats = transform.transform_stream(
+                file_name=f_name,
+                source=source,
+                batch_bytes=_batch_bytes(f_name=f_name, rows=100),
+            )
+        with open(f_name, "rb") as f:
+            expected_files, _ = transform.transform_binary(
+                file_name=f_name, byte_array=f.read()
+            )
+    assert len(out_files) == 1
+    assert TransformUtils.convert_binary_to_arrow(data=out_files[0][0]).equals(
+        TransformUtils.convert_binary_to_arrow(data=expected_files[0][0])
+    )
+    assert stats == {"batches": 10, "source_doc_count": 1000, "result_doc_count": 500}
+
+
+def test_batch_bytes():
+    """
+    Testing that the batch size follows the memory budget
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        _write_input(folder=folder, rows=1000)
+        f_name = os.path.join(folder, "sample.parquet")
+        transform = _FilterTransform({})
+        for batch_bytes, batches in [
+            (_batch_bytes(f_name=f_name, rows=250), 4),
+            (1, 1000),
+            (10 * _batch_bytes(f_name=f_name, rows=1000), 1),
+        ]:
+            with pa.OSFile(f_name, "r") as source:
+                _, stats = transform.transform_stream(
+                    file_name=f_name, source=source, batch_bytes=batch_bytes
+                )
+            assert stats["batches"] == batches
+
+
+def test_streaming_threshold():
+    """
+    Testing that the file processor streams only files larger than the threshold
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(input_folder)
+        table = _write_input(folder=input_folder, rows=1000)
+        f_name = os.path.join(input_folder, "sample.parquet")
+        daf = DataAccessFactory()
+        daf.apply_input_params(
+            {
+                "data_local_config": {
+                    "input_folder": input_folder,
+                    "output_folder": output_folder,
+                }
+            }
+        )
+        for threshold, batches in [(os.path.getsize(f_name) - 1, 10), (0, 1)]:
+            statistics = TransformStatistics()
+            processor = PythonTransformFileProcessor(
+                data_access_factory=[daf, daf],
+                statistics=statistics,
+                transform_params={},
+                transform_class=_FilterTransform,
+                is_folder=False,
+                streaming_threshold=threshold,
+                streaming_batch_bytes=_batch_bytes(f_name=f_name, rows=100),
+            )
+            processor.process_files([f_name])
+            stats = statistics.get_execution_stats()
+            assert stats["batches"] == batches
+            assert stats["source_size"] == os.path.getsize(f_name)
+            result = pq.read_table(os.path.join(output_folder, "sample.parquet"))
+            assert result.num_rows == table.num_rows // 2
+
+
+class _FailingTransform(_FilterTransform):
+    """
+    Streaming transform failing after the first batch
+    """
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        if table["id"][0].as_py() > 0:
+            raise ValueError("failed batch")
+        return super().transform(table=table, file_name=file_name)
+
+
+def test_streamed_output():
+    """
+    Testing that the result of a streamed file is written to the output stream as it is produced
+    and that a failed file is not written
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(input_folder)
+        table = _write_input(folder=input_folder, rows=1000)
+        f_name = os.path.join(input_folder, "sample.parquet")
+        daf = DataAccessFactory()
+        daf.apply_input_params(
+            {
+                "data_local_config": {
+                    "input_folder": input_folder,
+                    "output_folder": output_folder,
+                }
+            }
+        )
+        for transform_class, result_files in [
+            (_FilterTransform, 1),
+            (_FailingTransform, 0),
+        ]:
+            statistics = TransformStatistics()
+            processor = PythonTransformFileProcessor(
+                data_access_factory=[daf, daf],
+                statistics=statistics,
+                transform_params={},
+                transform_class=transform_class,
+                is_folder=False,
+                streaming_threshold=1,
+                streaming_batch_bytes=_batch_bytes(f_name=f_name, rows=100),
+            )
+            with patch.object(DataAccessLocal, "save_file") as save_file:
+                processor.process_files([f_name])
+                processor.flush()
+            # the result is not saved as a whole
+            save_file.assert_not_called()
+            stats = statistics.get_execution_stats()
+            assert stats.get("result_files", 0) == result_files
+            if result_files == 0:
+                assert stats["transform execution exception"] == 1
+                # partially written file is discarded
+                assert os.listdir(output_folder) == []
+                continue
+            output = os.path.join(output_folder, "sample.parquet")
+            assert stats["result_size"] == os.path.getsize(output)
+            assert pq.read_table(output).num_rows == table.num_rows // 2
+            os.remove(output)
@@ -0,0 +1,171 @@
+import os
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from data_processing.data_access import DataAccessFactory, DataAccessLocal
+from data_processing.runtime.python.transform_file_processor import (
+    PythonTransformFileProcessor,
+)
+from data_processing.transform import (
+    AbstractStreamingTableTransform,
+    AbstractTableTransform,
+    TransformStatistics,
+)
+
+
+class _FilterTransform(AbstractStreamingTableTransform):
+    """
+    Transform keeping documents with id above the configured minimum
+    """
+
+    tables = []
+
+    def get_filter(self) -> pc.Expression:
+        return pc.field("id") >= self.config.get("min_id", 0)
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        _FilterTransform.tables.append(table)
+        return [table.filter(self.get_filter())], {}
+
+
+def _write_input(f_name: str) -> None:
+    table = pa.table(
+        {"id": list(range(1000)), "text": [f"doc {i}" for i in range(1000)]}
+    )
+    pq.write_table(table, f_name, row_group_size=100)
+
+
+def _transform(f_name: str, min_id: int, stream: bool) -> tuple[list, dict[str, Any]]:
+    _FilterTransform.tables = []
+    transform = _FilterTransform({"min_id": min_id})
+    if stream:
+        with pa.OSFile(f_name, "r") as source:
+            return transform.transform_stream(file_name=f_name, source=source)
+    with open(f_name, "rb") as f:
+        return transform.transform_binary(file_name=f_name, byte_array=f.read())
+
+
+def test_row_group_skipping():
+    """
+    Testing that row groups not matching the filter are not passed to transform
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        f_name = os.path.join(folder, "sample.parquet")
+        _write_input(f_name)
+        for stream in [False, True]:
+            out_files, stats = _transform(f_name=f_name, min_id=850, stream=stream)
+            assert sum(table.num_rows for table in _FilterTransform.tables) == 200
+            result = pq.read_table(pa.BufferReader(out_files[0][0]))
+            assert result["id"].to_pylist() == list(range(850, 1000))
+            assert stats["filter skipped row groups"] == 8
+            assert stats["filter skipped bytes"] > 0
+            assert stats["source_doc_count"] == 1000
+            assert stats["result_doc_count"] == 150
+            # no row group matches, the file is skipped
+            out_files, stats = _transform(f_name=f_name, min_id=5000, stream=stream)
+            assert out_files == []
+            assert len(_FilterTransform.tables) == 0
+            assert stats["filter skipped files"] == 1
+            assert stats["filter skipped row groups"] == 10
+            # all row groups match, nothing is reported
+            _, stats = _transform(f_name=f_name, min_id=0, stream=stream)
+            assert "filter skipped row groups" not in stats
+
+
+def test_processor_filter():
+    """
+    Testing that the file processor uses the filter for the whole file processing
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(input_folder)
+        f_name = os.path.join(input_folder, "sample.parquet")
+        _write_input(f_name)
+        daf = DataAccessFactory()
+        daf.apply_input_params(
+            {
+                "data_local_config": {
+                    "input_folder": input_folder,
+                    "output_folder": output_folder,
+                }
+            }
+        )
+        statistics = TransformStatistics()
+        processor = PythonTransformFileProcessor(
+            data_access_factory=[daf, daf],
+            statistics=statistics,
+            transform_params={"min_id": 950},
+            transform_class=_FilterTransform,
+            is_folder=False,
+        )
+        processor.process_files([f_name])
+        stats = statistics.get_execution_stats()
+        assert stats["filter skipped row groups"] == 9
+        assert "transform execution exception" not in stats
+        result = pq.read_table(os.path.join(output_folder, "sample.parquet"))
+        assert result["id"].to_pylist() == list(range(950, 1000))
+
+
+class _TableFilterTransform(AbstractTableTransform):
+    """
+    Not streaming transform keeping documents with id above the configured minimum
+    """
+
+    def get_filter(self) -> pc.Expression:
+        return pc.field("id") >= self.config.get("min_id", 0)
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        return [table.filter(self.get_filter())], {}
+
+
+def test_processor_filter_prefetch():
+    """
+    Testing that all files are processed, when prefetching is enabled for a filtering transform
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(input_folder)
+        f_names = [os.path.join(input_folder, f"sample{i}.parquet") for i in range(5)]
+        for f_name in f_names:
+            _write_input(f_name)
+        daf = DataAccessFactory()
+        daf.apply_input_params(
+            {
+                "data_local_config": {
+                    "input_folder": input_folder,
+                    "output_folder": output_folder,
+                }
+            }
+        )
+        statistics = TransformStatistics()
+        processor = PythonTransformFileProcessor(
+            data_access_factory=[daf, daf],
+            statistics=statistics,
+            transform_params={"min_id": 950},
+            transform_class=_TableFilterTransform,
+            is_folder=False,
+            prefetch_depth=2,
+        )
+        # files are opened, not prefetched
+        with patch.object(
+            DataAccessLocal, "get_file", side_effect=AssertionError("get_file")
+        ):
+            processor.process_files(iter(f_names))
+        stats = statistics.get_execution_stats()
+        assert stats["source_files"] == len(f_names)
+        assert stats["filter skipped row groups"] == 9 * len(f_names)
+        for f_name in f_names:
+            result = pq.read_table(
+                os.path.join(output_folder, os.path.basename(f_name))
+            )
+            assert result["id"].to_pylist() == list(range(950, 1000))
@@ -0,0 +1,173 @@
+import os
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from data_processing.data_access import DataAccessFactory, DataAccessLocal
+from data_processing.runtime.python.transform_file_processor import (
+    PythonTransformFileProcessor,
+)
+from data_processing.transform import AbstractTableTransform, TransformStatistics
+from data_processing.utils import TransformUtils
+
+
+table = pa.table(
+    {
+        "id": [1, 2, 3, 4],
+        "text": ["a", "b", "c", "d"],
+        "score": [0.1, 0.2, 0.3, 0.4],
+    }
+)
+
+
+class _AnnotateTransform(AbstractTableTransform):
+    """
+    Transform adding a column based on id
+    """
+
+    columns = []
+
+    def get_read_columns(self) -> list[str]:
+        return ["id"]
+
+    def get_pass_through_columns(self) -> list[str]:
+        return self.config.get("pass_through", None)
+
+    def transform(
+        self, table: pa.Table, file_name: str = None
+    ) -> tuple[list[pa.Table], dict[str, Any]]:
+        _AnnotateTransform.columns.append(table.schema.names)
+        if self.config.get("filter", False):
+            table = table.filter(pc.greater(table["id"], 2))
+        even = pc.equal(pc.bit_wise_and(table["id"], 1), 0)
+        return [table.append_column("even", even)], {}
+
+
+def _transform(config: dict[str, Any]) -> tuple[pa.Table, dict[str, Any]]:
+    _AnnotateTransform.columns = []
+    out_files, stats = _AnnotateTransform(config).transform_binary(
+        file_name="test.parquet",
+        byte_array=TransformUtils.convert_arrow_to_binary(table=table),
+    )
+    assert _AnnotateTransform.columns == [["id"]]
+    if len(out_files) == 0:
+        return None, stats
+    return TransformUtils.convert_binary_to_arrow(data=out_files[0][0]), stats
+
+
+def test_pass_through():
+    """
+    Testing that only read columns are passed to transform and pass through columns are restored
+    """
+    result, stats = _transform({})
+    assert result.schema.names == ["id", "text", "score", "even"]
+    assert result.drop_columns(["even"]).equals(table)
+    assert result["even"].to_pylist() == [False, True, False, True]
+    assert stats == {"source_doc_count": 4, "result_doc_count": 4}
+    # the same in the table based path, used by pipelines
+    _AnnotateTransform.columns = []
+    out_tables, _ = _AnnotateTransform({}).transform_tables(
+        file_name="test.parquet", table=table
+    )
+    assert _AnnotateTransform.columns == [["id"]]
+    assert out_tables[0].equals(result)
+
+
+def test_projection():
+    """
+    Testing projection with explicit pass through columns
+    """
+    result, _ = _transform({"pass_through": ["score"]})
+    assert result.schema.names == ["id", "score", "even"]
+    # without pass through columns transform can change rows
+    result, _ = _transform({"pass_through": [], "filter": True})
+    assert result.schema.names == ["id", "even"]
+    assert result["id"].to_pylist() == [3, 4]
+    # with pass through columns it can not
+    result, stats = _transform({"filter": True})
+    assert result is None
+    assert stats == {"pass through columns mismatch": 1}
+
+
+def test_processor_projection():
+    """
+    Testing that the file processor reads only the required columns from file
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(input_folder)
+        f_name = os.path.join(input_folder, "sample.parquet")
+        pq.write_table(table, f_name)
+        daf = DataAccessFactory()
+        daf.apply_input_params(
+            {
+                "data_local_config": {
+                    "input_folder": input_folder,
+                    "output_folder": output_folder,
+                }
+            }
+        )
+        statistics = TransformStatistics()
+        processor = PythonTransformFileProcessor(
+            data_access_factory=[daf, daf],
+            statistics=statistics,
+            transform_params={},
+            transform_class=_AnnotateTransform,
+            is_folder=False,
+        )
+        _AnnotateTransform.columns = []
+        # file is read by transform_file, without loading it whole
+        with patch.object(
+            DataAccessLocal, "get_file", side_effect=AssertionError("get_file")
+        ):
+            processor.process_files([f_name])
+        assert _AnnotateTransform.columns == [["id"]]
+        stats = statistics.get_execution_stats()
+        assert stats["source_size"] == os.path.getsize(f_name)
+        assert "transform execution exception" not in stats
+        result = pq.read_table(os.path.join(output_folder, "sample.parquet"))
+        assert result.schema.names == ["id", "text", "score", "even"]
+
+
+def test_processor_projection_prefetch():
+    """
+    Testing that all files are processed, when prefetching is enabled for a projecting transform
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        input_folder = os.path.join(folder, "input")
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(input_folder)
+        f_names = [os.path.join(input_folder, f"sample{i}.parquet") for i in range(5)]
+        for f_name in f_names:
+            pq.write_table(table, f_name)
+        daf = DataAccessFactory()
+        daf.apply_input_params(
+            {
+                "data_local_config": {
+                    "input_folder": input_folder,
+                    "output_folder": output_folder,
+                }
+            }
+        )
+        statistics = TransformStatistics()
+        processor = PythonTransformFileProcessor(
+            data_access_factory=[daf, daf],
+            statistics=statistics,
+            transform_params={},
+            transform_class=_AnnotateTransform,
+            is_folder=False,
+            prefetch_depth=2,
+        )
+        # files are opened, not prefetched
+        with patch.object(
+            DataAccessLocal, "get_file", side_effect=AssertionError("get_file")
+        ):
+            processor.process_files(iter(f_names))
+        assert statistics.get_execution_stats()["source_files"] == len(f_names)
+        assert sorted(os.listdir(output_folder)) == [
+            os.path.basename(f_name) for f_name in f_names
+        ]
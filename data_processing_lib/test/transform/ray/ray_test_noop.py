@@ -21,6 +21,26 @@ class TestRayNOOPTransform(AbstractTransformLauncherTest):
                 {"noop_sleep_sec": 0, "run_locally": True},
                 basedir + "/input",
                 basedir + "/expected",
-            )
+            ),
+            (
+                launcher,
+                {
+                    "noop_sleep_sec": 0,
+                    "run_locally": True,
+                    "data_streaming_listing": True,
+                },
+                basedir + "/input",
+                basedir + "/expected",
+            ),
+            (
+                launcher,
+                {
+                    "noop_sleep_sec": 0,
+                    "run_locally": True,
+                    "runtime_prefetch_depth": 2,
+                },
+                basedir + "/input",
+                basedir + "/expected",
+            ),
         ]
         return fixtures
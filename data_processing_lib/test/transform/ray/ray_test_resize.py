@@ -49,4 +49,13 @@ class TestRayResizeTransform(AbstractTransformLauncherTest):
             (launcher, config, basedir + "/input", basedir + "/expected-mbytes-0.02")
         )
 
+        # Split into 4 or so files, writing them in the background
+        config = {
+            "resize_max_rows_per_table": 125,
+            "runtime_write_workers": 4,
+        } | common_config
+        fixtures.append(
+            (launcher, config, basedir + "/input", basedir + "/expected-rows-125")
+        )
+
         return fixtures
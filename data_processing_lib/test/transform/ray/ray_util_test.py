@@ -1,8 +1,12 @@
+import logging
+
 import pyarrow as pa
 import pytest
 import ray
 from data_processing.utils import GB, TransformUtils
 from data_processing.runtime.ray import RayUtils, TransformStatisticsRay
+from ray.exceptions import RayTaskError
+from ray.util.actor_pool import ActorPool
 
 
 params = {}
@@ -102,3 +106,73 @@ def test_actor_creation():
     assert 1 == res["memory"] - res1["memory"]
 
     ray.shutdown()
+
+
+@ray.remote
+class _BatchProcessor:
+    def process_files(self, f_names: list[str]) -> int:
+        if "fail" in f_names:
+            raise ValueError("failed batch")
+        return len(f_names)
+
+
+class _FilesProducer:
+    def __init__(self, files: list[str]):
+        self.files = files
+
+    def next_files(self, n_files: int) -> list[str]:
+        batch, self.files = self.files[:n_files], self.files[n_files:]
+        return batch if len(batch) > 0 else None
+
+
+class _Gauge:
+    def __init__(self):
+        self.value = None
+
+    def set(self, value: int) -> None:
+        self.value = value
+
+
+class _FailingPool(ActorPool):
+    """
+    Actor pool reporting task failures as non Ray exceptions, that are counted as actor failures
+    """
+
+    def get_next_unordered(self, *args, **kwargs):
+        try:
+            return super().get_next_unordered(*args, **kwargs)
+        except RayTaskError as e:
+            raise RuntimeError(f"{e}")
+
+
+def test_process_batches():
+    ray.init(num_cpus=1)
+    try:
+        for files, failures in [
+            ([f"file{i}" for i in range(11)], 0),
+            # the failed batch is accounted by its number of files
+            (
+                [f"file{i}" for i in range(7)]
+                + ["fail"]
+                + [f"file{i}" for i in range(3)],
+                1,
+            ),
+        ]:
+            completed = _Gauge()
+            res = RayUtils.process_files(
+                executors=_FailingPool([_BatchProcessor.remote() for _ in range(2)]),
+                file_producer=_FilesProducer(files=files),
+                print_interval=1,
+                files_in_progress_gauge=_Gauge(),
+                files_completed_gauge=completed,
+                available_cpus_gauge=_Gauge(),
+                available_gpus_gauge=_Gauge(),
+                available_memory_gauge=_Gauge(),
+                object_memory_gauge=_Gauge(),
+                logger=logging.getLogger(__name__),
+                batch_size=3,
+            )
+            assert res == failures
+            assert completed.value == 11
+    finally:
+        ray.shutdown()